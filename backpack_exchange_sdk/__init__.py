@@ -18,19 +18,70 @@ Example usage:
     >>> account = client.get_account()
 """
 
+from backpack_exchange_sdk._base.clock import ClockSync
+from backpack_exchange_sdk._base.codec import get_codec, set_codec
+from backpack_exchange_sdk._base.hooks import LatencyRecorder, OpenTelemetryHook, RequestContext, RequestHook
+from backpack_exchange_sdk._base.ratelimit import RateLimiter, TokenBucket
+from backpack_exchange_sdk.account_state import AccountState
 from backpack_exchange_sdk.authenticated import AuthenticationClient
+from backpack_exchange_sdk.catalog import MarketCatalog, MarketFilters
+from backpack_exchange_sdk.dispatch import Dispatcher
+from backpack_exchange_sdk.models import Depth, Fill, OpenOrder, Ticker, Trade
+from backpack_exchange_sdk.order_tracker import OrderTracker
+from backpack_exchange_sdk.orderbook import OrderBook
 from backpack_exchange_sdk.public import PublicClient
+from backpack_exchange_sdk.recording import Recorder, Replayer
 
 # WebSocket client for real-time data
 try:
-    from backpack_exchange_sdk.websocket import WebSocketClient
+    from backpack_exchange_sdk.websocket import ShardedWebSocketClient, WebSocketClient
 except ImportError:
     WebSocketClient = None  # websocket-client may not be installed
+    ShardedWebSocketClient = None
+
+# Asyncio clients
+try:
+    from backpack_exchange_sdk.async_authenticated import AsyncAuthenticationClient
+    from backpack_exchange_sdk.async_public import AsyncPublicClient
+except ImportError:
+    AsyncAuthenticationClient = None  # aiohttp may not be installed
+    AsyncPublicClient = None
+
+try:
+    from backpack_exchange_sdk.async_websocket import AsyncWebSocketClient
+except ImportError:
+    AsyncWebSocketClient = None  # aiohttp may not be installed
 
 __version__ = "1.1.4"
 __all__ = [
     "AuthenticationClient",
     "PublicClient",
     "WebSocketClient",
+    "ShardedWebSocketClient",
+    "AsyncAuthenticationClient",
+    "AsyncPublicClient",
+    "AsyncWebSocketClient",
+    "ClockSync",
+    "Dispatcher",
+    "MarketCatalog",
+    "MarketFilters",
+    "OrderBook",
+    "OrderTracker",
+    "AccountState",
+    "Depth",
+    "Fill",
+    "OpenOrder",
+    "Ticker",
+    "Trade",
+    "Recorder",
+    "Replayer",
+    "RequestHook",
+    "RequestContext",
+    "LatencyRecorder",
+    "OpenTelemetryHook",
+    "RateLimiter",
+    "TokenBucket",
+    "get_codec",
+    "set_codec",
     "__version__",
 ]
@@ -0,0 +1,437 @@
+"""
+Asyncio base client classes for Backpack Exchange SDK.
+
+These mirror BaseClient/AuthenticatedBaseClient but perform I/O over a single
+pooled aiohttp session. Because the mixins simply return the result of
+``self._get``/``self._send_request``, the same mixin methods return awaitables
+when combined with these bases.
+"""
+
+import asyncio
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+import aiohttp
+
+from backpack_exchange_sdk._base import codec
+from backpack_exchange_sdk._base.clock import ClockSync
+from backpack_exchange_sdk._base.errors import (
+    BackpackAPIError,
+    BackpackRequestError,
+    get_error_class,
+)
+from backpack_exchange_sdk._base.hooks import HookChain, RequestContext, RequestHook
+from backpack_exchange_sdk._base.pagination import aiter_pages
+from backpack_exchange_sdk._base.ratelimit import RateLimiter
+from backpack_exchange_sdk._base.singleflight import AsyncSingleFlight, request_key
+from backpack_exchange_sdk._base.utils import Signer, load_private_key, merge_batch_results
+from backpack_exchange_sdk.recording import Recorder
+
+
+class AsyncBaseClient:
+    """
+    Asyncio base client with common HTTP functionality.
+
+    Provides a lazily created, pooled aiohttp session, retry handling and
+    response parsing. Use ``async with`` or call ``close()`` when done.
+    """
+
+    DEFAULT_BASE_URL = "https://api.backpack.exchange/"
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: Optional[float] = None,
+        max_retries: int = 0,
+        backoff_factor: float = 0.1,
+        status_forcelist: Optional[List[int]] = None,
+        pool_size: int = 100,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce_requests: bool = False,
+        recorder: Optional[Recorder] = None,
+        hooks: Optional[List[RequestHook]] = None,
+    ):
+        """
+        Initialize the async base client.
+
+        Args:
+            base_url: Optional custom base URL for the API
+            timeout: Optional request timeout in seconds
+            max_retries: Number of retries for transient errors (default 0)
+            backoff_factor: Backoff factor between retries
+            status_forcelist: HTTP status codes that trigger retries
+            pool_size: Maximum number of pooled connections (default 100)
+            rate_limiter: Optional client-side rate limiter consulted before each request
+            coalesce_requests: Share one in-flight request among concurrent identical GETs
+            recorder: Optional Recorder capturing every response body
+            hooks: Optional request hooks (see backpack_exchange_sdk._base.hooks)
+        """
+        self.base_url = base_url or self.DEFAULT_BASE_URL
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.status_forcelist = set(status_forcelist or [429, 500, 502, 503, 504])
+        self.pool_size = pool_size
+        self.rate_limiter = rate_limiter
+        self.single_flight = AsyncSingleFlight() if coalesce_requests else None
+        self.recorder = recorder
+        self.hooks = HookChain(hooks) if hooks else None
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """The shared aiohttp session, created on first use inside the event loop."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the underlying connection pool."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    @staticmethod
+    def _query_params(params: Optional[Dict]) -> Optional[Dict[str, Any]]:
+        """Normalize query parameters to values aiohttp accepts (booleans as lowercase)."""
+        if not params:
+            return None
+        return {key: str(value).lower() if isinstance(value, bool) else value for key, value in params.items()}
+
+    def _handle_response(self, status_code: int, body: bytes) -> Any:
+        """
+        Parse a response body.
+
+        Args:
+            status_code: HTTP status code
+            body: Raw response body
+
+        Returns:
+            Parsed JSON response or None for 204 responses
+
+        Raises:
+            BackpackAPIError: If the API returns an error response
+        """
+        if 200 <= status_code < 300:
+            if status_code == 204:
+                return None
+            try:
+                return codec.loads(body)
+            except ValueError:
+                return body.decode(errors="replace")
+        else:
+            try:
+                error = codec.loads(body)
+                error_code = error.get("code")
+                error_class = get_error_class(error_code)
+                raise error_class(
+                    code=error_code,
+                    message=error.get("message"),
+                    status_code=status_code,
+                )
+            except (ValueError, AttributeError):
+                raise BackpackAPIError(message=body.decode(errors="replace"), status_code=status_code)
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[bytes] = None,
+        ctx: Optional[RequestContext] = None,
+    ) -> Any:
+        """
+        Perform an HTTP request with retries on transient failures.
+
+        ``ctx`` is the hooks' RequestContext, if the client has hooks.
+
+        Raises:
+            BackpackAPIError: If the API returns an error
+            BackpackRequestError: If the request fails
+        """
+        attempt = 0
+        while True:
+            try:
+                async with self.session.request(method, url, headers=headers, params=params, data=data) as response:
+                    status_code = response.status
+                    body = await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt < self.max_retries:
+                    await asyncio.sleep(self.backoff_factor * (2**attempt))
+                    attempt += 1
+                    continue
+                error = BackpackRequestError(str(e) or type(e).__name__)
+                if ctx is not None:
+                    self.hooks.failed(ctx, error)
+                raise error
+
+            if status_code in self.status_forcelist and attempt < self.max_retries:
+                await asyncio.sleep(self.backoff_factor * (2**attempt))
+                attempt += 1
+                continue
+            if self.recorder is not None:
+                self.recorder.record_response(method, str(response.url), status_code, body)
+            if ctx is None:
+                return self._handle_response(status_code, body)
+            self.hooks.received(ctx, status_code)
+            try:
+                result = self._handle_response(status_code, body)
+            except BackpackAPIError as e:
+                self.hooks.failed(ctx, e)
+                raise
+            self.hooks.finished(ctx, result)
+            return result
+
+    async def _get(self, endpoint: str, params: Optional[Dict] = None) -> Any:
+        """
+        Make a GET request.
+
+        Args:
+            endpoint: API endpoint (relative to base URL)
+            params: Optional query parameters
+
+        Returns:
+            Parsed API response
+
+        Raises:
+            BackpackAPIError: If the API returns an error
+            BackpackRequestError: If the request fails
+        """
+        if self.single_flight is not None:
+            return await self.single_flight.do(request_key(endpoint, params), lambda: self._fetch(endpoint, params))
+        return await self._fetch(endpoint, params)
+
+    async def _fetch(self, endpoint: str, params: Optional[Dict] = None) -> Any:
+        """Send a GET request without coalescing."""
+        url = f"{self.base_url}{endpoint}"
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(endpoint)
+        ctx = None
+        if self.hooks is not None:
+            ctx = self.hooks.start("GET", endpoint, endpoint, params)
+            self.hooks.signed(ctx, None)
+        return await self._request("GET", url, params=self._query_params(params), ctx=ctx)
+
+    async def _decode(self, pending: Awaitable[Any], decode: Callable[[Any], Any]) -> Any:
+        """Await a response and apply ``decode`` to it."""
+        return decode(await pending)
+
+    def _paginate(
+        self,
+        fetch: Callable[..., Any],
+        filters: Dict[str, Any],
+        page_size: int,
+        offset: int = 0,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Any]:
+        """
+        Iterate lazily over every record of a limit/offset method.
+
+        Args:
+            fetch: Client coroutine method accepting ``limit`` and ``offset``
+            filters: Extra keyword arguments for every call
+            page_size: Records requested per page
+            offset: Offset of the first record
+            prefetch: Request the next page while the current one is consumed
+
+        Returns:
+            Async generator of records
+        """
+        return aiter_pages(fetch, filters, page_size, offset, prefetch)
+
+
+class AsyncAuthenticatedBaseClient(AsyncBaseClient):
+    """
+    Asyncio base client with authentication support.
+
+    Provides ED25519 signature generation and authenticated request methods.
+    """
+
+    def __init__(
+        self,
+        public_key: str,
+        secret_key: str,
+        window: int = 5000,
+        base_url: Optional[str] = None,
+        timeout: Optional[float] = None,
+        max_retries: int = 0,
+        backoff_factor: float = 0.1,
+        status_forcelist: Optional[List[int]] = None,
+        pool_size: int = 100,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce_requests: bool = False,
+        clock: Optional[ClockSync] = None,
+        recorder: Optional[Recorder] = None,
+        hooks: Optional[List[RequestHook]] = None,
+    ):
+        """
+        Initialize the async authenticated client.
+
+        Args:
+            public_key: Base64-encoded public key (API key)
+            secret_key: Base64-encoded private key (secret)
+            window: Request validity window in milliseconds (default 5000)
+            base_url: Optional custom base URL for the API
+            timeout: Optional request timeout in seconds
+            max_retries: Number of retries for transient errors (default 0)
+            backoff_factor: Backoff factor between retries
+            status_forcelist: HTTP status codes that trigger retries
+            pool_size: Maximum number of pooled connections (default 100)
+            rate_limiter: Optional client-side rate limiter consulted before each request
+            coalesce_requests: Share one in-flight request among concurrent identical GETs
+            clock: Optional ClockSync used for X-Timestamp instead of the local clock
+            recorder: Optional Recorder capturing every response body
+            hooks: Optional request hooks (see backpack_exchange_sdk._base.hooks)
+        """
+        super().__init__(
+            base_url=base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=status_forcelist,
+            pool_size=pool_size,
+            rate_limiter=rate_limiter,
+            coalesce_requests=coalesce_requests,
+            recorder=recorder,
+            hooks=hooks,
+        )
+        self.key = public_key
+        self.private_key_obj = load_private_key(secret_key)
+        self.signer = Signer(self.private_key_obj)
+        self.window = window
+        self.clock = clock
+
+    def _timestamp(self) -> int:
+        """Request timestamp in epoch milliseconds, corrected by the clock if one is set."""
+        if self.clock is not None:
+            return self.clock.now_ms()
+        return int(time.time() * 1e3)
+
+    def _generate_signature(self, action: str, timestamp: int, params: Optional[Dict] = None) -> Dict[str, str]:
+        """
+        Generate authentication headers for a request.
+
+        Args:
+            action: The API instruction (e.g., 'orderExecute')
+            timestamp: Unix timestamp in milliseconds
+            params: Optional request parameters
+
+        Returns:
+            Dictionary of authentication headers
+        """
+        return self.signer.headers(self.key, action, params, timestamp, self.window)
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        action: str,
+        params: Optional[Dict] = None,
+        extra_headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """
+        Send an authenticated request to the API.
+
+        Args:
+            method: HTTP method (GET, POST, DELETE, PATCH, PUT)
+            endpoint: API endpoint (relative to base URL)
+            action: The API instruction for signing
+            params: Optional request parameters
+            extra_headers: Optional extra headers to include
+
+        Returns:
+            Parsed API response
+
+        Raises:
+            BackpackAPIError: If the API returns an error
+            BackpackRequestError: If the request fails
+        """
+        url = f"{self.base_url}{endpoint}"
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(action)
+        ctx = self.hooks.start(method, endpoint, action, params) if self.hooks is not None else None
+        ts = self._timestamp()
+        headers = self._generate_signature(action, ts, params)
+        if extra_headers:
+            headers.update(extra_headers)
+        if ctx is not None:
+            self.hooks.signed(ctx, headers)
+
+        if method == "GET":
+            return await self._request(method, url, headers=headers, params=self._query_params(params), ctx=ctx)
+        return await self._request(method, url, headers=headers, data=codec.dumps(params) if params else None, ctx=ctx)
+
+    async def _send_batch_request(
+        self,
+        endpoint: str,
+        orders: List[Dict[str, Any]],
+        extra_headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """
+        Send a batch order request with special signature handling.
+
+        Args:
+            endpoint: API endpoint (relative to base URL)
+            orders: List of order parameter dictionaries
+            extra_headers: Optional extra headers to include
+
+        Returns:
+            Parsed API response
+
+        Raises:
+            BackpackAPIError: If the API returns an error
+            BackpackRequestError: If the request fails
+        """
+        url = f"{self.base_url}{endpoint}"
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async("orderExecute")
+        ctx = self.hooks.start("POST", endpoint, "orderExecute", orders) if self.hooks is not None else None
+        ts = self._timestamp()
+        headers = self.signer.batch_headers(self.key, orders, ts, self.window)
+        if extra_headers:
+            headers.update(extra_headers)
+        if ctx is not None:
+            self.hooks.signed(ctx, headers)
+
+        return await self._request("POST", url, headers=headers, data=codec.dumps(orders), ctx=ctx)
+
+    async def _send_batch_requests(
+        self,
+        endpoint: str,
+        batches: List[List[Dict[str, Any]]],
+        extra_headers: Optional[Dict[str, str]] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Sign and send several batch order requests concurrently.
+
+        Args:
+            endpoint: API endpoint (relative to base URL)
+            batches: List of order batches, each sent as one request
+            extra_headers: Optional extra headers to include
+            max_workers: Maximum concurrent requests (default: all at once)
+
+        Returns:
+            Per-order results in submission order (see merge_batch_results)
+        """
+        semaphore = asyncio.Semaphore(max_workers or len(batches) or 1)
+
+        async def send(batch: List[Dict[str, Any]]) -> Any:
+            async with semaphore:
+                try:
+                    return await self._send_batch_request(endpoint, batch, extra_headers=extra_headers)
+                except (BackpackAPIError, BackpackRequestError) as e:
+                    return e
+
+        responses = await asyncio.gather(*(send(batch) for batch in batches))
+        return merge_batch_results(batches, list(responses))
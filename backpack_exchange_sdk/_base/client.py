@@ -2,25 +2,31 @@
 Base client classes for Backpack Exchange SDK.
 """
 
-import json
 import time
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional
 
 import requests
+from cryptography.hazmat.primitives.asymmetric import ed25519
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from cryptography.hazmat.primitives.asymmetric import ed25519
 
+from backpack_exchange_sdk._base import codec
+from backpack_exchange_sdk._base.clock import ClockSync
 from backpack_exchange_sdk._base.errors import (
     BackpackAPIError,
     BackpackRequestError,
     get_error_class,
 )
-from backpack_exchange_sdk._base.utils import (
-    generate_auth_headers,
-    generate_batch_auth_headers,
-    load_private_key,
-)
+from backpack_exchange_sdk._base.hooks import HookChain, RequestContext, RequestHook
+from backpack_exchange_sdk._base.pagination import iter_pages
+from backpack_exchange_sdk._base.ratelimit import RateLimiter
+from backpack_exchange_sdk._base.singleflight import SingleFlight, request_key
+from backpack_exchange_sdk._base.utils import Signer, load_private_key, merge_batch_results
+from backpack_exchange_sdk.recording import Recorder
+
+if TYPE_CHECKING:
+    from backpack_exchange_sdk.catalog import MarketCatalog
 
 
 class BaseClient:
@@ -39,6 +45,10 @@ class BaseClient:
         max_retries: int = 0,
         backoff_factor: float = 0.1,
         status_forcelist: Optional[List[int]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce_requests: bool = False,
+        recorder: Optional[Recorder] = None,
+        hooks: Optional[List[RequestHook]] = None,
     ):
         """
         Initialize the base client.
@@ -49,9 +59,17 @@ class BaseClient:
             max_retries: Number of retries for transient errors (default 0)
             backoff_factor: Backoff factor between retries
             status_forcelist: HTTP status codes that trigger retries
+            rate_limiter: Optional client-side rate limiter consulted before each request
+            coalesce_requests: Share one in-flight request among concurrent identical GETs
+            recorder: Optional Recorder capturing every response body
+            hooks: Optional request hooks (see backpack_exchange_sdk._base.hooks)
         """
         self.base_url = base_url or self.DEFAULT_BASE_URL
         self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.single_flight = SingleFlight() if coalesce_requests else None
+        self.recorder = recorder
+        self.hooks = HookChain(hooks) if hooks else None
         self.session = requests.Session()
 
         if max_retries > 0:
@@ -79,16 +97,20 @@ class BaseClient:
         Raises:
             BackpackAPIError: If the API returns an error response
         """
+        if self.recorder is not None:
+            self.recorder.record_response(
+                response.request.method, response.url, response.status_code, response.content
+            )
         if 200 <= response.status_code < 300:
             if response.status_code == 204:
                 return None
             try:
-                return response.json()
+                return codec.loads(response.content)
             except ValueError:
                 return response.text
         else:
             try:
-                error = response.json()
+                error = codec.loads(response.content)
                 error_code = error.get("code")
                 error_class = get_error_class(error_code)
                 raise error_class(
@@ -117,13 +139,94 @@ class BaseClient:
             BackpackAPIError: If the API returns an error
             BackpackRequestError: If the request fails
         """
+        if self.single_flight is not None:
+            return self.single_flight.do(request_key(endpoint, params), lambda: self._fetch(endpoint, params))
+        return self._fetch(endpoint, params)
+
+    def _fetch(self, endpoint: str, params: Optional[Dict] = None) -> Any:
+        """Send a GET request without coalescing."""
         url = f"{self.base_url}{endpoint}"
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(endpoint)
+        if self.hooks is not None:
+            ctx = self.hooks.start("GET", endpoint, endpoint, params)
+            self.hooks.signed(ctx, None)
+            return self._instrumented(ctx, lambda: self.session.get(url, params=params, timeout=self.timeout))
         try:
             response = self.session.get(url, params=params, timeout=self.timeout)
             return self._handle_response(response)
         except requests.exceptions.RequestException as e:
             raise BackpackRequestError(str(e))
 
+    def _instrumented(self, ctx: RequestContext, send: Callable[[], requests.Response]) -> Any:
+        """Send a request and parse the response, reporting phases to the hooks."""
+        try:
+            try:
+                response = send()
+            except requests.exceptions.RequestException as e:
+                raise BackpackRequestError(str(e))
+            self.hooks.received(ctx, response.status_code)
+            result = self._handle_response(response)
+        except (BackpackAPIError, BackpackRequestError) as e:
+            self.hooks.failed(ctx, e)
+            raise
+        self.hooks.finished(ctx, result)
+        return result
+
+    def _decode(self, result: Any, decode: Callable[[Any], Any]) -> Any:
+        """Apply ``decode`` to a parsed response (the async client awaits the response first)."""
+        return decode(result)
+
+    def _paginate(
+        self,
+        fetch: Callable[..., Any],
+        filters: Dict[str, Any],
+        page_size: int,
+        offset: int = 0,
+        prefetch: bool = True,
+    ) -> Iterator[Any]:
+        """
+        Iterate lazily over every record of a limit/offset method.
+
+        Args:
+            fetch: Client method accepting ``limit`` and ``offset``
+            filters: Extra keyword arguments for every call
+            page_size: Records requested per page
+            offset: Offset of the first record
+            prefetch: Fetch the next page while the current one is consumed
+
+        Returns:
+            Generator of records
+        """
+        return iter_pages(fetch, filters, page_size, offset, prefetch)
+
+    @property
+    def market_catalog(self) -> "MarketCatalog":
+        """
+        Process-wide MarketCatalog for this client's base URL, shared by all clients.
+
+        The first client to ask creates it; refreshes then use that client's session,
+        timeout, rate limiter, hooks and recorder.
+        """
+        from backpack_exchange_sdk.catalog import MarketCatalog
+
+        return MarketCatalog.shared(self.base_url, client=self._public_client())
+
+    def _public_client(self) -> Any:
+        """This client if it has the public endpoints, else a PublicClient sharing its configuration."""
+        if hasattr(self, "get_markets"):
+            return self
+        from backpack_exchange_sdk.public import PublicClient
+
+        client = PublicClient(
+            base_url=self.base_url, timeout=self.timeout, rate_limiter=self.rate_limiter, recorder=self.recorder
+        )
+        client.session.close()
+        client.session = self.session
+        client.single_flight = self.single_flight
+        client.hooks = self.hooks
+        return client
+
 
 class AuthenticatedBaseClient(BaseClient):
     """
@@ -142,6 +245,11 @@ class AuthenticatedBaseClient(BaseClient):
         max_retries: int = 0,
         backoff_factor: float = 0.1,
         status_forcelist: Optional[List[int]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce_requests: bool = False,
+        clock: Optional[ClockSync] = None,
+        recorder: Optional[Recorder] = None,
+        hooks: Optional[List[RequestHook]] = None,
     ):
         """
         Initialize the authenticated client.
@@ -155,6 +263,11 @@ class AuthenticatedBaseClient(BaseClient):
             max_retries: Number of retries for transient errors (default 0)
             backoff_factor: Backoff factor between retries
             status_forcelist: HTTP status codes that trigger retries
+            rate_limiter: Optional client-side rate limiter consulted before each request
+            coalesce_requests: Share one in-flight request among concurrent identical GETs
+            clock: Optional ClockSync used for X-Timestamp instead of the local clock
+            recorder: Optional Recorder capturing every response body
+            hooks: Optional request hooks (see backpack_exchange_sdk._base.hooks)
         """
         super().__init__(
             base_url=base_url,
@@ -162,10 +275,22 @@ class AuthenticatedBaseClient(BaseClient):
             max_retries=max_retries,
             backoff_factor=backoff_factor,
             status_forcelist=status_forcelist,
+            rate_limiter=rate_limiter,
+            coalesce_requests=coalesce_requests,
+            recorder=recorder,
+            hooks=hooks,
         )
         self.key = public_key
         self.private_key_obj = load_private_key(secret_key)
+        self.signer = Signer(self.private_key_obj)
         self.window = window
+        self.clock = clock
+
+    def _timestamp(self) -> int:
+        """Request timestamp in epoch milliseconds, corrected by the clock if one is set."""
+        if self.clock is not None:
+            return self.clock.now_ms()
+        return int(time.time() * 1e3)
 
     def _generate_signature(
         self,
@@ -186,14 +311,7 @@ class AuthenticatedBaseClient(BaseClient):
         Returns:
             Dictionary of authentication headers
         """
-        return generate_auth_headers(
-            self.key,
-            self.private_key_obj,
-            action,
-            timestamp,
-            self.window,
-            params
-        )
+        return self.signer.headers(self.key, action, params, timestamp, self.window)
 
     def _send_request(
         self,
@@ -221,47 +339,53 @@ class AuthenticatedBaseClient(BaseClient):
             BackpackRequestError: If the request fails
         """
         url = f"{self.base_url}{endpoint}"
-        ts = int(time.time() * 1e3)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(action)
+        ctx = self.hooks.start(method, endpoint, action, params) if self.hooks is not None else None
+        ts = self._timestamp()
         headers = self._generate_signature(action, ts, params)
         if extra_headers:
             headers.update(extra_headers)
 
-        try:
+        def send() -> requests.Response:
             if method == "GET":
-                response = self.session.get(
+                return self.session.get(
                     url, headers=headers, params=params, timeout=self.timeout
                 )
             elif method == "DELETE":
-                response = self.session.delete(
+                return self.session.delete(
                     url,
                     headers=headers,
-                    data=json.dumps(params) if params else None,
+                    data=codec.dumps(params) if params else None,
                     timeout=self.timeout,
                 )
             elif method == "PATCH":
-                response = self.session.patch(
+                return self.session.patch(
                     url,
                     headers=headers,
-                    data=json.dumps(params) if params else None,
+                    data=codec.dumps(params) if params else None,
                     timeout=self.timeout,
                 )
             elif method == "PUT":
-                response = self.session.put(
+                return self.session.put(
                     url,
                     headers=headers,
-                    data=json.dumps(params) if params else None,
+                    data=codec.dumps(params) if params else None,
                     timeout=self.timeout,
                 )
             else:  # POST
-                response = self.session.post(
+                return self.session.post(
                     url,
                     headers=headers,
-                    data=json.dumps(params) if params else None,
+                    data=codec.dumps(params) if params else None,
                     timeout=self.timeout,
                 )
 
-            return self._handle_response(response)
-
+        if ctx is not None:
+            self.hooks.signed(ctx, headers)
+            return self._instrumented(ctx, send)
+        try:
+            return self._handle_response(send())
         except requests.exceptions.RequestException as e:
             raise BackpackRequestError(str(e))
 
@@ -287,21 +411,61 @@ class AuthenticatedBaseClient(BaseClient):
             BackpackRequestError: If the request fails
         """
         url = f"{self.base_url}{endpoint}"
-        ts = int(time.time() * 1e3)
-        headers = generate_batch_auth_headers(
-            self.key,
-            self.private_key_obj,
-            orders,
-            ts,
-            self.window
-        )
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire("orderExecute")
+        ctx = self.hooks.start("POST", endpoint, "orderExecute", orders) if self.hooks is not None else None
+        ts = self._timestamp()
+        headers = self.signer.batch_headers(self.key, orders, ts, self.window)
         if extra_headers:
             headers.update(extra_headers)
 
+        if ctx is not None:
+            self.hooks.signed(ctx, headers)
+            return self._instrumented(
+                ctx, lambda: self.session.post(url, headers=headers, data=codec.dumps(orders), timeout=self.timeout)
+            )
         try:
             response = self.session.post(
-                url, headers=headers, data=json.dumps(orders), timeout=self.timeout
+                url, headers=headers, data=codec.dumps(orders), timeout=self.timeout
             )
             return self._handle_response(response)
         except requests.exceptions.RequestException as e:
             raise BackpackRequestError(str(e))
+
+    def _send_batch_requests(
+        self,
+        endpoint: str,
+        batches: List[List[Dict[str, Any]]],
+        extra_headers: Optional[Dict[str, str]] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Sign and send several batch order requests concurrently.
+
+        Each batch is signed and posted on a worker thread sharing the pooled
+        session.
+
+        Args:
+            endpoint: API endpoint (relative to base URL)
+            batches: List of order batches, each sent as one request
+            extra_headers: Optional extra headers to include
+            max_workers: Maximum concurrent requests (default: one per batch, up to 10)
+
+        Returns:
+            Per-order results in submission order (see merge_batch_results)
+        """
+        def send(batch: List[Dict[str, Any]]) -> Any:
+            try:
+                return self._send_batch_request(endpoint, batch, extra_headers=extra_headers)
+            except (BackpackAPIError, BackpackRequestError) as e:
+                return e
+
+        if not batches:
+            return []
+        if len(batches) == 1:
+            responses = [send(batches[0])]
+        else:
+            workers = max_workers or min(len(batches), 10)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                responses = list(executor.map(send, batches))
+        return merge_batch_results(batches, responses)
@@ -0,0 +1,206 @@
+"""
+Server clock synchronization for Backpack Exchange SDK.
+
+ClockSync estimates the offset between the local clock and the exchange
+clock from ``get_system_time`` round trips. As in NTP's clock filter, the
+estimate comes from the sample with the smallest round-trip time among the
+most recent ones, since that sample has the least queuing delay.
+Authenticated clients given a ``clock`` stamp ``X-Timestamp`` with
+``clock.now_ms()`` instead of the raw local time.
+"""
+
+import asyncio
+import inspect
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Optional, Tuple
+
+
+class ClockSync:
+    """
+    Estimator of the server clock offset and round-trip time.
+
+    Attributes:
+        offset: Estimated server time minus local time, in seconds
+        rtt: Round-trip time of the sample the offset comes from, in seconds
+        last_error: Exception raised by the most recent background sample, if it failed
+
+    Example:
+        >>> clock = ClockSync(PublicClient(), interval=60, background=True)
+        >>> client = AuthenticationClient(key, secret, window=1000, clock=clock)
+    """
+
+    def __init__(
+        self,
+        client: Any = None,
+        interval: float = 60.0,
+        samples: int = 8,
+        background: bool = False,
+    ):
+        """
+        Initialize the estimator. No request is made until the first sample.
+
+        Args:
+            client: Client providing get_system_time (sync or async); defaults to a new PublicClient
+            interval: Seconds between background samples
+            samples: Number of recent samples the filter keeps
+            background: Start sampling on a daemon thread immediately (sync clients only;
+                async clients use start_async)
+
+        Raises:
+            TypeError: If ``background`` is set with an async client
+        """
+        if client is None:
+            from backpack_exchange_sdk.public import PublicClient
+
+            client = PublicClient()
+        self.client = client
+        self.interval = interval
+        self.offset = 0.0
+        self.rtt: Optional[float] = None
+        self._samples: Deque[Tuple[float, float]] = deque(maxlen=samples)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+        self.last_error: Optional[Exception] = None
+        if background:
+            self.start()
+
+    @property
+    def synced(self) -> bool:
+        """Whether at least one sample has been taken."""
+        return self.rtt is not None
+
+    def now(self) -> float:
+        """Estimated server time in epoch seconds."""
+        return time.time() + self.offset
+
+    def now_ms(self) -> int:
+        """Estimated server time in epoch milliseconds."""
+        return int((time.time() + self.offset) * 1e3)
+
+    def add_sample(self, sent: float, server_ms: Any, received: float) -> Tuple[float, float]:
+        """
+        Record one round trip and update the estimate.
+
+        Args:
+            sent: Local time the request was sent (epoch seconds)
+            server_ms: Server timestamp from the response (epoch milliseconds)
+            received: Local time the response arrived (epoch seconds)
+
+        Returns:
+            ``(offset, rtt)`` of this sample in seconds
+        """
+        rtt = received - sent
+        offset = int(server_ms) / 1e3 - (sent + received) / 2
+        with self._lock:
+            self._samples.append((rtt, offset))
+            self.rtt, self.offset = min(self._samples)
+        return offset, rtt
+
+    @property
+    def is_async(self) -> bool:
+        """Whether the client is an async client (its get_system_time returns an awaitable)."""
+        if inspect.iscoroutinefunction(getattr(self.client, "get_system_time", None)):
+            return True
+        try:
+            from backpack_exchange_sdk._base.async_client import AsyncBaseClient
+        except ImportError:  # aiohttp not installed
+            return False
+        return isinstance(self.client, AsyncBaseClient)
+
+    def sample(self) -> Tuple[float, float]:
+        """
+        Take one sample with a synchronous client.
+
+        Raises:
+            TypeError: If the client is async (use sample_async)
+        """
+        sent = time.time()
+        server_ms = self.client.get_system_time()
+        if inspect.isawaitable(server_ms):
+            server_ms.close()
+            raise TypeError("ClockSync.sample() needs a synchronous client; use sample_async() with async clients")
+        return self.add_sample(sent, server_ms, time.time())
+
+    async def sample_async(self) -> Tuple[float, float]:
+        """Take one sample with an async client."""
+        sent = time.time()
+        server_ms = self.client.get_system_time()
+        if inspect.isawaitable(server_ms):
+            server_ms = await server_ms
+        return self.add_sample(sent, server_ms, time.time())
+
+    def sync(self, count: int = 5) -> float:
+        """
+        Take ``count`` samples back to back.
+
+        Returns:
+            The filtered offset in seconds
+        """
+        for _ in range(count):
+            self.sample()
+        return self.offset
+
+    async def sync_async(self, count: int = 5) -> float:
+        """Async version of sync()."""
+        for _ in range(count):
+            await self.sample_async()
+        return self.offset
+
+    def start(self) -> None:
+        """
+        Sample on a daemon thread every ``interval`` seconds.
+
+        Raises:
+            TypeError: If the client is async (use start_async)
+        """
+        if self.is_async:
+            raise TypeError("ClockSync.start() needs a synchronous client; use start_async() with async clients")
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="ClockSync", daemon=True)
+        self._thread.start()
+
+    def start_async(self) -> "asyncio.Task[None]":
+        """
+        Sample in an asyncio task every ``interval`` seconds (call from a running event loop).
+
+        Returns:
+            The sampling task (cancelled by stop())
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run_async())
+        return self._task
+
+    def stop(self) -> None:
+        """Stop the background thread or task."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._thread = None
+        if self._task is not None:
+            self._task.cancel()
+        self._task = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.sync(1 if self.synced else 3)
+                self.last_error = None
+            except Exception as e:
+                # Keep the previous estimate; retry on the next tick.
+                self.last_error = e
+            self._stop.wait(self.interval)
+
+    async def _run_async(self) -> None:
+        while True:
+            try:
+                await self.sync_async(1 if self.synced else 3)
+                self.last_error = None
+            except Exception as e:
+                self.last_error = e
+            await asyncio.sleep(self.interval)
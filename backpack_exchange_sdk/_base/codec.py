@@ -0,0 +1,137 @@
+"""
+JSON codec selection for Backpack Exchange SDK.
+
+REST and WebSocket hot paths encode and decode through ``codec.dumps`` and
+``codec.loads``. The fastest installed backend is used (orjson, then msgspec,
+then the standard library); ``set_codec`` overrides the choice.
+"""
+
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+class JsonCodec:
+    """
+    A named pair of JSON encode/decode functions.
+
+    Attributes:
+        name: Backend name ('stdlib', 'orjson' or 'msgspec')
+        dumps: Encode an object to UTF-8 JSON bytes
+        loads: Decode JSON from str or bytes, raising ValueError on bad input
+    """
+
+    def __init__(
+        self,
+        name: str,
+        dumps: Callable[[Any], bytes],
+        loads: Callable[[Union[str, bytes]], Any],
+    ):
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+
+    def __repr__(self) -> str:
+        return f"JsonCodec({self.name!r})"
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj).encode()
+
+
+def _make_msgspec_codec() -> JsonCodec:
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+
+    def loads(data: Union[str, bytes]) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    return JsonCodec("msgspec", encoder.encode, loads)
+
+
+def _available() -> Dict[str, Callable[[], JsonCodec]]:
+    factories: Dict[str, Callable[[], JsonCodec]] = {}
+    if orjson is not None:
+        factories["orjson"] = lambda: JsonCodec("orjson", orjson.dumps, orjson.loads)
+    if msgspec is not None:
+        factories["msgspec"] = _make_msgspec_codec
+    factories["stdlib"] = lambda: JsonCodec("stdlib", _stdlib_dumps, json.loads)
+    return factories
+
+
+def available_codecs() -> List[str]:
+    """Names of the installed codec backends, fastest first."""
+    return list(_available())
+
+
+_current = next(iter(_available().values()))()
+dumps = _current.dumps
+loads = _current.loads
+
+
+def get_codec() -> JsonCodec:
+    """Return the codec currently used by the SDK."""
+    return _current
+
+
+def set_codec(codec: Union[str, JsonCodec]) -> JsonCodec:
+    """
+    Select the JSON codec used by all clients.
+
+    Args:
+        codec: Backend name ('stdlib', 'orjson', 'msgspec') or a JsonCodec
+
+    Returns:
+        The codec now in use
+
+    Raises:
+        ValueError: If the named backend is not installed
+    """
+    global _current, dumps, loads
+    if isinstance(codec, str):
+        factories = _available()
+        if codec not in factories:
+            raise ValueError(f"JSON codec {codec!r} is not available; installed: {list(factories)}")
+        codec = factories[codec]()
+    _current = codec
+    dumps = codec.dumps
+    loads = codec.loads
+    return codec
+
+
+_LEADING_STREAM = re.compile(r'\s*\{\s*"stream"\s*:\s*"([^"\\]*)"')
+
+
+def peek_stream(frame: str) -> Optional[str]:
+    """
+    Read the ``stream`` name of a WebSocket frame, decoding it only if needed.
+
+    The exchange sends ``stream`` as the first key, so the name is sliced out
+    of frames whose first key is ``"stream"``. Any other frame is decoded in
+    full, so a ``stream`` key nested in ``data`` is never mistaken for it.
+
+    Args:
+        frame: Raw JSON text of a ``{"stream": ..., "data": ...}`` message
+
+    Returns:
+        The stream name, or None if the frame has none
+    """
+    match = _LEADING_STREAM.match(frame)
+    if match:
+        return match.group(1)
+    message = loads(frame)
+    stream = message.get("stream") if isinstance(message, dict) else None
+    return stream if isinstance(stream, str) else None
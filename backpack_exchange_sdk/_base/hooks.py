@@ -0,0 +1,291 @@
+"""
+Request lifecycle hooks for Backpack Exchange SDK.
+
+Clients created with ``hooks=[...]`` call every hook at four points of each
+REST request:
+
+- ``before_sign(ctx)``: before the request is signed (public GETs are not signed)
+- ``before_send(ctx)``: with the final headers, just before sending
+- ``after_response(ctx, result)``: after the response body has been decoded
+- ``on_error(ctx, error)``: when the request fails or the API returns an error
+
+The RequestContext carries the request and its timing breakdown in seconds:
+``sign_time``, ``wire_time`` (sending until the body has arrived, including
+retries) and ``decode_time``. Exceptions raised by hooks propagate to the
+caller. Clients without hooks skip all of this.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    from opentelemetry import trace
+except ImportError:
+    trace = None  # opentelemetry-api may not be installed
+
+PHASES = ("sign", "wire", "decode", "total")
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class RequestContext:
+    """State of one REST request, shared by the hooks that observe it."""
+
+    __slots__ = (
+        "method",
+        "endpoint",
+        "instruction",
+        "params",
+        "headers",
+        "status_code",
+        "sign_time",
+        "wire_time",
+        "decode_time",
+        "extra",
+        "_mark",
+    )
+
+    def __init__(self, method: str, endpoint: str, instruction: str, params: Any):
+        self.method = method
+        self.endpoint = endpoint
+        self.instruction = instruction
+        self.params = params
+        self.headers: Optional[Dict[str, str]] = None
+        self.status_code: Optional[int] = None
+        self.sign_time = 0.0
+        self.wire_time = 0.0
+        self.decode_time = 0.0
+        self.extra: Dict[str, Any] = {}
+        self._mark = 0.0
+
+    @property
+    def total_time(self) -> float:
+        """Sign, wire and decode time together, in seconds."""
+        return self.sign_time + self.wire_time + self.decode_time
+
+
+class RequestHook:
+    """Base class for request hooks; override the methods you need."""
+
+    def before_sign(self, ctx: RequestContext) -> None:
+        pass
+
+    def before_send(self, ctx: RequestContext) -> None:
+        pass
+
+    def after_response(self, ctx: RequestContext, result: Any) -> None:
+        pass
+
+    def on_error(self, ctx: RequestContext, error: Exception) -> None:
+        pass
+
+
+class HookChain:
+    """Runs a client's hooks and measures the request phases."""
+
+    __slots__ = ("hooks",)
+
+    def __init__(self, hooks: Sequence[RequestHook]):
+        self.hooks = list(hooks)
+
+    def start(self, method: str, endpoint: str, instruction: str, params: Any) -> RequestContext:
+        ctx = RequestContext(method, endpoint, instruction, params)
+        for hook in self.hooks:
+            hook.before_sign(ctx)
+        ctx._mark = time.perf_counter()
+        return ctx
+
+    def signed(self, ctx: RequestContext, headers: Optional[Dict[str, str]]) -> None:
+        ctx.sign_time = time.perf_counter() - ctx._mark
+        ctx.headers = headers
+        for hook in self.hooks:
+            hook.before_send(ctx)
+        ctx._mark = time.perf_counter()
+
+    def received(self, ctx: RequestContext, status_code: int) -> None:
+        now = time.perf_counter()
+        ctx.wire_time = now - ctx._mark
+        ctx.status_code = status_code
+        ctx._mark = now
+
+    def finished(self, ctx: RequestContext, result: Any) -> None:
+        ctx.decode_time = time.perf_counter() - ctx._mark
+        for hook in self.hooks:
+            hook.after_response(ctx, result)
+
+    def failed(self, ctx: RequestContext, error: Exception) -> None:
+        elapsed = time.perf_counter() - ctx._mark
+        if ctx.status_code is None:
+            ctx.wire_time = elapsed
+        else:
+            ctx.decode_time = elapsed
+        for hook in self.hooks:
+            hook.on_error(ctx, error)
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram in the Prometheus model."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """``(le, count)`` pairs including ``+Inf``."""
+        total, pairs = 0, []
+        for bound, count in zip(list(self.buckets) + [float("inf")], self.counts):
+            total += count
+            pairs.append(("+Inf" if bound == float("inf") else repr(bound), total))
+        return pairs
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: Any) -> str:
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+class LatencyRecorder(RequestHook):
+    """
+    Per-instruction latency histograms for each phase and error counters.
+
+    Public GETs are recorded under their endpoint (e.g. 'api/v1/depth').
+
+    Example:
+        >>> latency = LatencyRecorder()
+        >>> client = AuthenticationClient(key, secret, hooks=[latency])
+        >>> print(latency.prometheus())
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, namespace: str = "backpack"):
+        """
+        Args:
+            buckets: Histogram bucket upper bounds in seconds
+            namespace: Prefix of the exported metric names
+        """
+        self.buckets = tuple(buckets)
+        self.namespace = namespace
+        self.histograms: Dict[Tuple[str, str], Histogram] = {}
+        self.errors: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def _record(self, ctx: RequestContext) -> None:
+        values = (ctx.sign_time, ctx.wire_time, ctx.decode_time, ctx.total_time)
+        with self._lock:
+            for phase, value in zip(PHASES, values):
+                histogram = self.histograms.get((ctx.instruction, phase))
+                if histogram is None:
+                    histogram = self.histograms[(ctx.instruction, phase)] = Histogram(self.buckets)
+                histogram.observe(value)
+
+    def after_response(self, ctx: RequestContext, result: Any) -> None:
+        self._record(ctx)
+
+    def on_error(self, ctx: RequestContext, error: Exception) -> None:
+        self._record(ctx)
+        with self._lock:
+            self.errors[(ctx.instruction, type(error).__name__)] += 1
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Request counts and mean phase times.
+
+        Returns:
+            ``{instruction: {phase: {"count": n, "mean": seconds}}}``
+        """
+        with self._lock:
+            result: Dict[str, Dict[str, Dict[str, float]]] = {}
+            for (instruction, phase), histogram in self.histograms.items():
+                result.setdefault(instruction, {})[phase] = {
+                    "count": histogram.count,
+                    "mean": histogram.sum / histogram.count if histogram.count else 0.0,
+                }
+            return result
+
+    def prometheus(self) -> str:
+        """Metrics in the Prometheus text exposition format."""
+        duration = f"{self.namespace}_request_duration_seconds"
+        errors = f"{self.namespace}_request_errors_total"
+        lines = [
+            f"# HELP {duration} REST request latency by instruction and phase.",
+            f"# TYPE {duration} histogram",
+        ]
+        with self._lock:
+            for (instruction, phase), histogram in sorted(self.histograms.items()):
+                for le, count in histogram.cumulative():
+                    lines.append(f"{duration}_bucket{_labels(instruction=instruction, phase=phase, le=le)} {count}")
+                labels = _labels(instruction=instruction, phase=phase)
+                lines.append(f"{duration}_sum{labels} {histogram.sum!r}")
+                lines.append(f"{duration}_count{labels} {histogram.count}")
+            lines.append(f"# HELP {errors} Failed REST requests by instruction and error type.")
+            lines.append(f"# TYPE {errors} counter")
+            for (instruction, error), count in sorted(self.errors.items()):
+                lines.append(f"{errors}{_labels(instruction=instruction, error=error)} {count}")
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetryHook(RequestHook):
+    """
+    Emits one OpenTelemetry span per REST request with the phase timings as attributes.
+
+    Example:
+        >>> client = AuthenticationClient(key, secret, hooks=[OpenTelemetryHook()])
+    """
+
+    def __init__(self, tracer: Any = None):
+        """
+        Args:
+            tracer: Tracer to use (default: the global tracer provider's tracer for this SDK)
+
+        Raises:
+            ImportError: If no tracer is given and opentelemetry-api is not installed
+        """
+        if tracer is None:
+            if trace is None:
+                raise ImportError("OpenTelemetryHook requires opentelemetry-api (pip install opentelemetry-api)")
+            tracer = trace.get_tracer("backpack_exchange_sdk")
+        self.tracer = tracer
+
+    def before_sign(self, ctx: RequestContext) -> None:
+        ctx.extra["otel_span"] = self.tracer.start_span(
+            f"backpack {ctx.instruction}",
+            attributes={
+                "http.request.method": ctx.method,
+                "backpack.endpoint": ctx.endpoint,
+                "backpack.instruction": ctx.instruction,
+            },
+        )
+
+    def _end(self, ctx: RequestContext, error: Optional[Exception]) -> None:
+        span = ctx.extra.pop("otel_span", None)
+        if span is None:
+            return
+        if ctx.status_code is not None:
+            span.set_attribute("http.response.status_code", ctx.status_code)
+        span.set_attribute("backpack.sign_ms", ctx.sign_time * 1e3)
+        span.set_attribute("backpack.wire_ms", ctx.wire_time * 1e3)
+        span.set_attribute("backpack.decode_ms", ctx.decode_time * 1e3)
+        if error is not None:
+            span.record_exception(error)
+            if trace is not None:
+                span.set_status(trace.Status(trace.StatusCode.ERROR, str(error)))
+        span.end()
+
+    def after_response(self, ctx: RequestContext, result: Any) -> None:
+        self._end(ctx, None)
+
+    def on_error(self, ctx: RequestContext, error: Exception) -> None:
+        self._end(ctx, error)
@@ -0,0 +1,103 @@
+"""
+Offset pagination helpers for Backpack Exchange SDK.
+
+Both helpers walk a ``limit``/``offset`` endpoint page by page, fetch the
+next page while the current one is being consumed, and stop at the first
+short page. A page that is not a list raises TypeError.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterator
+
+
+def _check_page(page: Any) -> None:
+    if not isinstance(page, list):
+        raise TypeError(f"Paginated endpoint returned {type(page).__name__}, expected a list of records")
+
+
+def iter_pages(
+    fetch: Callable[..., Any],
+    filters: Dict[str, Any],
+    page_size: int,
+    offset: int = 0,
+    prefetch: bool = True,
+) -> Iterator[Any]:
+    """
+    Yield every record of a paginated endpoint.
+
+    Args:
+        fetch: Function called as ``fetch(limit=..., offset=..., **filters)``
+        filters: Extra keyword arguments for every call
+        page_size: Records requested per page
+        offset: Offset of the first record
+        prefetch: Fetch the next page on a background thread
+
+    Yields:
+        Records in server order
+
+    Raises:
+        TypeError: If ``fetch`` returns something other than a list
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be positive")
+    if not prefetch:
+        while True:
+            page = fetch(limit=page_size, offset=offset, **filters)
+            _check_page(page)
+            yield from page
+            if len(page) < page_size:
+                return
+            offset += page_size
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        pending = executor.submit(fetch, limit=page_size, offset=offset, **filters)
+        while pending is not None:
+            page = pending.result()
+            _check_page(page)
+            offset += page_size
+            pending = None
+            if len(page) == page_size:
+                pending = executor.submit(fetch, limit=page_size, offset=offset, **filters)
+            yield from page
+    finally:
+        executor.shutdown(wait=False)
+
+
+async def aiter_pages(
+    fetch: Callable[..., Any],
+    filters: Dict[str, Any],
+    page_size: int,
+    offset: int = 0,
+    prefetch: bool = True,
+) -> AsyncIterator[Any]:
+    """
+    Asynchronously yield every record of a paginated endpoint.
+
+    Same as iter_pages, for coroutine ``fetch`` functions; the next page is
+    requested as a task while the current one is consumed.
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be positive")
+    pending = asyncio.ensure_future(fetch(limit=page_size, offset=offset, **filters))
+    try:
+        while pending is not None:
+            page = await pending
+            pending = None
+            _check_page(page)
+            offset += page_size
+            if len(page) == page_size:
+                next_page = fetch(limit=page_size, offset=offset, **filters)
+                if prefetch:
+                    pending = asyncio.ensure_future(next_page)
+                else:
+                    pending = next_page
+            for record in page:
+                yield record
+    finally:
+        if pending is not None:
+            if isinstance(pending, asyncio.Future):
+                pending.cancel()
+            else:
+                pending.close()
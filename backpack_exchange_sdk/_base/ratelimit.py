@@ -0,0 +1,137 @@
+"""
+Client-side rate limiting for Backpack Exchange SDK.
+
+Clients consult a RateLimiter before every request, keyed by the request's
+instruction (e.g. 'orderExecute') for authenticated calls and by endpoint
+(e.g. 'api/v1/depth') for public calls. Bursts are smoothed by waiting for
+tokens instead of being rejected by the exchange.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at ``rate`` tokens per second.
+
+    Tokens are reserved rather than polled: a request that finds the bucket
+    empty takes its tokens on credit and is told how long to wait, so
+    concurrent callers are served in arrival order.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (default: one second's worth)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def reserve(self, tokens: float = 1.0, now: Optional[float] = None) -> float:
+        """
+        Take ``tokens`` from the bucket.
+
+        Not thread-safe on its own; RateLimiter serializes access.
+
+        Args:
+            tokens: Number of tokens to take
+            now: Current monotonic time (default: time.monotonic())
+
+        Returns:
+            Seconds to wait before the request may be sent
+        """
+        if now is None:
+            now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= tokens
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+
+class RateLimiter:
+    """
+    Rate limiter with per-key buckets, per-key weights and an optional global bucket.
+
+    Example:
+        >>> limiter = RateLimiter(
+        ...     limits={"orderCancel": (20, 40), "orderExecute": (20, 40)},
+        ...     weights={"orderCancelAll": 5},
+        ...     global_limit=(50, 100),
+        ... )
+        >>> client = AuthenticationClient(key, secret, rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Tuple[float, float]]] = None,
+        weights: Optional[Dict[str, float]] = None,
+        global_limit: Optional[Tuple[float, float]] = None,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            limits: ``(rate per second, burst)`` per instruction or endpoint
+            weights: Tokens consumed per request for a key (default 1)
+            global_limit: ``(rate per second, burst)`` applied to every request
+        """
+        self.buckets: Dict[str, TokenBucket] = {
+            key: TokenBucket(rate, burst) for key, (rate, burst) in (limits or {}).items()
+        }
+        self.weights: Dict[str, float] = dict(weights or {})
+        self.global_bucket = TokenBucket(*global_limit) if global_limit else None
+        self.waited = 0.0
+        self._lock = threading.Lock()
+
+    def _buckets_for(self, key: str) -> List[TokenBucket]:
+        buckets = []
+        bucket = self.buckets.get(key)
+        if bucket is not None:
+            buckets.append(bucket)
+        if self.global_bucket is not None:
+            buckets.append(self.global_bucket)
+        return buckets
+
+    def reserve(self, key: str, count: int = 1) -> float:
+        """
+        Reserve capacity for ``count`` requests with the given key.
+
+        Args:
+            key: Instruction or endpoint
+            count: Number of requests
+
+        Returns:
+            Seconds the caller must wait before sending
+        """
+        tokens = self.weights.get(key, 1.0) * count
+        with self._lock:
+            now = time.monotonic()
+            delay = 0.0
+            for bucket in self._buckets_for(key):
+                delay = max(delay, bucket.reserve(tokens, now))
+            self.waited += delay
+        return delay
+
+    def acquire(self, key: str, count: int = 1) -> None:
+        """Block the calling thread until the request may be sent."""
+        delay = self.reserve(key, count)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, key: str, count: int = 1) -> None:
+        """Wait without blocking the event loop until the request may be sent."""
+        delay = self.reserve(key, count)
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -0,0 +1,114 @@
+"""
+Request coalescing for Backpack Exchange SDK.
+
+A single-flight group lets concurrent callers asking for the same key share
+one in-flight call: the first caller runs it, the others wait for and
+receive the same result (or exception). Nothing is cached once the call
+completes.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+def request_key(endpoint: str, params: Optional[Dict[str, Any]] = None) -> Tuple[Any, ...]:
+    """Hashable key for a GET request, independent of parameter order."""
+    if not params:
+        return (endpoint,)
+    return (endpoint,) + tuple(sorted((k, repr(v)) for k, v in params.items()))
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Thread-safe single-flight group.
+
+    Waiters receive the very object the leader produced, so shared results
+    must be treated as read-only.
+
+    Attributes:
+        shared: Number of calls that were served by another caller's request
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run ``fn`` unless a call with the same key is already in flight.
+
+        Args:
+            key: Identity of the call
+            fn: Function producing the result
+
+        Returns:
+            Result of the leader's call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """
+    Single-flight group for coroutines on one event loop.
+
+    The leader's request runs as a task; every caller awaits it through
+    ``asyncio.shield`` so cancelling one caller does not cancel the others.
+
+    Attributes:
+        shared: Number of calls that were served by another caller's request
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await ``fn()`` unless a call with the same key is already in flight.
+
+        Args:
+            key: Identity of the call
+            fn: Coroutine function producing the result
+
+        Returns:
+            Result of the leader's call
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        else:
+            self.shared += 1
+        return await asyncio.shield(task)
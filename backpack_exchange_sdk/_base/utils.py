@@ -3,7 +3,10 @@ Utility functions for Backpack Exchange SDK.
 """
 
 import base64
-from typing import Dict, List, Optional, Any
+import binascii
+import random
+import threading
+from typing import Any, Dict, List, Optional
 
 from cryptography.hazmat.primitives.asymmetric import ed25519
 
@@ -113,6 +116,48 @@ def build_batch_signing_string(
     return "&".join(order_strings) + f"&timestamp={timestamp}&window={window}"
 
 
+def merge_batch_results(
+    batches: List[List[Dict[str, Any]]],
+    responses: List[Any]
+) -> List[Dict[str, Any]]:
+    """
+    Merge per-batch responses into one result per order, in submission order.
+
+    A batch whose request raised is reported as one ``Err`` entry per order
+    (matching the exchange's BatchCommandOrderResult shape) carrying the error
+    code and message. For transport failures the orders' outcome is unknown.
+    A response that is not a list with one result per order cannot be matched
+    to its orders and is reported the same way, with code ``UNEXPECTED_RESPONSE``.
+
+    Args:
+        batches: The order batches that were submitted
+        responses: Parsed response or raised exception for each batch
+
+    Returns:
+        Flat list of per-order results
+    """
+    results: List[Dict[str, Any]] = []
+    for batch, response in zip(batches, responses):
+        if isinstance(response, Exception):
+            error = {
+                "operation": "Err",
+                "code": getattr(response, "code", None),
+                "message": str(response),
+            }
+            results.extend(dict(error) for _ in batch)
+        elif not isinstance(response, list) or len(response) != len(batch):
+            error = {
+                "operation": "Err",
+                "code": "UNEXPECTED_RESPONSE",
+                "message": f"Expected {len(batch)} order results, got "
+                + (f"{len(response)}" if isinstance(response, list) else type(response).__name__),
+            }
+            results.extend(dict(error) for _ in batch)
+        else:
+            results.extend(response)
+    return results
+
+
 def generate_auth_headers(
     public_key: str,
     private_key: ed25519.Ed25519PrivateKey,
@@ -197,3 +242,228 @@ def generate_ws_signature(
     """
     sign_str = f"instruction=subscribe&timestamp={timestamp}&window={window}"
     return sign_message(private_key, sign_str)
+
+
+def backoff_delay(attempt: int, base: float, maximum: float) -> float:
+    """
+    Jittered exponential backoff delay for reconnect attempts.
+
+    The delay doubles with every attempt up to ``maximum`` and is scaled by a
+    random factor in [0.5, 1) so that many clients do not reconnect in lockstep.
+
+    Args:
+        attempt: Number of consecutive failed attempts so far (0 for the first retry)
+        base: Delay of the first attempt in seconds
+        maximum: Upper bound in seconds
+
+    Returns:
+        Seconds to wait
+    """
+    return min(maximum, base * (2 ** min(attempt, 32))) * random.uniform(0.5, 1.0)
+
+
+class Signer:
+    """
+    Reusable request signer bound to a single ED25519 private key.
+
+    Produces exactly the same signing strings as build_signing_string and
+    build_batch_signing_string, but caches the encoded instruction prefixes,
+    parameter keys and window suffixes, and serializes parameters in a single
+    pass into a per-thread reusable bytearray.
+
+    Example:
+        >>> signer = Signer(load_private_key(secret_key))
+        >>> signature = signer.sign("orderExecute", params, timestamp, 5000)
+    """
+
+    _TIMESTAMP = b"&timestamp="
+    _BATCH_PREFIX = b"instruction=orderExecute"
+
+    def __init__(self, private_key: ed25519.Ed25519PrivateKey):
+        """
+        Initialize the signer.
+
+        Args:
+            private_key: ED25519 private key object
+        """
+        self.private_key = private_key
+        self._sign = private_key.sign
+        self._prefixes: Dict[str, bytes] = {}
+        self._keys: Dict[str, bytes] = {}
+        self._windows: Dict[int, bytes] = {}
+        self._local = threading.local()
+
+    def _buffer(self) -> bytearray:
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            buffer = self._local.buffer = bytearray()
+        else:
+            del buffer[:]
+        return buffer
+
+    def _write_params(self, buffer: bytearray, params: Dict[str, Any]) -> None:
+        keys = self._keys
+        for key in sorted(params):
+            encoded_key = keys.get(key)
+            if encoded_key is None:
+                encoded_key = keys[key] = f"&{key}=".encode()
+            buffer += encoded_key
+            value = params[key]
+            if value.__class__ is str:
+                buffer += value.encode()
+            elif value is True:
+                buffer += b"true"
+            elif value is False:
+                buffer += b"false"
+            else:
+                buffer += str(value).encode()
+
+    def _write_suffix(self, buffer: bytearray, timestamp: int, window: int) -> None:
+        suffix = self._windows.get(window)
+        if suffix is None:
+            suffix = self._windows[window] = f"&window={window}".encode()
+        buffer += self._TIMESTAMP
+        buffer += str(timestamp).encode()
+        buffer += suffix
+
+    def signing_bytes(
+        self,
+        instruction: str,
+        params: Optional[Dict[str, Any]],
+        timestamp: int,
+        window: int
+    ) -> bytearray:
+        """
+        Serialize the signing string for a request.
+
+        The returned buffer is reused by the next call on the same thread.
+
+        Args:
+            instruction: The API instruction (e.g., 'orderExecute', 'balanceQuery')
+            params: Request parameters (query params or body)
+            timestamp: Unix timestamp in milliseconds
+            window: Request validity window in milliseconds
+
+        Returns:
+            The bytes to be signed
+        """
+        prefix = self._prefixes.get(instruction)
+        if prefix is None:
+            prefix = self._prefixes[instruction] = f"instruction={instruction}".encode()
+        buffer = self._buffer()
+        buffer += prefix
+        if params:
+            self._write_params(buffer, params)
+        self._write_suffix(buffer, timestamp, window)
+        return buffer
+
+    def batch_signing_bytes(
+        self,
+        orders: List[Dict[str, Any]],
+        timestamp: int,
+        window: int
+    ) -> bytearray:
+        """
+        Serialize the signing string for batch order execution.
+
+        The returned buffer is reused by the next call on the same thread.
+
+        Args:
+            orders: List of order parameter dictionaries
+            timestamp: Unix timestamp in milliseconds
+            window: Request validity window in milliseconds
+
+        Returns:
+            The bytes to be signed for batch orders
+        """
+        buffer = self._buffer()
+        for index, order in enumerate(orders):
+            if index:
+                buffer += b"&"
+            buffer += self._BATCH_PREFIX
+            self._write_params(buffer, order)
+        self._write_suffix(buffer, timestamp, window)
+        return buffer
+
+    def sign(
+        self,
+        instruction: str,
+        params: Optional[Dict[str, Any]],
+        timestamp: int,
+        window: int
+    ) -> str:
+        """
+        Sign a request.
+
+        Args:
+            instruction: The API instruction
+            params: Request parameters (query params or body)
+            timestamp: Unix timestamp in milliseconds
+            window: Request validity window in milliseconds
+
+        Returns:
+            Base64-encoded signature
+        """
+        signature = self._sign(self.signing_bytes(instruction, params, timestamp, window))
+        return binascii.b2a_base64(signature, newline=False).decode()
+
+    def sign_batch(
+        self,
+        orders: List[Dict[str, Any]],
+        timestamp: int,
+        window: int
+    ) -> str:
+        """
+        Sign a batch order request.
+
+        Args:
+            orders: List of order parameter dictionaries
+            timestamp: Unix timestamp in milliseconds
+            window: Request validity window in milliseconds
+
+        Returns:
+            Base64-encoded signature
+        """
+        signature = self._sign(self.batch_signing_bytes(orders, timestamp, window))
+        return binascii.b2a_base64(signature, newline=False).decode()
+
+    def headers(
+        self,
+        public_key: str,
+        instruction: str,
+        params: Optional[Dict[str, Any]],
+        timestamp: int,
+        window: int
+    ) -> Dict[str, str]:
+        """
+        Generate authentication headers for an API request.
+
+        Equivalent to generate_auth_headers.
+        """
+        return {
+            "X-API-Key": public_key,
+            "X-Signature": self.sign(instruction, params, timestamp, window),
+            "X-Timestamp": str(timestamp),
+            "X-Window": str(window),
+            "Content-Type": "application/json; charset=utf-8",
+        }
+
+    def batch_headers(
+        self,
+        public_key: str,
+        orders: List[Dict[str, Any]],
+        timestamp: int,
+        window: int
+    ) -> Dict[str, str]:
+        """
+        Generate authentication headers for batch order execution.
+
+        Equivalent to generate_batch_auth_headers.
+        """
+        return {
+            "X-API-Key": public_key,
+            "X-Signature": self.sign_batch(orders, timestamp, window),
+            "X-Timestamp": str(timestamp),
+            "X-Window": str(window),
+            "Content-Type": "application/json; charset=utf-8",
+        }
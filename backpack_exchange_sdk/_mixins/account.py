@@ -43,7 +43,7 @@ class AccountMixin:
         if leverageLimit is not None:
             data["leverageLimit"] = leverageLimit
 
-        self._send_request("PATCH", "api/v1/account", "accountUpdate", data)
+        return self._send_request("PATCH", "api/v1/account", "accountUpdate", data)
 
     def get_max_borrow_quantity(self, symbol: str) -> Dict[str, Any]:
         """
@@ -34,7 +34,7 @@ class BorrowLendMixin:
             symbol: Asset symbol.
         """
         data = {"quantity": quantity, "side": side, "symbol": symbol}
-        self._send_request("POST", "api/v1/borrowLend", "borrowLendExecute", data)
+        return self._send_request("POST", "api/v1/borrowLend", "borrowLendExecute", data)
 
     def get_estimated_liquidation_price(
         self,
@@ -2,9 +2,14 @@
 History operations mixin for AuthenticationClient.
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
+from backpack_exchange_sdk.columnar import FillColumns
 from backpack_exchange_sdk.enums import FillType, MarketType, SettlementSourceFilter
+from backpack_exchange_sdk.models import Fill
+
+# Maximum page size accepted by the history endpoints
+MAX_HISTORY_PAGE_SIZE = 1000
 
 
 class HistoryMixin:
@@ -139,7 +144,9 @@ class HistoryMixin:
         fillType: Optional[Union[FillType, str]] = None,
         marketType: Optional[Union[MarketType, str]] = None,
         sortDirection: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
+        typed: bool = False,
+        as_arrays: bool = False,
+    ) -> Union[List[Dict[str, Any]], List[Fill], FillColumns]:
         """
         Retrieves historical fills.
 
@@ -154,6 +161,8 @@ class HistoryMixin:
             fillType: Filter by fill type.
             marketType: Filter by market type.
             sortDirection: Sort direction.
+            typed: Return Fill models instead of dictionaries.
+            as_arrays: Return FillColumns (typed columns sorted by time) instead of records.
 
         Returns:
             List of fill records.
@@ -177,9 +186,12 @@ class HistoryMixin:
             )
         if sortDirection:
             params["sortDirection"] = sortDirection
-        return self._send_request(
+        result = self._send_request(
             "GET", "wapi/v1/history/fills", "fillHistoryQueryAll", params
         )
+        if as_arrays:
+            return self._decode(result, FillColumns.from_fills)
+        return self._decode(result, Fill.decode_many) if typed else result
 
     def get_funding_payments(
         self,
@@ -544,3 +556,344 @@ class HistoryMixin:
         return self._send_request(
             "GET", "wapi/v1/history/position", "positionHistoryQueryAll", params
         )
+
+    def iter_borrow_history(
+        self,
+        page_size: int = MAX_HISTORY_PAGE_SIZE,
+        offset: int = 0,
+        prefetch: bool = True,
+        **filters: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterates over all borrow and lend history records, page by page.
+
+        Accepts the same filters as get_borrow_history (except limit/offset) and stops
+        at the first short page.
+
+        Args:
+            page_size: Records per request (default and maximum 1000).
+            offset: Offset of the first record.
+            prefetch: Fetch the next page while the current one is consumed.
+            **filters: Filters passed to get_borrow_history.
+
+        Returns:
+            Iterator of records (an async iterator on async clients).
+        """
+        return self._paginate(self.get_borrow_history, filters, page_size, offset, prefetch)
+
+    def iter_interest_history(
+        self,
+        page_size: int = MAX_HISTORY_PAGE_SIZE,
+        offset: int = 0,
+        prefetch: bool = True,
+        **filters: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterates over all interest payment records, page by page.
+
+        Accepts the same filters as get_interest_history (except limit/offset) and stops
+        at the first short page.
+
+        Args:
+            page_size: Records per request (default and maximum 1000).
+            offset: Offset of the first record.
+            prefetch: Fetch the next page while the current one is consumed.
+            **filters: Filters passed to get_interest_history.
+
+        Returns:
+            Iterator of records (an async iterator on async clients).
+        """
+        return self._paginate(self.get_interest_history, filters, page_size, offset, prefetch)
+
+    def iter_borrow_position_history(
+        self,
+        page_size: int = MAX_HISTORY_PAGE_SIZE,
+        offset: int = 0,
+        prefetch: bool = True,
+        **filters: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterates over all borrow/lend position history records, page by page.
+
+        Accepts the same filters as get_borrow_position_history (except limit/offset) and stops
+        at the first short page.
+
+        Args:
+            page_size: Records per request (default and maximum 1000).
+            offset: Offset of the first record.
+            prefetch: Fetch the next page while the current one is consumed.
+            **filters: Filters passed to get_borrow_position_history.
+
+        Returns:
+            Iterator of records (an async iterator on async clients).
+        """
+        return self._paginate(self.get_borrow_position_history, filters, page_size, offset, prefetch)
+
+    def iter_fill_history(
+        self,
+        page_size: int = MAX_HISTORY_PAGE_SIZE,
+        offset: int = 0,
+        prefetch: bool = True,
+        **filters: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterates over all fills, page by page.
+
+        Accepts the same filters as get_fill_history (except limit/offset) and stops
+        at the first short page.
+
+        Args:
+            page_size: Records per request (default and maximum 1000).
+            offset: Offset of the first record.
+            prefetch: Fetch the next page while the current one is consumed.
+            **filters: Filters passed to get_fill_history (``typed=True`` yields Fill models).
+
+        Returns:
+            Iterator of records (an async iterator on async clients).
+
+        Raises:
+            TypeError: If ``as_arrays`` is passed; build FillColumns.from_fills from the records instead.
+        """
+        if filters.get("as_arrays"):
+            raise TypeError("iter_fill_history yields records; use FillColumns.from_fills on them instead of as_arrays")
+        return self._paginate(self.get_fill_history, filters, page_size, offset, prefetch)
+
+    def iter_funding_payments(
+        self,
+        page_size: int = MAX_HISTORY_PAGE_SIZE,
+        offset: int = 0,
+        prefetch: bool = True,
+        **filters: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterates over all funding payments, page by page.
+
+        Accepts the same filters as get_funding_payments (except limit/offset) and stops
+        at the first short page.
+
+        Args:
+            page_size: Records per request (default and maximum 1000).
+            offset: Offset of the first record.
+            prefetch: Fetch the next page while the current one is consumed.
+            **filters: Filters passed to get_funding_payments.
+
+        Returns:
+            Iterator of records (an async iterator on async clients).
+        """
+        return self._paginate(self.get_funding_payments, filters, page_size, offset, prefetch)
+
+    def iter_order_history(
+        self,
+        page_size: int = MAX_HISTORY_PAGE_SIZE,
+        offset: int = 0,
+        prefetch: bool = True,
+        **filters: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterates over all historical orders, page by page.
+
+        Accepts the same filters as get_order_history (except limit/offset) and stops
+        at the first short page.
+
+        Args:
+            page_size: Records per request (default and maximum 1000).
+            offset: Offset of the first record.
+            prefetch: Fetch the next page while the current one is consumed.
+            **filters: Filters passed to get_order_history.
+
+        Returns:
+            Iterator of records (an async iterator on async clients).
+        """
+        return self._paginate(self.get_order_history, filters, page_size, offset, prefetch)
+
+    def iter_settlement_history(
+        self,
+        page_size: int = MAX_HISTORY_PAGE_SIZE,
+        offset: int = 0,
+        prefetch: bool = True,
+        **filters: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterates over all settlement records, page by page.
+
+        Accepts the same filters as get_settlement_history (except limit/offset) and stops
+        at the first short page.
+
+        Args:
+            page_size: Records per request (default and maximum 1000).
+            offset: Offset of the first record.
+            prefetch: Fetch the next page while the current one is consumed.
+            **filters: Filters passed to get_settlement_history.
+
+        Returns:
+            Iterator of records (an async iterator on async clients).
+        """
+        return self._paginate(self.get_settlement_history, filters, page_size, offset, prefetch)
+
+    def iter_dust_history(
+        self,
+        page_size: int = MAX_HISTORY_PAGE_SIZE,
+        offset: int = 0,
+        prefetch: bool = True,
+        **filters: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterates over all dust conversion records, page by page.
+
+        Accepts the same filters as get_dust_history (except limit/offset) and stops
+        at the first short page.
+
+        Args:
+            page_size: Records per request (default and maximum 1000).
+            offset: Offset of the first record.
+            prefetch: Fetch the next page while the current one is consumed.
+            **filters: Filters passed to get_dust_history.
+
+        Returns:
+            Iterator of records (an async iterator on async clients).
+        """
+        return self._paginate(self.get_dust_history, filters, page_size, offset, prefetch)
+
+    def iter_rfq_history(
+        self,
+        page_size: int = MAX_HISTORY_PAGE_SIZE,
+        offset: int = 0,
+        prefetch: bool = True,
+        **filters: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterates over all RFQ records, page by page.
+
+        Accepts the same filters as get_rfq_history (except limit/offset) and stops
+        at the first short page.
+
+        Args:
+            page_size: Records per request (default and maximum 1000).
+            offset: Offset of the first record.
+            prefetch: Fetch the next page while the current one is consumed.
+            **filters: Filters passed to get_rfq_history.
+
+        Returns:
+            Iterator of records (an async iterator on async clients).
+        """
+        return self._paginate(self.get_rfq_history, filters, page_size, offset, prefetch)
+
+    def iter_quote_history(
+        self,
+        page_size: int = MAX_HISTORY_PAGE_SIZE,
+        offset: int = 0,
+        prefetch: bool = True,
+        **filters: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterates over all quote records, page by page.
+
+        Accepts the same filters as get_quote_history (except limit/offset) and stops
+        at the first short page.
+
+        Args:
+            page_size: Records per request (default and maximum 1000).
+            offset: Offset of the first record.
+            prefetch: Fetch the next page while the current one is consumed.
+            **filters: Filters passed to get_quote_history.
+
+        Returns:
+            Iterator of records (an async iterator on async clients).
+        """
+        return self._paginate(self.get_quote_history, filters, page_size, offset, prefetch)
+
+    def iter_rfq_fill_history(
+        self,
+        page_size: int = MAX_HISTORY_PAGE_SIZE,
+        offset: int = 0,
+        prefetch: bool = True,
+        **filters: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterates over all RFQ fill records, page by page.
+
+        Accepts the same filters as get_rfq_fill_history (except limit/offset) and stops
+        at the first short page.
+
+        Args:
+            page_size: Records per request (default and maximum 1000).
+            offset: Offset of the first record.
+            prefetch: Fetch the next page while the current one is consumed.
+            **filters: Filters passed to get_rfq_fill_history.
+
+        Returns:
+            Iterator of records (an async iterator on async clients).
+        """
+        return self._paginate(self.get_rfq_fill_history, filters, page_size, offset, prefetch)
+
+    def iter_quote_fill_history(
+        self,
+        page_size: int = MAX_HISTORY_PAGE_SIZE,
+        offset: int = 0,
+        prefetch: bool = True,
+        **filters: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterates over all quote fill records, page by page.
+
+        Accepts the same filters as get_quote_fill_history (except limit/offset) and stops
+        at the first short page.
+
+        Args:
+            page_size: Records per request (default and maximum 1000).
+            offset: Offset of the first record.
+            prefetch: Fetch the next page while the current one is consumed.
+            **filters: Filters passed to get_quote_fill_history.
+
+        Returns:
+            Iterator of records (an async iterator on async clients).
+        """
+        return self._paginate(self.get_quote_fill_history, filters, page_size, offset, prefetch)
+
+    def iter_strategy_history(
+        self,
+        page_size: int = MAX_HISTORY_PAGE_SIZE,
+        offset: int = 0,
+        prefetch: bool = True,
+        **filters: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterates over all strategy records, page by page.
+
+        Accepts the same filters as get_strategy_history (except limit/offset) and stops
+        at the first short page.
+
+        Args:
+            page_size: Records per request (default and maximum 1000).
+            offset: Offset of the first record.
+            prefetch: Fetch the next page while the current one is consumed.
+            **filters: Filters passed to get_strategy_history.
+
+        Returns:
+            Iterator of records (an async iterator on async clients).
+        """
+        return self._paginate(self.get_strategy_history, filters, page_size, offset, prefetch)
+
+    def iter_position_history(
+        self,
+        page_size: int = MAX_HISTORY_PAGE_SIZE,
+        offset: int = 0,
+        prefetch: bool = True,
+        **filters: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterates over all position history records, page by page.
+
+        Accepts the same filters as get_position_history (except limit/offset) and stops
+        at the first short page.
+
+        Args:
+            page_size: Records per request (default and maximum 1000).
+            offset: Offset of the first record.
+            prefetch: Fetch the next page while the current one is consumed.
+            **filters: Filters passed to get_position_history.
+
+        Returns:
+            Iterator of records (an async iterator on async clients).
+        """
+        return self._paginate(self.get_position_history, filters, page_size, offset, prefetch)
@@ -12,6 +12,10 @@ from backpack_exchange_sdk.enums import (
     Side,
     TimeInForce,
 )
+from backpack_exchange_sdk.models import OpenOrder
+
+# Default number of orders sent per batch request by submit_orders_bulk
+MAX_BATCH_ORDERS = 50
 
 
 class OrderMixin:
@@ -223,14 +227,16 @@ class OrderMixin:
     def get_open_orders(
         self,
         symbol: Optional[str] = None,
-        marketType: Optional[Union[MarketType, str]] = None
-    ) -> List[Dict[str, Any]]:
+        marketType: Optional[Union[MarketType, str]] = None,
+        typed: bool = False,
+    ) -> Union[List[Dict[str, Any]], List[OpenOrder]]:
         """
         Retrieves all open orders.
 
         Args:
             symbol: Optional market symbol filter.
             marketType: Optional market type filter (SPOT, PERP, etc.).
+            typed: Return OpenOrder models instead of dictionaries.
 
         Returns:
             List of open orders.
@@ -242,7 +248,8 @@ class OrderMixin:
             params["marketType"] = (
                 marketType.value if isinstance(marketType, MarketType) else marketType
             )
-        return self._send_request("GET", "api/v1/orders", "orderQueryAll", params)
+        result = self._send_request("GET", "api/v1/orders", "orderQueryAll", params)
+        return self._decode(result, OpenOrder.decode_many) if typed else result
 
     def cancel_open_orders(
         self,
@@ -312,3 +319,46 @@ class OrderMixin:
         if brokerId is not None:
             extra_headers = {"X-Broker-Id": str(brokerId)}
         return self._send_batch_request("api/v1/orders", orders, extra_headers=extra_headers)
+
+    def submit_orders_bulk(
+        self,
+        orders: List[Dict[str, Any]],
+        chunk_size: int = MAX_BATCH_ORDERS,
+        brokerId: Optional[int] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Submits any number of orders as concurrently sent batch requests.
+
+        The orders are split into chunks of at most ``chunk_size``; each chunk
+        is signed and posted like execute_batch_orders, with all chunks in
+        flight at once over the pooled connection.
+
+        Args:
+            orders: List of order dictionaries (see execute_batch_orders).
+            chunk_size: Maximum orders per batch request (default: MAX_BATCH_ORDERS).
+            brokerId: Optional broker ID.
+            max_workers: Maximum concurrent batch requests.
+
+        Returns:
+            One result per order, in the original order. Orders in a chunk
+            whose request failed are reported as ``{"operation": "Err", ...}``
+            entries with the error code and message.
+
+        Example:
+            grid = [
+                {"symbol": "SOL_USDC", "side": "Bid", "orderType": "Limit",
+                 "price": str(140 - i * 0.01), "quantity": "1"}
+                for i in range(200)
+            ]
+            results = client.submit_orders_bulk(grid)
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        batches = [orders[i:i + chunk_size] for i in range(0, len(orders), chunk_size)]
+        extra_headers = None
+        if brokerId is not None:
+            extra_headers = {"X-Broker-Id": str(brokerId)}
+        return self._send_batch_requests(
+            "api/v1/orders", batches, extra_headers=extra_headers, max_workers=max_workers
+        )
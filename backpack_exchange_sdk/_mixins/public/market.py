@@ -4,7 +4,9 @@ Market data mixin for PublicClient.
 
 from typing import Any, Dict, List, Optional, Union
 
+from backpack_exchange_sdk.columnar import KlineColumns
 from backpack_exchange_sdk.enums import TickerInterval
+from backpack_exchange_sdk.models import Depth, Ticker
 
 
 class MarketMixin:
@@ -52,32 +54,37 @@ class MarketMixin:
 
     def get_tickers(
         self,
-        interval: Union[TickerInterval, str] = TickerInterval.D1
-    ) -> List[Dict[str, Any]]:
+        interval: Union[TickerInterval, str] = TickerInterval.D1,
+        typed: bool = False,
+    ) -> Union[List[Dict[str, Any]], List[Ticker]]:
         """
         Retrieves summarised statistics for the last 24 hours for all market symbols.
 
         Args:
             interval: Ticker interval (default: 1 day).
+            typed: Return Ticker models instead of dictionaries.
 
         Returns:
-            List of ticker statistics dictionaries.
+            List of ticker statistics dictionaries (or Ticker models).
         """
         interval_value = interval.value if isinstance(interval, TickerInterval) else interval
         params = {"interval": interval_value}
-        return self._get("api/v1/tickers", params=params)
+        result = self._get("api/v1/tickers", params=params)
+        return self._decode(result, Ticker.decode_many) if typed else result
 
-    def get_depth(self, symbol: str) -> Dict[str, Any]:
+    def get_depth(self, symbol: str, typed: bool = False) -> Union[Dict[str, Any], Depth]:
         """
         Retrieves the order book depth for a given market symbol.
 
         Args:
             symbol: Market symbol.
+            typed: Return a Depth model instead of a dictionary.
 
         Returns:
             Order book depth with bids and asks.
         """
-        return self._get("api/v1/depth", params={"symbol": symbol})
+        result = self._get("api/v1/depth", params={"symbol": symbol})
+        return self._decode(result, Depth.from_dict) if typed else result
 
     def get_klines(
         self,
@@ -86,7 +93,8 @@ class MarketMixin:
         start_time: int,
         end_time: Optional[int] = None,
         priceType: Optional[str] = None,
-    ) -> List[List[Any]]:
+        as_arrays: bool = False,
+    ) -> Union[List[Dict[str, Any]], KlineColumns]:
         """
         Get K-Lines (candlestick data) for the given market symbol.
 
@@ -96,16 +104,18 @@ class MarketMixin:
             start_time: Start timestamp in seconds.
             end_time: End timestamp in seconds (default: current time).
             priceType: Optional price type.
+            as_arrays: Return KlineColumns (typed columns sorted by start) instead of records.
 
         Returns:
-            List of kline data arrays.
+            List of kline records (or KlineColumns).
         """
         params = {"symbol": symbol, "interval": interval, "startTime": start_time}
         if end_time is not None:
             params["endTime"] = end_time
         if priceType:
             params["priceType"] = priceType
-        return self._get("api/v1/klines", params=params)
+        result = self._get("api/v1/klines", params=params)
+        return self._decode(result, KlineColumns.from_klines) if as_arrays else result
 
     def get_mark_price(self, symbol: str) -> Dict[str, Any]:
         """
@@ -2,13 +2,22 @@
 Public trades mixin for PublicClient.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
+
+from backpack_exchange_sdk.columnar import TradeColumns
+from backpack_exchange_sdk.models import Trade
 
 
 class TradesMixin:
     """Mixin providing public trade data operations."""
 
-    def get_recent_trades(self, symbol: str, limit: int = 100) -> List[Dict[str, Any]]:
+    def get_recent_trades(
+        self,
+        symbol: str,
+        limit: int = 100,
+        typed: bool = False,
+        as_arrays: bool = False,
+    ) -> Union[List[Dict[str, Any]], List[Trade], TradeColumns]:
         """
         Retrieve the most recent trades for a symbol.
 
@@ -19,19 +28,26 @@ class TradesMixin:
         Args:
             symbol: Market symbol.
             limit: Maximum results (default: 100, max: 1000).
+            typed: Return Trade models instead of dictionaries.
+            as_arrays: Return TradeColumns (typed columns sorted by time) instead of records.
 
         Returns:
             List of recent trade records.
         """
         params = {"symbol": symbol, "limit": limit}
-        return self._get("api/v1/trades", params=params)
+        result = self._get("api/v1/trades", params=params)
+        if as_arrays:
+            return self._decode(result, TradeColumns.from_trades)
+        return self._decode(result, Trade.decode_many) if typed else result
 
     def get_historical_trades(
         self,
         symbol: str,
         limit: int = 100,
-        offset: int = 0
-    ) -> List[Dict[str, Any]]:
+        offset: int = 0,
+        typed: bool = False,
+        as_arrays: bool = False,
+    ) -> Union[List[Dict[str, Any]], List[Trade], TradeColumns]:
         """
         Retrieves all historical trades for the given symbol.
 
@@ -41,9 +57,14 @@ class TradesMixin:
             symbol: Market symbol.
             limit: Maximum results (default: 100).
             offset: Pagination offset.
+            typed: Return Trade models instead of dictionaries.
+            as_arrays: Return TradeColumns (typed columns sorted by time) instead of records.
 
         Returns:
             List of historical trade records.
         """
         params = {"symbol": symbol, "limit": limit, "offset": offset}
-        return self._get("api/v1/trades/history", params=params)
+        result = self._get("api/v1/trades/history", params=params)
+        if as_arrays:
+            return self._decode(result, TradeColumns.from_trades)
+        return self._decode(result, Trade.decode_many) if typed else result
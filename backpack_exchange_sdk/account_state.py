@@ -0,0 +1,339 @@
+"""
+Local mirror of account positions, balances and collateral.
+
+This module provides the AccountState class, which seeds from the REST
+account endpoints, applies private stream events incrementally and
+periodically reconciles against REST to detect drift.
+"""
+
+import asyncio
+import threading
+import time
+from decimal import Decimal
+from typing import Any, Callable, Dict, Optional
+
+# Position update event fields mapped to the keys used by get_open_positions.
+POSITION_FIELDS = {
+    "s": "symbol",
+    "i": "positionId",
+    "q": "netQuantity",
+    "Q": "netExposureQuantity",
+    "n": "netExposureNotional",
+    "B": "entryPrice",
+    "b": "breakEvenPrice",
+    "l": "estLiquidationPrice",
+    "M": "markPrice",
+    "p": "pnlRealized",
+    "P": "pnlUnrealized",
+    "f": "imf",
+    "m": "mmf",
+}
+
+Drift = Dict[str, Dict[str, Any]]
+
+
+def _amount(value: Any) -> Decimal:
+    return Decimal(str(value)) if value not in (None, "") else Decimal(0)
+
+
+def _total(balance: Dict[str, Any]) -> Decimal:
+    return sum((_amount(balance.get(k)) for k in ("available", "locked", "staked")), Decimal(0))
+
+
+class AccountState:
+    """
+    Account mirror answering position and balance reads with zero I/O.
+
+    Positions are updated from ``account.positionUpdate``. The exchange has
+    no balance stream, so balances and collateral are re-fetched shortly
+    after ``orderFill`` events on ``account.orderUpdate`` (bursts of fills
+    share one refresh). Every ``reconcile_interval`` seconds the whole state
+    is compared with REST; differences are reported to ``on_drift`` and the
+    REST values win.
+
+    Example:
+        >>> state = AccountState(AuthenticationClient(key, secret), on_drift=print)
+        >>> state.attach(WebSocketClient(key, secret))
+        >>> state.position("SOL_USDC_PERP"), state.balance("USDC")
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        reconcile_interval: float = 30.0,
+        refresh_delay: float = 0.25,
+        on_drift: Optional[Callable[[Drift], None]] = None,
+    ):
+        """
+        Initialize an empty mirror.
+
+        Args:
+            client: AuthenticationClient used for seeding, refreshes and reconciliation
+            reconcile_interval: Seconds between full reconciliations in the background thread
+            refresh_delay: Seconds to wait after a fill before refreshing balances
+            on_drift: Optional callback receiving the differences found by reconcile()
+        """
+        self.client = client
+        self.reconcile_interval = reconcile_interval
+        self.refresh_delay = refresh_delay
+        self.on_drift = on_drift
+        self.positions: Dict[str, Dict[str, Any]] = {}
+        self.balances: Dict[str, Dict[str, Any]] = {}
+        self.collateral: Dict[str, Any] = {}
+        self.updated: Optional[float] = None
+        self.drifts = 0
+        self._seq = 0
+        self._position_seq: Dict[str, int] = {}
+        self._balances_seq = 0
+        self._lock = threading.RLock()
+        self._dirty = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def position(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Open position for a market, or None."""
+        return self.positions.get(symbol)
+
+    def balance(self, asset: str) -> Optional[Dict[str, Any]]:
+        """Balance of an asset (``available``/``locked``/``staked``), or None."""
+        return self.balances.get(asset)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Consistent copy of positions, balances and collateral."""
+        with self._lock:
+            return {
+                "positions": dict(self.positions),
+                "balances": dict(self.balances),
+                "collateral": dict(self.collateral),
+                "updated": self.updated,
+            }
+
+    def _fetch_positions(self) -> Dict[str, Dict[str, Any]]:
+        positions = self.client.get_open_positions() or []
+        return {p["symbol"]: p for p in positions if _amount(p.get("netQuantity")) != 0}
+
+    def _replace_positions(self, positions: Dict[str, Dict[str, Any]], since: int) -> None:
+        # Positions the stream updated after ``since`` are newer than the REST copy; keep them.
+        with self._lock:
+            merged = dict(positions)
+            for symbol, seq in self._position_seq.items():
+                if seq > since:
+                    if symbol in self.positions:
+                        merged[symbol] = self.positions[symbol]
+                    else:
+                        merged.pop(symbol, None)
+            self.positions = merged
+
+    def _set_balances(self, balances: Dict[str, Dict[str, Any]], collateral: Dict[str, Any]) -> None:
+        with self._lock:
+            self._seq += 1
+            self._balances_seq = self._seq
+            self.balances = balances
+            self.collateral = collateral
+            self.updated = time.time()
+
+    def refresh_balances(self) -> None:
+        """Re-fetch balances and collateral."""
+        balances = self.client.get_balances() or {}
+        collateral = self.client.get_collateral() or {}
+        self._set_balances(balances, collateral)
+
+    def seed(self) -> None:
+        """Load positions, balances and collateral from REST."""
+        since = self._seq
+        positions = self._fetch_positions()
+        self.refresh_balances()
+        self._replace_positions(positions, since)
+
+    def apply_position_update(self, event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Apply an ``account.positionUpdate`` event.
+
+        Args:
+            event: Position update event
+
+        Returns:
+            The position after the update, or None if it is closed
+        """
+        symbol = event.get("s")
+        if symbol is None:
+            return None
+        with self._lock:
+            position = dict(self.positions.get(symbol) or {})
+            for key, field in POSITION_FIELDS.items():
+                if key in event:
+                    position[field] = event[key]
+            positions = dict(self.positions)
+            if event.get("e") == "positionClosed" or _amount(position.get("netQuantity")) == 0:
+                positions.pop(symbol, None)
+                position = None
+            else:
+                positions[symbol] = position
+            self.positions = positions
+            self._seq += 1
+            self._position_seq[symbol] = self._seq
+            self.updated = time.time()
+        return position
+
+    def apply_order_update(self, event: Dict[str, Any]) -> None:
+        """Schedule a balance refresh when an ``account.orderUpdate`` event is a fill."""
+        if event.get("e") == "orderFill":
+            self._dirty.set()
+
+    def diff(self, positions: Dict[str, Dict[str, Any]], balances: Dict[str, Dict[str, Any]]) -> Drift:
+        """
+        Compare the mirror with REST state.
+
+        Returns:
+            ``{"positions": {symbol: (local, remote)}, "balances": {asset: (local, remote)}}``
+            net quantities and total balances that differ
+        """
+        drift: Drift = {"positions": {}, "balances": {}}
+        with self._lock:
+            for symbol in set(self.positions) | set(positions):
+                local = _amount((self.positions.get(symbol) or {}).get("netQuantity"))
+                remote = _amount((positions.get(symbol) or {}).get("netQuantity"))
+                if local != remote:
+                    drift["positions"][symbol] = (local, remote)
+            for asset in set(self.balances) | set(balances):
+                local = _total(self.balances.get(asset) or {})
+                remote = _total(balances.get(asset) or {})
+                if local != remote:
+                    drift["balances"][asset] = (local, remote)
+        return drift
+
+    def reconcile(self) -> Drift:
+        """
+        Fetch REST state, report drift and replace the mirror.
+
+        Positions updated by the stream, and balances refreshed, while the
+        REST state was being fetched are newer than it: they are kept and
+        left out of the drift.
+
+        Returns:
+            The differences found (see diff())
+        """
+        since = self._seq
+        positions = self._fetch_positions()
+        balances = self.client.get_balances() or {}
+        collateral = self.client.get_collateral() or {}
+        with self._lock:
+            drift = self.diff(positions, balances)
+            for symbol, seq in self._position_seq.items():
+                if seq > since:
+                    drift["positions"].pop(symbol, None)
+            self._replace_positions(positions, since)
+            if self._balances_seq > since:
+                drift["balances"] = {}
+            else:
+                self.balances = balances
+                self.collateral = collateral
+            self.updated = time.time()
+        if drift["positions"] or drift["balances"]:
+            self.drifts += 1
+            if self.on_drift is not None:
+                self.on_drift(drift)
+        return drift
+
+    def attach(self, ws_client: Any, background: bool = True) -> "AccountState":
+        """
+        Subscribe to the private account streams, seed from REST and start reconciling.
+
+        The mirror also reconciles whenever the client reports a gap on the position stream.
+
+        Args:
+            ws_client: A connected WebSocketClient with API credentials
+            background: Start the refresh/reconcile thread
+
+        Returns:
+            This mirror
+        """
+        ws_client.subscribe(["account.positionUpdate"], self.apply_position_update, is_private=True)
+        ws_client.subscribe(["account.orderUpdate"], self.apply_order_update, is_private=True)
+        ws_client.on_gap(lambda stream: self.reconcile(), ["account.positionUpdate"])
+        self.seed()
+        if background:
+            self.start()
+        return self
+
+    def start(self) -> None:
+        """Start the background thread for balance refreshes and reconciliation."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="AccountState", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread."""
+        self._stop.set()
+        self._dirty.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._thread = None
+
+    def _run(self) -> None:
+        next_reconcile = time.monotonic() + self.reconcile_interval
+        while not self._stop.is_set():
+            if self._dirty.wait(max(0.0, next_reconcile - time.monotonic())):
+                if self._stop.wait(self.refresh_delay):
+                    return
+                self._dirty.clear()
+                try:
+                    self.refresh_balances()
+                except Exception:
+                    # Keep the previous balances; the next fill or reconcile retries.
+                    pass
+            if time.monotonic() >= next_reconcile:
+                try:
+                    self.reconcile()
+                except Exception:
+                    pass
+                next_reconcile = time.monotonic() + self.reconcile_interval
+
+    async def follow(self, ws_client: Any) -> None:
+        """
+        Maintain the mirror from an AsyncWebSocketClient until the streams end.
+
+        Requires ``client`` to be an AsyncAuthenticationClient. Fills arriving
+        while a balance refresh is pending share that refresh.
+
+        Args:
+            ws_client: A connected AsyncWebSocketClient with API credentials
+        """
+
+        async def seed(stream: str = None) -> None:
+            since = self._seq
+            positions = await self.client.get_open_positions() or []
+            await self._refresh_balances_async()
+            self._replace_positions({p["symbol"]: p for p in positions if _amount(p.get("netQuantity")) != 0}, since)
+
+        await ws_client.subscribe(["account.positionUpdate", "account.orderUpdate"], is_private=True)
+        ws_client.on_gap(seed, ["account.positionUpdate"])
+        await seed()
+        pending: Optional["asyncio.Future[None]"] = None
+
+        async def refresh_later() -> None:
+            await asyncio.sleep(self.refresh_delay)
+            await self._refresh_balances_async()
+
+        async def fills() -> None:
+            nonlocal pending
+            async for event in ws_client.stream("account.orderUpdate"):
+                if event.get("e") == "orderFill" and (pending is None or pending.done()):
+                    pending = asyncio.ensure_future(refresh_later())
+
+        async def positions_updates() -> None:
+            async for event in ws_client.stream("account.positionUpdate"):
+                self.apply_position_update(event)
+
+        try:
+            await asyncio.gather(positions_updates(), fills())
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    async def _refresh_balances_async(self) -> None:
+        balances = await self.client.get_balances() or {}
+        collateral = await self.client.get_collateral() or {}
+        self._set_balances(balances, collateral)
@@ -0,0 +1,102 @@
+"""
+Asyncio authenticated client for Backpack Exchange API.
+
+This module provides the AsyncAuthenticationClient class, which exposes the same
+methods as AuthenticationClient but returns awaitables served over a single
+pooled aiohttp session.
+"""
+
+from typing import List, Optional
+
+from backpack_exchange_sdk._base.async_client import AsyncAuthenticatedBaseClient
+from backpack_exchange_sdk._base.clock import ClockSync
+from backpack_exchange_sdk._base.hooks import RequestHook
+from backpack_exchange_sdk._base.ratelimit import RateLimiter
+from backpack_exchange_sdk._mixins.account import AccountMixin
+from backpack_exchange_sdk._mixins.borrow_lend import BorrowLendMixin
+from backpack_exchange_sdk._mixins.capital import CapitalMixin
+from backpack_exchange_sdk._mixins.history import HistoryMixin
+from backpack_exchange_sdk._mixins.order import OrderMixin
+from backpack_exchange_sdk._mixins.rfq import RFQMixin
+from backpack_exchange_sdk._mixins.strategy import StrategyMixin
+from backpack_exchange_sdk.recording import Recorder
+
+
+class AsyncAuthenticationClient(
+    AccountMixin,
+    CapitalMixin,
+    OrderMixin,
+    BorrowLendMixin,
+    HistoryMixin,
+    RFQMixin,
+    StrategyMixin,
+    AsyncAuthenticatedBaseClient,
+):
+    """
+    Asyncio authenticated client for Backpack Exchange API.
+
+    Every method has the same signature as on AuthenticationClient and must be
+    awaited. Requires the optional ``aiohttp`` dependency.
+
+    Example:
+        >>> async with AsyncAuthenticationClient(
+        ...     public_key="your_public_key",
+        ...     secret_key="your_secret_key"
+        ... ) as client:
+        ...     orders = await asyncio.gather(
+        ...         *(client.get_open_orders(symbol) for symbol in symbols)
+        ...     )
+    """
+
+    def __init__(
+        self,
+        public_key: str,
+        secret_key: str,
+        window: int = 5000,
+        base_url: Optional[str] = None,
+        timeout: Optional[float] = None,
+        max_retries: int = 0,
+        backoff_factor: float = 0.1,
+        status_forcelist: Optional[List[int]] = None,
+        pool_size: int = 100,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce_requests: bool = False,
+        clock: Optional[ClockSync] = None,
+        recorder: Optional[Recorder] = None,
+        hooks: Optional[List[RequestHook]] = None,
+    ):
+        """
+        Initialize the async authenticated client.
+
+        Args:
+            public_key: Your Backpack Exchange API public key.
+            secret_key: Your Backpack Exchange API secret key (base64 encoded).
+            window: Request validity window in milliseconds (default: 5000).
+            base_url: Optional custom base URL for the API.
+            timeout: Optional request timeout in seconds.
+            max_retries: Number of retries for transient errors (default 0).
+            backoff_factor: Backoff factor between retries.
+            status_forcelist: HTTP status codes that trigger retries.
+            pool_size: Maximum number of pooled connections (default 100).
+            rate_limiter: Optional client-side rate limiter consulted before each request.
+            coalesce_requests: Share one in-flight request among concurrent identical GETs.
+            clock: Optional ClockSync used for X-Timestamp instead of the local clock.
+            recorder: Optional Recorder capturing every response body.
+            hooks: Optional request hooks (see backpack_exchange_sdk._base.hooks).
+        """
+        super().__init__(
+            public_key,
+            secret_key,
+            window,
+            base_url=base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=status_forcelist,
+            pool_size=pool_size,
+            rate_limiter=rate_limiter,
+            coalesce_requests=coalesce_requests,
+            clock=clock,
+            recorder=recorder,
+            hooks=hooks,
+        )
@@ -0,0 +1,70 @@
+"""
+Asyncio public client for Backpack Exchange API.
+
+This module provides the AsyncPublicClient class, which exposes the same
+methods as PublicClient but returns awaitables served over a single pooled
+aiohttp session.
+"""
+
+from typing import List, Optional
+
+from backpack_exchange_sdk._base.async_client import AsyncBaseClient
+from backpack_exchange_sdk._base.hooks import RequestHook
+from backpack_exchange_sdk._base.ratelimit import RateLimiter
+from backpack_exchange_sdk._mixins.public.assets import AssetsMixin
+from backpack_exchange_sdk._mixins.public.borrow_lend_markets import BorrowLendMarketsMixin
+from backpack_exchange_sdk._mixins.public.market import MarketMixin
+from backpack_exchange_sdk._mixins.public.prediction import PredictionMixin
+from backpack_exchange_sdk._mixins.public.system import SystemMixin
+from backpack_exchange_sdk._mixins.public.trades import TradesMixin
+from backpack_exchange_sdk.recording import Recorder
+
+
+class AsyncPublicClient(
+    AssetsMixin,
+    MarketMixin,
+    SystemMixin,
+    TradesMixin,
+    BorrowLendMarketsMixin,
+    PredictionMixin,
+    AsyncBaseClient,
+):
+    """
+    Asyncio public client for Backpack Exchange API.
+
+    Every method has the same signature as on PublicClient and must be
+    awaited. Requires the optional ``aiohttp`` dependency.
+
+    Example:
+        >>> async with AsyncPublicClient() as client:
+        ...     books = await asyncio.gather(
+        ...         *(client.get_depth(symbol) for symbol in symbols)
+        ...     )
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: Optional[float] = None,
+        max_retries: int = 0,
+        backoff_factor: float = 0.1,
+        status_forcelist: Optional[List[int]] = None,
+        pool_size: int = 100,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce_requests: bool = False,
+        recorder: Optional[Recorder] = None,
+        hooks: Optional[List[RequestHook]] = None,
+    ):
+        """Initialize the async public client."""
+        super().__init__(
+            base_url=base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=status_forcelist,
+            pool_size=pool_size,
+            rate_limiter=rate_limiter,
+            coalesce_requests=coalesce_requests,
+            recorder=recorder,
+            hooks=hooks,
+        )
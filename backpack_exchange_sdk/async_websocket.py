@@ -0,0 +1,357 @@
+"""
+Asyncio WebSocket client for Backpack Exchange.
+
+This module provides AsyncWebSocketClient, which runs any number of connections
+on one event loop without a thread per socket. Messages for each stream are
+delivered through an async iterator.
+"""
+
+import asyncio
+import functools
+import inspect
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+import aiohttp
+
+from backpack_exchange_sdk._base import codec
+from backpack_exchange_sdk._base.clock import ClockSync
+from backpack_exchange_sdk._base.utils import backoff_delay, generate_ws_signature, load_private_key
+from backpack_exchange_sdk.dispatch import BLOCK, CONFLATE, DROP_OLDEST, POLICIES, policy_for
+from backpack_exchange_sdk.recording import Recorder
+
+_CLOSED = object()
+
+
+class AsyncStream:
+    """
+    Async iterator over the messages of a single stream.
+
+    The queue is bounded. When the consumer falls behind, the ``policy``
+    decides: ``drop_oldest`` discards the oldest message (counted in
+    ``dropped``), ``conflate`` keeps only the latest one (counted in
+    ``conflated``) and ``block`` makes the reader wait for space. ``gaps``
+    counts the reconnects after which messages may have been missed.
+    """
+
+    def __init__(self, name: str, maxsize: int = 1000, policy: str = DROP_OLDEST):
+        self.name = name
+        self.policy = policy
+        self.dropped = 0
+        self.conflated = 0
+        self.delivered = 0
+        self.gaps = 0
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=1 if policy == CONFLATE else maxsize)
+
+    @property
+    def depth(self) -> int:
+        """Number of queued messages."""
+        return self._queue.qsize()
+
+    def _put(self, item: Any) -> Optional[Awaitable[None]]:
+        """Queue an item; returns an awaitable when the reader must wait for space."""
+        if self._queue.full():
+            if self.policy == BLOCK and item is not _CLOSED:
+                return self._queue.put(item)
+            self._queue.get_nowait()
+            if self.policy == CONFLATE:
+                self.conflated += 1
+            else:
+                self.dropped += 1
+        self._queue.put_nowait(item)
+        return None
+
+    def _close(self) -> None:
+        self._put(_CLOSED)
+
+    def __aiter__(self) -> AsyncIterator[Dict[str, Any]]:
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        item = await self._queue.get()
+        if item is _CLOSED:
+            raise StopAsyncIteration
+        self.delivered += 1
+        return item
+
+    async def get(self) -> Dict[str, Any]:
+        """Wait for the next message, raising StopAsyncIteration once unsubscribed."""
+        return await self.__anext__()
+
+
+class AsyncWebSocketClient:
+    """
+    Asyncio WebSocket client for Backpack Exchange.
+
+    Connecting, subscribing and unsubscribing are coroutines; nothing blocks
+    the event loop and no threads are started. Dropped connections are
+    re-established in the background and every active subscription is
+    replayed (private ones with a fresh signature).
+
+    Example:
+        >>> async with AsyncWebSocketClient() as ws:
+        ...     await ws.subscribe(["depth.SOL_USDC"])
+        ...     async for update in ws.stream("depth.SOL_USDC"):
+        ...         print(update)
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        base_url: str = "wss://ws.backpack.exchange",
+        window: int = 5000,
+        queue_size: int = 1000,
+        reconnect_delay: float = 1.0,
+        shutdown_delay: float = 30.0,
+        max_reconnect_delay: float = 30.0,
+        policy: str = DROP_OLDEST,
+        policies: Optional[Dict[str, str]] = None,
+        recorder: Optional[Recorder] = None,
+        clock: Optional[ClockSync] = None,
+    ):
+        """
+        Initialize the client. No I/O happens until ``connect()``.
+
+        Args:
+            api_key: API key for authenticated streams
+            secret_key: Secret key for authenticated streams
+            base_url: WebSocket endpoint
+            window: Signature validity window in milliseconds
+            queue_size: Maximum buffered messages per stream
+            reconnect_delay: Initial reconnect delay; doubles (with jitter) per failed attempt
+            shutdown_delay: Minimum delay before reconnecting when the server is shutting down (1001)
+            max_reconnect_delay: Upper bound of the reconnect delay
+            policy: Overflow policy of stream queues ('drop_oldest', 'conflate' or 'block')
+            policies: Overflow policies keyed by stream name or stream type (e.g. 'bookTicker')
+            recorder: Optional Recorder capturing every raw frame before it is decoded
+            clock: Optional ClockSync used to timestamp private subscriptions instead of the local clock
+        """
+        for name in [policy, *(policies or {}).values()]:
+            if name not in POLICIES:
+                raise ValueError(f"Unknown overflow policy {name!r}; expected one of {POLICIES}")
+        self.api_key = api_key
+        self.base_url = base_url
+        self.window = window
+        self.queue_size = queue_size
+        self.reconnect_delay = reconnect_delay
+        self.shutdown_delay = shutdown_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.policy = policy
+        self.policies = dict(policies or {})
+        self.recorder = recorder
+        self.clock = clock
+        self._gap_callbacks: List[Tuple[Optional[Set[str]], Callable[[str], Any]]] = []
+        self._gap_tasks: Set["asyncio.Future[Any]"] = set()
+        self._private_key = load_private_key(secret_key) if secret_key else None
+        self._streams: Dict[str, AsyncStream] = {}
+        self._private: Set[str] = set()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._closing = False
+
+    @property
+    def connected(self) -> bool:
+        """Whether the socket is currently open."""
+        return self._ws is not None and not self._ws.closed
+
+    async def connect(self) -> None:
+        """Open the connection and start the background reader task."""
+        self._closing = False
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        await self._open()
+        if self._reader is None or self._reader.done():
+            self._reader = asyncio.ensure_future(self._run())
+
+    async def _open(self) -> None:
+        self._ws = await self._session.ws_connect(self.base_url, autoping=True)
+
+    async def _run(self) -> None:
+        """Read frames until closed, reconnecting and resubscribing on loss."""
+        attempt = 0
+        while not self._closing:
+            close_code = None
+            try:
+                async for msg in self._ws:
+                    if msg.type == aiohttp.WSMsgType.TEXT:
+                        pending = self._dispatch(msg.data)
+                        if pending is not None:
+                            await pending
+                    elif msg.type in (aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.ERROR):
+                        break
+                close_code = self._ws.close_code
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                pass
+            while not self._closing:
+                delay = backoff_delay(attempt, self.reconnect_delay, self.max_reconnect_delay)
+                if close_code == 1001:
+                    delay = max(delay, self.shutdown_delay)
+                await asyncio.sleep(delay)
+                if self._closing:
+                    break
+                try:
+                    await self._open()
+                    await self._resubscribe()
+                except (aiohttp.ClientError, asyncio.TimeoutError, OSError):
+                    attempt += 1
+                    continue
+                attempt = 0
+                self._emit_gaps(list(self._streams))
+                break
+
+    def on_gap(self, callback: Callable[[str], Any], streams: Optional[List[str]] = None) -> None:
+        """
+        Register a callback for stream gaps.
+
+        After a reconnect every restored stream may have missed messages; the
+        callback is then invoked with each affected stream name. Coroutine
+        callbacks are scheduled as tasks.
+
+        Args:
+            callback: Function or coroutine function called with the stream name
+            streams: Only report these streams (default: all)
+        """
+        self._gap_callbacks.append((set(streams) if streams is not None else None, callback))
+
+    def _emit_gaps(self, streams: List[str]) -> None:
+        for name in streams:
+            stream = self._streams.get(name)
+            if stream is not None:
+                stream.gaps += 1
+            for wanted, callback in self._gap_callbacks:
+                if wanted is None or name in wanted:
+                    try:
+                        result = callback(name)
+                    except Exception as e:
+                        print(f"Error handling gap on {name}: {e}")
+                        continue
+                    if inspect.isawaitable(result):
+                        task = asyncio.ensure_future(result)
+                        self._gap_tasks.add(task)
+                        task.add_done_callback(functools.partial(self._gap_done, name))
+
+    def _gap_done(self, name: str, task: "asyncio.Future[Any]") -> None:
+        self._gap_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            print(f"Error handling gap on {name}: {task.exception()}")
+
+    def _dispatch(self, raw: str) -> Optional[Awaitable[None]]:
+        if self.recorder is not None:
+            self.recorder.record_frame(raw)
+        try:
+            data = codec.loads(raw)
+        except ValueError:
+            return
+        if not isinstance(data, dict):
+            return
+        stream = self._streams.get(data.get("stream"))
+        if stream is not None:
+            return stream._put(data.get("data"))
+        return None
+
+    async def _resubscribe(self) -> None:
+        public = [name for name in self._streams if name not in self._private]
+        private = [name for name in self._streams if name in self._private]
+        if public:
+            await self._send_subscribe(public, False)
+        if private:
+            await self._send_subscribe(private, True)
+
+    def _signature(self) -> List[str]:
+        timestamp = self.clock.now_ms() if self.clock is not None else int(time.time() * 1000)
+        signature = generate_ws_signature(self._private_key, timestamp, self.window)
+        return [self.api_key, signature, str(timestamp), str(self.window)]
+
+    async def _send_subscribe(self, streams: List[str], is_private: bool) -> None:
+        payload: Dict[str, Any] = {"method": "SUBSCRIBE", "params": streams}
+        if is_private:
+            payload["signature"] = self._signature()
+        await self._ws.send_str(codec.dumps(payload).decode())
+
+    async def subscribe(self, streams: List[str], is_private: bool = False) -> None:
+        """
+        Subscribe to one or more data streams.
+
+        Args:
+            streams: List of stream names to subscribe to
+            is_private: Whether these are private authenticated streams
+        """
+        if is_private and (not self.api_key or self._private_key is None):
+            raise ValueError("api_key and secret_key are required for private streams")
+        reconnecting = self._reader is not None and not self._reader.done()
+        if not self.connected and not reconnecting:
+            await self.connect()
+        for name in streams:
+            if name not in self._streams:
+                self._streams[name] = AsyncStream(name, self.queue_size, policy_for(name, self.policies, self.policy))
+            if is_private:
+                self._private.add(name)
+        if self.connected:
+            # Otherwise the reader replays every stream once it reconnects.
+            await self._send_subscribe(streams, is_private)
+
+    async def unsubscribe(self, streams: List[str]) -> None:
+        """
+        Unsubscribe from one or more data streams, ending their iterators.
+
+        Args:
+            streams: List of stream names to unsubscribe from
+        """
+        if self.connected:
+            await self._ws.send_str(codec.dumps({"method": "UNSUBSCRIBE", "params": streams}).decode())
+        for name in streams:
+            stream = self._streams.pop(name, None)
+            self._private.discard(name)
+            if stream is not None:
+                stream._close()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Per-stream counters.
+
+        Returns:
+            ``{stream: {"depth", "delivered", "dropped", "conflated"}}``
+        """
+        return {
+            name: {
+                "depth": stream.depth,
+                "delivered": stream.delivered,
+                "dropped": stream.dropped,
+                "conflated": stream.conflated,
+            }
+            for name, stream in self._streams.items()
+        }
+
+    def stream(self, name: str) -> AsyncStream:
+        """
+        Return the async iterator for a subscribed stream.
+
+        Raises:
+            KeyError: If the stream has not been subscribed
+        """
+        return self._streams[name]
+
+    async def close(self) -> None:
+        """Close the connection and end every stream iterator."""
+        self._closing = True
+        if self._ws is not None:
+            await self._ws.close()
+        if self._reader is not None:
+            await asyncio.gather(self._reader, return_exceptions=True)
+            self._reader = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        for stream in self._streams.values():
+            stream._close()
+        self._streams.clear()
+        self._private.clear()
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
@@ -9,6 +9,9 @@ import base64
 from typing import Any, Dict, List, Optional, Union
 
 from backpack_exchange_sdk._base.client import AuthenticatedBaseClient
+from backpack_exchange_sdk._base.clock import ClockSync
+from backpack_exchange_sdk._base.hooks import RequestHook
+from backpack_exchange_sdk._base.ratelimit import RateLimiter
 from backpack_exchange_sdk._mixins.account import AccountMixin
 from backpack_exchange_sdk._mixins.borrow_lend import BorrowLendMixin
 from backpack_exchange_sdk._mixins.capital import CapitalMixin
@@ -16,6 +19,7 @@ from backpack_exchange_sdk._mixins.history import HistoryMixin
 from backpack_exchange_sdk._mixins.order import OrderMixin
 from backpack_exchange_sdk._mixins.rfq import RFQMixin
 from backpack_exchange_sdk._mixins.strategy import StrategyMixin
+from backpack_exchange_sdk.recording import Recorder
 
 
 class AuthenticationClient(
@@ -66,6 +70,11 @@ class AuthenticationClient(
         max_retries: int = 0,
         backoff_factor: float = 0.1,
         status_forcelist: Optional[List[int]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce_requests: bool = False,
+        clock: Optional[ClockSync] = None,
+        recorder: Optional[Recorder] = None,
+        hooks: Optional[List[RequestHook]] = None,
     ):
         """
         Initialize the authenticated client.
@@ -79,6 +88,11 @@ class AuthenticationClient(
             max_retries: Number of retries for transient errors (default 0).
             backoff_factor: Backoff factor between retries.
             status_forcelist: HTTP status codes that trigger retries.
+            rate_limiter: Optional client-side rate limiter consulted before each request.
+            coalesce_requests: Share one in-flight request among concurrent identical GETs.
+            clock: Optional ClockSync used for X-Timestamp instead of the local clock.
+            recorder: Optional Recorder capturing every response body.
+            hooks: Optional request hooks (see backpack_exchange_sdk._base.hooks).
         """
         super().__init__(
             public_key,
@@ -89,6 +103,11 @@ class AuthenticationClient(
             max_retries=max_retries,
             backoff_factor=backoff_factor,
             status_forcelist=status_forcelist,
+            rate_limiter=rate_limiter,
+            coalesce_requests=coalesce_requests,
+            clock=clock,
+            recorder=recorder,
+            hooks=hooks,
         )
 
     def _sign_message(self, message: str) -> str:
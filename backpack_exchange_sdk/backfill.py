@@ -0,0 +1,161 @@
+"""
+Concurrent K-line backfill for Backpack Exchange.
+
+A ``[start, end)`` range is split into windows of at most
+MAX_KLINES_PER_REQUEST candles, the windows are fetched concurrently through
+the client's ``get_klines`` (so any configured RateLimiter applies), and the
+results are merged into de-duplicated KlineColumns.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional, Tuple, Union
+
+from backpack_exchange_sdk.columnar import KlineColumns
+from backpack_exchange_sdk.enums import KlineInterval, KlinePriceType
+
+# Maximum number of candles returned by one get_klines call
+MAX_KLINES_PER_REQUEST = 1000
+
+INTERVAL_SECONDS = {
+    "1m": 60,
+    "3m": 180,
+    "5m": 300,
+    "15m": 900,
+    "30m": 1800,
+    "1h": 3600,
+    "2h": 7200,
+    "4h": 14400,
+    "6h": 21600,
+    "8h": 28800,
+    "12h": 43200,
+    "1d": 86400,
+    "3d": 259200,
+    "1w": 604800,
+    "1month": 2678400,  # 31 days: an upper bound, used only to size windows
+}
+
+
+def _value(item: Any) -> Any:
+    return item.value if isinstance(item, (KlineInterval, KlinePriceType)) else item
+
+
+def interval_seconds(interval: Union[KlineInterval, str]) -> int:
+    """
+    Length of a K-line interval in seconds.
+
+    Raises:
+        ValueError: If the interval is unknown
+    """
+    try:
+        return INTERVAL_SECONDS[_value(interval)]
+    except KeyError:
+        raise ValueError(f"Unknown kline interval: {interval!r}")
+
+
+def kline_windows(
+    start_time: int,
+    end_time: int,
+    interval: Union[KlineInterval, str],
+    max_candles: int = MAX_KLINES_PER_REQUEST,
+) -> List[Tuple[int, int]]:
+    """
+    Split ``[start_time, end_time)`` (epoch seconds) into request windows.
+
+    Args:
+        start_time: Range start in seconds
+        end_time: Range end in seconds (exclusive)
+        interval: K-line interval
+        max_candles: Maximum candles per window
+
+    Returns:
+        List of ``(start, end)`` windows covering the range
+    """
+    step = interval_seconds(interval) * max_candles
+    return [(s, min(s + step, end_time)) for s in range(start_time, end_time, step)]
+
+
+def backfill_klines(
+    client: Any,
+    symbol: str,
+    interval: Union[KlineInterval, str],
+    start_time: int,
+    end_time: int,
+    price_type: Optional[Union[KlinePriceType, str]] = None,
+    max_workers: int = 8,
+    max_candles: int = MAX_KLINES_PER_REQUEST,
+) -> KlineColumns:
+    """
+    Fetch every K-line in ``[start_time, end_time)`` using concurrent requests.
+
+    Args:
+        client: PublicClient (or any object with get_klines)
+        symbol: Market symbol
+        interval: K-line interval
+        start_time: Range start in epoch seconds
+        end_time: Range end in epoch seconds (exclusive)
+        price_type: Optional K-line price type
+        max_workers: Maximum concurrent requests
+        max_candles: Candles requested per window
+
+    Returns:
+        KlineColumns sorted by start time without duplicates
+
+    Example:
+        >>> candles = backfill_klines(PublicClient(), "SOL_USDC", "1m", start, end)
+        >>> closes = candles.to_numpy()["close"]
+    """
+    interval_value = _value(interval)
+    price_type_value = _value(price_type)
+    windows = kline_windows(start_time, end_time, interval_value, max_candles)
+
+    def fetch(window: Tuple[int, int]) -> List[Any]:
+        return client.get_klines(symbol, interval_value, window[0], window[1], price_type_value) or []
+
+    if len(windows) <= 1:
+        pages = [fetch(w) for w in windows]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(windows))) as executor:
+            pages = list(executor.map(fetch, windows))
+    klines = [k for page in pages for k in page]
+    return KlineColumns.from_klines(klines).slice(start_time, end_time)
+
+
+async def backfill_klines_async(
+    client: Any,
+    symbol: str,
+    interval: Union[KlineInterval, str],
+    start_time: int,
+    end_time: int,
+    price_type: Optional[Union[KlinePriceType, str]] = None,
+    max_concurrency: int = 16,
+    max_candles: int = MAX_KLINES_PER_REQUEST,
+) -> KlineColumns:
+    """
+    Asyncio variant of backfill_klines for AsyncPublicClient.
+
+    Args:
+        client: AsyncPublicClient
+        symbol: Market symbol
+        interval: K-line interval
+        start_time: Range start in epoch seconds
+        end_time: Range end in epoch seconds (exclusive)
+        price_type: Optional K-line price type
+        max_concurrency: Maximum in-flight requests
+        max_candles: Candles requested per window
+
+    Returns:
+        KlineColumns sorted by start time without duplicates
+    """
+    interval_value = _value(interval)
+    price_type_value = _value(price_type)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(window: Tuple[int, int]) -> List[Any]:
+        async with semaphore:
+            return await client.get_klines(symbol, interval_value, window[0], window[1], price_type_value) or []
+
+    windows = kline_windows(start_time, end_time, interval_value, max_candles)
+    pages = await asyncio.gather(*(fetch(w) for w in windows))
+    klines = [k for page in pages for k in page]
+    return KlineColumns.from_klines(klines).slice(start_time, end_time)
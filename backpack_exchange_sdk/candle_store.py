@@ -0,0 +1,362 @@
+"""
+Persistent on-disk K-line store for Backpack Exchange.
+
+Candles are kept per ``(symbol, interval, price type)`` series under a root
+directory, one fixed-width binary file per KlineColumns field (int64 or
+float64, native byte order) plus a ``meta.json`` sidecar recording the
+``[start, end)`` ranges already fetched. ``sync`` fetches only the missing
+ranges through backfill_klines and merges them in; ``read`` maps the column
+files with mmap and returns zero-copy views, so nothing is parsed again.
+
+Only closed candles are stored: the part of a range within one interval of
+the current time is fetched but neither stored nor marked as covered.
+
+Layout::
+
+    <root>/<symbol>/<interval>/<price type or "default">/{start,open,...}.<generation>.bin, meta.json
+
+Appends extend the current column files. A merge (candles inserted before
+the last stored one) writes a complete new generation of files and then
+switches ``meta.json`` to it with a single atomic replace, so an interrupted
+merge leaves the previous generation intact.
+
+A store is safe to share between threads; separate processes should not
+sync the same series at the same time.
+"""
+
+import json
+import mmap
+import os
+import threading
+import time
+from array import array
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from backpack_exchange_sdk.backfill import (
+    MAX_KLINES_PER_REQUEST,
+    _value,
+    backfill_klines,
+    backfill_klines_async,
+    interval_seconds,
+)
+from backpack_exchange_sdk.columnar import KlineColumns
+from backpack_exchange_sdk.enums import KlineInterval, KlinePriceType
+
+Range = Tuple[int, int]
+
+META_FILE = "meta.json"
+META_VERSION = 1
+
+
+def merge_ranges(ranges: List[Range]) -> List[Range]:
+    """Sort ``[start, end)`` ranges and merge overlapping or touching ones."""
+    merged: List[List[int]] = []
+    for start, end in sorted(r for r in ranges if r[0] < r[1]):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+
+def subtract_ranges(start: int, end: int, covered: List[Range]) -> List[Range]:
+    """Parts of ``[start, end)`` not in the merged ``covered`` ranges."""
+    gaps = []
+    for lo, hi in covered:
+        if hi <= start:
+            continue
+        if lo >= end:
+            break
+        if lo > start:
+            gaps.append((start, lo))
+        start = max(start, hi)
+    if start < end:
+        gaps.append((start, end))
+    return gaps
+
+
+class _Series:
+    """Column files and coverage of one series."""
+
+    def __init__(self, path: str, meta: Dict[str, Any]):
+        self.path = path
+        self.meta = meta
+        self.lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+        meta_path = os.path.join(path, META_FILE)
+        if os.path.exists(meta_path):
+            with open(meta_path, encoding="utf-8") as f:
+                stored = json.load(f)
+            if stored.get("version") != META_VERSION:
+                raise ValueError(f"Unsupported candle store version in {meta_path}: {stored.get('version')!r}")
+            self.meta.update(stored)
+        self.covered: List[Range] = [tuple(r) for r in self.meta.get("covered", [])]
+        self.generation: int = self.meta.get("generation", 0)
+        self._remove_stale()
+        self._repair()
+
+    def _file(self, field: str, generation: Optional[int] = None) -> str:
+        generation = self.generation if generation is None else generation
+        return os.path.join(self.path, f"{field}.{generation}.bin")
+
+    def _remove_stale(self) -> None:
+        """Delete column files of other generations (left by an interrupted or superseded merge)."""
+        current = {os.path.basename(self._file(field)) for field in KlineColumns.TYPECODES}
+        for name in os.listdir(self.path):
+            if name.endswith(".bin") and name not in current:
+                try:
+                    os.remove(os.path.join(self.path, name))
+                except OSError:
+                    pass  # still mapped elsewhere; retried on the next open
+
+    def _repair(self) -> None:
+        """Truncate the column files to a common row count (after an interrupted append)."""
+        sizes = [
+            os.path.getsize(self._file(field)) // 8 if os.path.exists(self._file(field)) else 0
+            for field in KlineColumns.TYPECODES
+        ]
+        rows = min(sizes)
+        for field, size in zip(KlineColumns.TYPECODES, sizes):
+            if size != rows or not os.path.exists(self._file(field)):
+                with open(self._file(field), "ab") as f:
+                    f.truncate(rows * 8)
+        self.rows = rows
+
+    def columns(self) -> KlineColumns:
+        """Read-only memoryviews over the mapped column files."""
+        if self.rows == 0:
+            return KlineColumns()
+        views = {}
+        for field, typecode in KlineColumns.TYPECODES.items():
+            with open(self._file(field), "rb") as f:
+                mapped = mmap.mmap(f.fileno(), self.rows * 8, access=mmap.ACCESS_READ)
+            views[field] = memoryview(mapped).cast(typecode)
+        return KlineColumns(**views)
+
+    def write(self, candles: KlineColumns, covered: List[Range]) -> int:
+        """Merge sorted candles into the files, then record the covered ranges; returns rows added."""
+        added = 0
+        if len(candles):
+            stored = self.columns()
+            if not len(stored) or candles.start[0] > stored.start[-1]:
+                for field in KlineColumns.TYPECODES:
+                    with open(self._file(field), "ab") as f:
+                        f.write(getattr(candles, field).tobytes())
+                added = len(candles)
+            else:
+                merged = _merge(stored, candles)
+                added = len(merged) - len(stored)
+                del stored
+                generation = self.generation + 1
+                for field in KlineColumns.TYPECODES:
+                    with open(self._file(field, generation), "wb") as f:
+                        f.write(getattr(merged, field).tobytes())
+                        f.flush()
+                        os.fsync(f.fileno())
+                self._write_meta(self.covered, generation)
+                self.generation = generation
+                self._remove_stale()
+            self._repair()
+        self._write_meta(merge_ranges(self.covered + covered), self.generation)
+        return added
+
+    def _write_meta(self, covered: List[Range], generation: int) -> None:
+        """Atomically record the covered ranges and the current file generation."""
+        meta = dict(self.meta, covered=[list(r) for r in covered], generation=generation)
+        tmp = os.path.join(self.path, META_FILE + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+        os.replace(tmp, os.path.join(self.path, META_FILE))
+        self.meta = meta
+        self.covered = covered
+
+
+def _merge(stored: KlineColumns, new: KlineColumns) -> KlineColumns:
+    """Union of two sorted column sets; rows of ``new`` replace stored rows with the same start."""
+    rows = {start: (stored, i) for i, start in enumerate(stored.start)}
+    rows.update({start: (new, i) for i, start in enumerate(new.start)})
+    order = [rows[start] for start in sorted(rows)]
+    return KlineColumns(
+        **{
+            field: array(typecode, [getattr(source, field)[i] for source, i in order])
+            for field, typecode in KlineColumns.TYPECODES.items()
+        }
+    )
+
+
+class CandleStore:
+    """
+    Local K-line cache that only downloads what it does not have yet.
+
+    Example:
+        >>> store = CandleStore("~/.cache/backpack/candles")
+        >>> store.sync(PublicClient(), "SOL_USDC", "1m", start, end)
+        >>> closes = store.read("SOL_USDC", "1m", start, end).to_numpy()["close"]
+    """
+
+    def __init__(self, root: str):
+        """
+        Args:
+            root: Directory holding the series (created if missing)
+        """
+        self.root = os.path.expanduser(root)
+        self._series: Dict[Tuple[str, str, Optional[str]], _Series] = {}
+        self._lock = threading.Lock()
+
+    def _get_series(
+        self,
+        symbol: str,
+        interval: Union[KlineInterval, str],
+        price_type: Optional[Union[KlinePriceType, str]],
+    ) -> _Series:
+        key = (symbol, _value(interval), _value(price_type))
+        interval_seconds(key[1])  # validate
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                path = os.path.join(self.root, key[0], key[1], key[2] or "default")
+                meta = {"version": META_VERSION, "symbol": key[0], "interval": key[1], "price_type": key[2]}
+                series = self._series[key] = _Series(path, meta)
+            return series
+
+    def coverage(
+        self,
+        symbol: str,
+        interval: Union[KlineInterval, str],
+        price_type: Optional[Union[KlinePriceType, str]] = None,
+    ) -> List[Range]:
+        """Merged ``[start, end)`` ranges (epoch seconds) already stored for a series."""
+        return list(self._get_series(symbol, interval, price_type).covered)
+
+    def missing(
+        self,
+        symbol: str,
+        interval: Union[KlineInterval, str],
+        start_time: int,
+        end_time: int,
+        price_type: Optional[Union[KlinePriceType, str]] = None,
+    ) -> List[Range]:
+        """Parts of ``[start_time, end_time)`` that a sync would fetch."""
+        series = self._get_series(symbol, interval, price_type)
+        return subtract_ranges(start_time, end_time, series.covered)
+
+    def _closed_end(self, interval: Union[KlineInterval, str], end_time: int) -> int:
+        return min(end_time, int(time.time()) - interval_seconds(_value(interval)))
+
+    def _store(self, series: _Series, parts: List[Tuple[Range, KlineColumns]], closed_end: int) -> int:
+        candles = KlineColumns.concat([part.slice(lo, min(hi, closed_end)) for (lo, hi), part in parts])
+        covered = [(lo, min(hi, closed_end)) for (lo, hi), _ in parts]
+        return series.write(candles, covered)
+
+    def sync(
+        self,
+        client: Any,
+        symbol: str,
+        interval: Union[KlineInterval, str],
+        start_time: int,
+        end_time: int,
+        price_type: Optional[Union[KlinePriceType, str]] = None,
+        max_workers: int = 8,
+        max_candles: int = MAX_KLINES_PER_REQUEST,
+    ) -> List[Range]:
+        """
+        Fetch the missing parts of ``[start_time, end_time)`` and store them.
+
+        The download runs without holding the series lock, so ``read`` is not
+        blocked meanwhile; concurrent syncs of the same range may both fetch it.
+
+        Args:
+            client: PublicClient (or any object with get_klines)
+            symbol: Market symbol
+            interval: K-line interval
+            start_time: Range start in epoch seconds
+            end_time: Range end in epoch seconds (exclusive)
+            price_type: Optional K-line price type
+            max_workers: Maximum concurrent requests per missing range
+            max_candles: Candles requested per window
+
+        Returns:
+            The ranges that were fetched (empty if everything was stored)
+        """
+        series = self._get_series(symbol, interval, price_type)
+        gaps = subtract_ranges(start_time, end_time, series.covered)
+        parts = [
+            ((lo, hi), backfill_klines(client, symbol, interval, lo, hi, price_type, max_workers, max_candles))
+            for lo, hi in gaps
+        ]
+        with series.lock:
+            self._store(series, parts, self._closed_end(interval, end_time))
+        return gaps
+
+    async def sync_async(
+        self,
+        client: Any,
+        symbol: str,
+        interval: Union[KlineInterval, str],
+        start_time: int,
+        end_time: int,
+        price_type: Optional[Union[KlinePriceType, str]] = None,
+        max_concurrency: int = 16,
+        max_candles: int = MAX_KLINES_PER_REQUEST,
+    ) -> List[Range]:
+        """
+        Asyncio variant of sync for AsyncPublicClient.
+
+        Args:
+            client: AsyncPublicClient
+            symbol: Market symbol
+            interval: K-line interval
+            start_time: Range start in epoch seconds
+            end_time: Range end in epoch seconds (exclusive)
+            price_type: Optional K-line price type
+            max_concurrency: Maximum in-flight requests per missing range
+            max_candles: Candles requested per window
+
+        Returns:
+            The ranges that were fetched (empty if everything was stored)
+        """
+        series = self._get_series(symbol, interval, price_type)
+        gaps = subtract_ranges(start_time, end_time, series.covered)
+        parts = []
+        for lo, hi in gaps:
+            candles = await backfill_klines_async(
+                client, symbol, interval, lo, hi, price_type, max_concurrency, max_candles
+            )
+            parts.append(((lo, hi), candles))
+        with series.lock:
+            self._store(series, parts, self._closed_end(interval, end_time))
+        return gaps
+
+    def read(
+        self,
+        symbol: str,
+        interval: Union[KlineInterval, str],
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        price_type: Optional[Union[KlinePriceType, str]] = None,
+    ) -> KlineColumns:
+        """
+        Stored candles whose start lies in ``[start_time, end_time)``.
+
+        The columns are read-only memoryviews over the memory-mapped files;
+        ``to_numpy()`` returns zero-copy arrays. Ranges that were never synced
+        are simply absent (see ``missing``).
+
+        Args:
+            symbol: Market symbol
+            interval: K-line interval
+            start_time: Range start in epoch seconds (default: first stored candle)
+            end_time: Range end in epoch seconds, exclusive (default: after the last one)
+            price_type: Optional K-line price type
+
+        Returns:
+            KlineColumns sorted by start time
+        """
+        series = self._get_series(symbol, interval, price_type)
+        with series.lock:
+            columns = series.columns()
+        if start_time is None and end_time is None:
+            return columns
+        lo = start_time if start_time is not None else -(2**63)
+        hi = end_time if end_time is not None else 2**63 - 1
+        return columns.slice(lo, hi)
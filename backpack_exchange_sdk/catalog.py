@@ -0,0 +1,248 @@
+"""
+Market metadata cache for Backpack Exchange.
+
+This module provides MarketCatalog, which caches ``get_markets`` (and
+optionally ``get_assets``) with a TTL, indexes markets by symbol and
+precompiles each market's price/quantity filters.
+"""
+
+import threading
+import time
+from decimal import ROUND_DOWN, Decimal
+from typing import Any, Dict, List, Optional, Union
+
+Number = Union[Decimal, str, int, float]
+
+
+def _decimal(value: Any) -> Optional[Decimal]:
+    if value is None or value == "":
+        return None
+    return Decimal(str(value))
+
+
+class MarketFilters:
+    """
+    Price and quantity rules of a market, parsed once into Decimals.
+
+    Attributes:
+        tick_size: Price increment
+        min_price, max_price: Allowed price range (max may be None)
+        step_size: Quantity increment
+        min_quantity, max_quantity: Allowed quantity range (max may be None)
+    """
+
+    __slots__ = ("tick_size", "min_price", "max_price", "step_size", "min_quantity", "max_quantity")
+
+    def __init__(self, market: Dict[str, Any]):
+        filters = market.get("filters") or {}
+        price = filters.get("price") or {}
+        quantity = filters.get("quantity") or {}
+        self.tick_size = _decimal(price.get("tickSize"))
+        self.min_price = _decimal(price.get("minPrice"))
+        self.max_price = _decimal(price.get("maxPrice"))
+        self.step_size = _decimal(quantity.get("stepSize"))
+        self.min_quantity = _decimal(quantity.get("minQuantity"))
+        self.max_quantity = _decimal(quantity.get("maxQuantity"))
+
+    @staticmethod
+    def _round(value: Number, increment: Optional[Decimal], rounding: str) -> Decimal:
+        value = Decimal(str(value))
+        if not increment:
+            return value
+        return (value / increment).to_integral_value(rounding=rounding) * increment
+
+    def round_price(self, price: Number, rounding: str = ROUND_DOWN) -> Decimal:
+        """Round a price to the market tick size."""
+        return self._round(price, self.tick_size, rounding)
+
+    def round_quantity(self, quantity: Number, rounding: str = ROUND_DOWN) -> Decimal:
+        """Round a quantity to the market step size."""
+        return self._round(quantity, self.step_size, rounding)
+
+    def validate(self, price: Optional[Number] = None, quantity: Optional[Number] = None) -> List[str]:
+        """
+        Check a price and/or quantity against the filters.
+
+        Returns:
+            List of violated rules (empty if valid)
+        """
+        errors = []
+        if price is not None:
+            value = Decimal(str(price))
+            if self.min_price is not None and value < self.min_price:
+                errors.append(f"price {value} below minPrice {self.min_price}")
+            if self.max_price is not None and value > self.max_price:
+                errors.append(f"price {value} above maxPrice {self.max_price}")
+            if self.tick_size and value % self.tick_size:
+                errors.append(f"price {value} not a multiple of tickSize {self.tick_size}")
+        if quantity is not None:
+            value = Decimal(str(quantity))
+            if self.min_quantity is not None and value < self.min_quantity:
+                errors.append(f"quantity {value} below minQuantity {self.min_quantity}")
+            if self.max_quantity is not None and value > self.max_quantity:
+                errors.append(f"quantity {value} above maxQuantity {self.max_quantity}")
+            if self.step_size and value % self.step_size:
+                errors.append(f"quantity {value} not a multiple of stepSize {self.step_size}")
+        return errors
+
+
+class MarketCatalog:
+    """
+    TTL cache of market (and asset) metadata with an O(1) symbol index.
+
+    Reads never block on the network while a fresh snapshot is cached. With
+    ``background=True`` the snapshot is refreshed on a daemon thread every
+    ``ttl`` seconds; otherwise an expired snapshot is refreshed on the next
+    read. ``MarketCatalog.shared()`` returns one catalog per base URL, which
+    is what ``client.market_catalog`` uses on every client.
+
+    Example:
+        >>> catalog = MarketCatalog(PublicClient(), ttl=300)
+        >>> filters = catalog.filters("SOL_USDC")
+        >>> price = filters.round_price("141.23456")
+    """
+
+    _shared: Dict[str, "MarketCatalog"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        client: Any = None,
+        ttl: float = 300.0,
+        background: bool = False,
+        include_assets: bool = False,
+    ):
+        """
+        Initialize the catalog. Nothing is fetched until first use.
+
+        Args:
+            client: Client providing get_markets (and get_assets); defaults to a new PublicClient
+            ttl: Seconds a snapshot stays fresh
+            background: Refresh on a daemon thread instead of on read
+            include_assets: Also cache get_assets, indexed by symbol
+        """
+        if client is None:
+            from backpack_exchange_sdk.public import PublicClient
+
+            client = PublicClient()
+        self.client = client
+        self.ttl = ttl
+        self.include_assets = include_assets
+        self.updated: Optional[float] = None
+        self._markets: Dict[str, Dict[str, Any]] = {}
+        self._filters: Dict[str, MarketFilters] = {}
+        self._assets: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        if background:
+            self.start()
+
+    @classmethod
+    def shared(cls, base_url: Optional[str] = None, client: Any = None, **kwargs: Any) -> "MarketCatalog":
+        """
+        Return the process-wide catalog for a base URL, creating it on first use.
+
+        Args:
+            base_url: API base URL (default: the production API)
+            client: Client the catalog fetches with when it is created, so refreshes go through
+                its rate limiter, hooks and recorder (default: a new PublicClient for base_url)
+            **kwargs: Passed to the constructor when the catalog is created
+        """
+        from backpack_exchange_sdk.public import PublicClient
+
+        key = base_url or PublicClient.DEFAULT_BASE_URL
+        with cls._shared_lock:
+            catalog = cls._shared.get(key)
+            if catalog is None:
+                catalog = cls._shared[key] = cls(client or PublicClient(base_url=key), **kwargs)
+        return catalog
+
+    @property
+    def fresh(self) -> bool:
+        """Whether the cached snapshot is within its TTL."""
+        return self.updated is not None and time.monotonic() - self.updated < self.ttl
+
+    def refresh(self) -> None:
+        """Fetch markets (and assets) and atomically replace the snapshot."""
+        markets = self.client.get_markets() or []
+        assets = []
+        if self.include_assets:
+            assets = self.client.get_assets() or []
+        index = {market["symbol"]: market for market in markets}
+        filters = {symbol: MarketFilters(market) for symbol, market in index.items()}
+        asset_index = {asset["symbol"]: asset for asset in assets if "symbol" in asset}
+        with self._lock:
+            self._markets = index
+            self._filters = filters
+            self._assets = asset_index
+            self.updated = time.monotonic()
+
+    def _ensure(self) -> None:
+        if not self.fresh and (self._thread is None or self.updated is None):
+            self.refresh()
+
+    def market(self, symbol: str) -> Dict[str, Any]:
+        """
+        Market metadata for a symbol.
+
+        Raises:
+            KeyError: If the market does not exist
+        """
+        self._ensure()
+        return self._markets[symbol]
+
+    __getitem__ = market
+
+    def __contains__(self, symbol: str) -> bool:
+        self._ensure()
+        return symbol in self._markets
+
+    def filters(self, symbol: str) -> MarketFilters:
+        """
+        Precompiled filters for a symbol.
+
+        Raises:
+            KeyError: If the market does not exist
+        """
+        self._ensure()
+        return self._filters[symbol]
+
+    def asset(self, symbol: str) -> Dict[str, Any]:
+        """
+        Asset metadata for a symbol (requires ``include_assets=True``).
+
+        Raises:
+            KeyError: If the asset does not exist
+        """
+        self._ensure()
+        return self._assets[symbol]
+
+    def symbols(self) -> List[str]:
+        """All market symbols."""
+        self._ensure()
+        return list(self._markets)
+
+    def start(self) -> None:
+        """Start refreshing on a daemon thread every ``ttl`` seconds."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="MarketCatalog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background refresh thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception:
+                # Keep serving the previous snapshot; retry on the next tick.
+                pass
+            self._stop.wait(self.ttl)
@@ -0,0 +1,274 @@
+"""
+Columnar containers for Backpack Exchange market data.
+
+Columns are stored as contiguous typed ``array.array`` buffers (int64 for
+timestamps, ids and counts, float64 for prices and volumes, int8 for sides
+and flags). ``to_numpy()`` views them as NumPy arrays without copying when
+NumPy is installed.
+
+Methods that support it return these directly when called with
+``as_arrays=True``: ``get_klines`` (KlineColumns), ``get_recent_trades`` and
+``get_historical_trades`` (TradeColumns) and ``get_fill_history``
+(FillColumns).
+"""
+
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_EPOCH = datetime(1970, 1, 1)
+
+_NUMPY_TYPES = {"q": "int64", "d": "float64", "b": "int8"}
+_SIDES = {"Bid": 1, "Ask": -1}
+
+
+def parse_timestamp(value: Union[str, int, float]) -> int:
+    """
+    Convert a kline time to UTC epoch seconds.
+
+    Accepts epoch seconds/milliseconds (numbers or digit strings) and
+    ISO-8601 style strings such as ``'2024-01-01 00:00:00'``.
+    """
+    if isinstance(value, (int, float)):
+        seconds = int(value)
+    elif value.isdigit():
+        seconds = int(value)
+    else:
+        text = value.rstrip("Z")
+        if "+" in text[10:]:
+            text = text[:10] + text[10:].split("+", 1)[0]
+        return int((datetime.fromisoformat(text) - _EPOCH).total_seconds())
+    return seconds // 1000 if seconds > 10_000_000_000 else seconds
+
+
+def parse_timestamp_ms(value: Union[str, int]) -> int:
+    """Epoch milliseconds from an integer, a digit string or a naive ISO-8601 string (UTC)."""
+    if isinstance(value, int):
+        return value
+    if value.isdigit():
+        return int(value)
+    return int((datetime.fromisoformat(value.rstrip("Z")) - _EPOCH).total_seconds() * 1000)
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("numpy is required for to_numpy(); install it with `pip install numpy`")
+
+
+class Columns:
+    """
+    Base class of the column containers.
+
+    Subclasses declare ``TYPECODES`` (field name to ``array`` typecode, in
+    column order) and ``KEY``, the int64 field rows are sorted by.
+    """
+
+    TYPECODES: Dict[str, str] = {}
+    KEY = ""
+
+    __slots__ = ()
+
+    def __init__(self, **columns: array):
+        for field, typecode in self.TYPECODES.items():
+            setattr(self, field, columns.get(field, array(typecode)))
+
+    def __len__(self) -> int:
+        return len(getattr(self, self.KEY))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} rows)"
+
+    def _sorted(self) -> "Columns":
+        """Rows ordered by ``KEY`` (stable); returns self if already sorted."""
+        keys = getattr(self, self.KEY)
+        if all(keys[i] <= keys[i + 1] for i in range(len(keys) - 1)):
+            return self
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        return type(self)(
+            **{
+                field: array(typecode, [getattr(self, field)[i] for i in order])
+                for field, typecode in self.TYPECODES.items()
+            }
+        )
+
+    @classmethod
+    def concat(cls, parts: List["Columns"]) -> "Columns":
+        """Concatenate sorted, non-overlapping parts in order."""
+        merged = cls()
+        for part in parts:
+            for field in cls.TYPECODES:
+                getattr(merged, field).extend(getattr(part, field))
+        return merged
+
+    def slice(self, start_time: int, end_time: int) -> "Columns":
+        """Rows whose ``KEY`` lies in ``[start_time, end_time)``."""
+        keys = getattr(self, self.KEY)
+        lo = bisect_left(keys, start_time)
+        hi = bisect_left(keys, end_time)
+        return type(self)(**{field: getattr(self, field)[lo:hi] for field in self.TYPECODES})
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Zero-copy NumPy views of every column (requires numpy)."""
+        _require_numpy()
+        return {
+            field: np.frombuffer(getattr(self, field), dtype=_NUMPY_TYPES[typecode])
+            for field, typecode in self.TYPECODES.items()
+        }
+
+    def to_dict(self) -> Dict[str, array]:
+        """Mapping of field name to column."""
+        return {field: getattr(self, field) for field in self.TYPECODES}
+
+
+class KlineColumns(Columns):
+    """
+    K-lines stored column-wise, sorted by start time.
+
+    Attributes:
+        start: Candle open times in epoch seconds (int64)
+        open, high, low, close: Prices (float64)
+        volume: Base asset volume (float64)
+        quote_volume: Quote asset volume (float64)
+        trades: Number of trades (int64)
+    """
+
+    INT_FIELDS = ("start", "trades")
+    FLOAT_FIELDS = ("open", "high", "low", "close", "volume", "quote_volume")
+    FIELDS = ("start", "open", "high", "low", "close", "volume", "quote_volume", "trades")
+    TYPECODES = {
+        "start": "q",
+        "open": "d",
+        "high": "d",
+        "low": "d",
+        "close": "d",
+        "volume": "d",
+        "quote_volume": "d",
+        "trades": "q",
+    }
+    KEY = "start"
+
+    __slots__ = FIELDS
+
+    @classmethod
+    def from_klines(cls, klines: Iterable[Dict[str, Any]]) -> "KlineColumns":
+        """
+        Build columns from ``get_klines`` records.
+
+        Records are sorted by start time and de-duplicated; when two records
+        share a start time the later one wins.
+        """
+        by_start = {parse_timestamp(k["start"]): k for k in klines}
+        starts = sorted(by_start)
+        rows = [by_start[s] for s in starts]
+
+        def floats(key: str) -> array:
+            return array("d", [float(r.get(key) or "nan") for r in rows])
+
+        return cls(
+            start=array("q", starts),
+            open=floats("open"),
+            high=floats("high"),
+            low=floats("low"),
+            close=floats("close"),
+            volume=floats("volume"),
+            quote_volume=floats("quoteVolume"),
+            trades=array("q", [int(r.get("trades") or 0) for r in rows]),
+        )
+
+
+class TradeColumns(Columns):
+    """
+    Public trades stored column-wise, sorted by timestamp.
+
+    Attributes:
+        timestamp: Trade times in epoch milliseconds (int64)
+        id: Trade ids (int64, -1 when missing)
+        price, quantity, quote_quantity: Trade price and sizes (float64)
+        is_buyer_maker: 1 if the buyer was the maker, else 0 (int8)
+    """
+
+    FIELDS = ("timestamp", "id", "price", "quantity", "quote_quantity", "is_buyer_maker")
+    TYPECODES = {
+        "timestamp": "q",
+        "id": "q",
+        "price": "d",
+        "quantity": "d",
+        "quote_quantity": "d",
+        "is_buyer_maker": "b",
+    }
+    KEY = "timestamp"
+
+    __slots__ = FIELDS
+
+    @classmethod
+    def from_trades(cls, trades: Iterable[Dict[str, Any]]) -> "TradeColumns":
+        """Build columns from ``get_recent_trades`` / ``get_historical_trades`` records in one pass."""
+        columns = cls()
+        timestamp, trade_id = columns.timestamp.append, columns.id.append
+        price, quantity, quote = columns.price.append, columns.quantity.append, columns.quote_quantity.append
+        maker = columns.is_buyer_maker.append
+        for t in trades:
+            timestamp(parse_timestamp_ms(t["timestamp"]))
+            ident = t.get("id")
+            trade_id(-1 if ident is None else int(ident))
+            price(float(t["price"]))
+            quantity(float(t["quantity"]))
+            quote(float(t.get("quoteQuantity") or "nan"))
+            maker(1 if t.get("isBuyerMaker") else 0)
+        return columns._sorted()
+
+
+class FillColumns(Columns):
+    """
+    Account fills stored column-wise, sorted by timestamp.
+
+    Symbols are not stored; request fills per symbol when mixing markets.
+
+    Attributes:
+        timestamp: Fill times in epoch milliseconds (int64)
+        trade_id: Trade ids (int64, -1 when missing)
+        order_id: Order ids (int64)
+        side: 1 for Bid, -1 for Ask (int8)
+        price, quantity, fee: Fill price, size and fee (float64)
+        is_maker: 1 for maker fills, else 0 (int8)
+    """
+
+    FIELDS = ("timestamp", "trade_id", "order_id", "side", "price", "quantity", "fee", "is_maker")
+    TYPECODES = {
+        "timestamp": "q",
+        "trade_id": "q",
+        "order_id": "q",
+        "side": "b",
+        "price": "d",
+        "quantity": "d",
+        "fee": "d",
+        "is_maker": "b",
+    }
+    KEY = "timestamp"
+
+    __slots__ = FIELDS
+
+    @classmethod
+    def from_fills(cls, fills: Iterable[Dict[str, Any]]) -> "FillColumns":
+        """Build columns from ``get_fill_history`` records in one pass."""
+        columns = cls()
+        timestamp, trade_id, order_id = columns.timestamp.append, columns.trade_id.append, columns.order_id.append
+        side, price, quantity = columns.side.append, columns.price.append, columns.quantity.append
+        fee, maker = columns.fee.append, columns.is_maker.append
+        for f in fills:
+            timestamp(parse_timestamp_ms(f["timestamp"]))
+            ident = f.get("tradeId")
+            trade_id(-1 if ident is None else int(ident))
+            order_id(int(f["orderId"]))
+            side(_SIDES.get(f.get("side"), 0))
+            price(float(f["price"]))
+            quantity(float(f["quantity"]))
+            fee(float(f.get("fee") or 0))
+            maker(1 if f.get("isMaker") else 0)
+        return columns._sorted()
@@ -0,0 +1,198 @@
+"""
+Message dispatch between WebSocket readers and user callbacks.
+
+The Dispatcher queues messages per stream and runs callbacks on a pool of
+worker threads, so a slow handler delays only its own stream and never the
+socket reader. Messages of one stream are delivered in order by one worker
+at a time. Each stream's queue is bounded, with an overflow policy:
+
+- ``drop_oldest``: discard the oldest queued message (default)
+- ``conflate``: keep only the latest message, e.g. for ``bookTicker``
+- ``block``: make the reader wait for space (back-pressure)
+"""
+
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+DROP_OLDEST = "drop_oldest"
+CONFLATE = "conflate"
+BLOCK = "block"
+POLICIES = (DROP_OLDEST, CONFLATE, BLOCK)
+
+
+def policy_for(stream: str, policies: Optional[Dict[str, str]], default: str) -> str:
+    """
+    Overflow policy of a stream.
+
+    Args:
+        stream: Stream name (e.g. 'bookTicker.SOL_USDC')
+        policies: Policies keyed by stream name or stream type (e.g. 'bookTicker')
+        default: Policy for streams not listed
+
+    Returns:
+        The policy name
+    """
+    if policies:
+        if stream in policies:
+            return policies[stream]
+        return policies.get(stream.split(".", 1)[0], default)
+    return default
+
+
+class _StreamQueue:
+    __slots__ = ("items", "policy", "maxsize", "scheduled", "delivered", "dropped", "conflated")
+
+    def __init__(self, policy: str, maxsize: int):
+        self.items: Deque[Tuple[Any, Sequence[Callable]]] = deque()
+        self.policy = policy
+        self.maxsize = 1 if policy == CONFLATE else maxsize
+        self.scheduled = False
+        self.delivered = 0
+        self.dropped = 0
+        self.conflated = 0
+
+
+class Dispatcher:
+    """
+    Per-stream bounded queues drained by a pool of worker threads.
+
+    Example:
+        >>> dispatcher = Dispatcher(workers=4, policies={"bookTicker": "conflate"})
+        >>> ws = WebSocketClient(dispatcher=dispatcher)
+        >>> ws.subscribe(["bookTicker.SOL_USDC", "depth.SOL_USDC"], handler)
+        >>> dispatcher.stats()
+    """
+
+    def __init__(
+        self,
+        workers: int = 4,
+        queue_size: int = 1000,
+        policy: str = DROP_OLDEST,
+        policies: Optional[Dict[str, str]] = None,
+        batch: int = 64,
+    ):
+        """
+        Start the worker threads.
+
+        Args:
+            workers: Number of worker threads
+            queue_size: Maximum queued messages per stream
+            policy: Overflow policy for streams not in ``policies``
+            policies: Overflow policies keyed by stream name or stream type
+            batch: Messages a worker delivers from one stream before yielding to others
+        """
+        for name in [policy, *(policies or {}).values()]:
+            if name not in POLICIES:
+                raise ValueError(f"Unknown overflow policy {name!r}; expected one of {POLICIES}")
+        if workers < 1 or queue_size < 1:
+            raise ValueError("workers and queue_size must be positive")
+        self.queue_size = queue_size
+        self.policy = policy
+        self.policies = dict(policies or {})
+        self.batch = batch
+        self.errors = 0
+        self._streams: Dict[str, _StreamQueue] = {}
+        self._ready: Deque[str] = deque()
+        self._lock = threading.Lock()
+        self._work = threading.Condition(self._lock)
+        self._space = threading.Condition(self._lock)
+        self._closed = False
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"Dispatcher-{i}", daemon=True) for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, stream: str, data: Any, callbacks: Sequence[Callable]) -> None:
+        """
+        Queue a message for the stream's callbacks.
+
+        Called from the socket reader; returns immediately unless the stream
+        uses the ``block`` policy and its queue is full.
+
+        Args:
+            stream: Stream name
+            data: Message payload passed to every callback
+            callbacks: Callbacks to invoke with ``data``
+        """
+        with self._lock:
+            if self._closed:
+                return
+            queue = self._streams.get(stream)
+            if queue is None:
+                queue = _StreamQueue(policy_for(stream, self.policies, self.policy), self.queue_size)
+                self._streams[stream] = queue
+            if len(queue.items) >= queue.maxsize:
+                if queue.policy == BLOCK:
+                    while len(queue.items) >= queue.maxsize and not self._closed:
+                        self._space.wait()
+                    if self._closed:
+                        return
+                else:
+                    queue.items.popleft()
+                    if queue.policy == CONFLATE:
+                        queue.conflated += 1
+                    else:
+                        queue.dropped += 1
+            queue.items.append((data, callbacks))
+            if not queue.scheduled:
+                queue.scheduled = True
+                self._ready.append(stream)
+                self._work.notify()
+
+    def _worker(self) -> None:
+        while True:
+            with self._lock:
+                while not self._ready and not self._closed:
+                    self._work.wait()
+                if self._closed:
+                    return
+                stream = self._ready.popleft()
+                queue = self._streams[stream]
+                batch: List[Tuple[Any, Sequence[Callable]]] = []
+                while queue.items and len(batch) < self.batch:
+                    batch.append(queue.items.popleft())
+                if queue.policy == BLOCK:
+                    self._space.notify_all()
+            for data, callbacks in batch:
+                for callback in callbacks:
+                    try:
+                        callback(data)
+                    except Exception as e:
+                        self.errors += 1
+                        print(f"Error processing message on {stream}: {e}")
+            with self._lock:
+                queue.delivered += len(batch)
+                if queue.items:
+                    self._ready.append(stream)
+                    self._work.notify()
+                else:
+                    queue.scheduled = False
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Per-stream counters.
+
+        Returns:
+            ``{stream: {"depth", "delivered", "dropped", "conflated"}}``
+        """
+        with self._lock:
+            return {
+                stream: {
+                    "depth": len(queue.items),
+                    "delivered": queue.delivered,
+                    "dropped": queue.dropped,
+                    "conflated": queue.conflated,
+                }
+                for stream, queue in self._streams.items()
+            }
+
+    def close(self) -> None:
+        """Stop the workers; queued messages are discarded."""
+        with self._lock:
+            self._closed = True
+            self._work.notify_all()
+            self._space.notify_all()
+        for thread in self._threads:
+            thread.join(timeout=5)
@@ -0,0 +1,225 @@
+"""
+Compact response models for Backpack Exchange hot endpoints.
+
+Methods that support it return these instead of dicts when called with
+``typed=True``. Models keep the raw values in ``__slots__`` (no per-record
+dict) and parse numeric fields on first access: decimal strings become
+``Decimal``, ids and counts ``int`` and timestamps epoch milliseconds.
+Parsed values are cached on the record.
+
+``decode_many`` is the bulk path: it resolves the slot setters once per
+class and fills each record without building intermediate objects.
+"""
+
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from backpack_exchange_sdk.columnar import parse_timestamp_ms as _timestamp_ms
+
+Parser = Optional[Callable[[Any], Any]]
+
+
+def _int(value: Any) -> int:
+    return value if isinstance(value, int) else int(value)
+
+
+def _us_to_ms(value: Any) -> int:
+    return _int(value) // 1000
+
+
+def _levels(value: List[List[str]]) -> List[Tuple[Decimal, Decimal]]:
+    return [(Decimal(price), Decimal(quantity)) for price, quantity in value]
+
+
+class _Lazy:
+    """Descriptor that parses the raw slot value on first access and caches the result."""
+
+    __slots__ = ("name", "slot", "bit", "parse")
+
+    def __init__(self, name: str, slot: Any, bit: int, parse: Callable[[Any], Any]):
+        self.name = name
+        self.slot = slot
+        self.bit = bit
+        self.parse = parse
+
+    def __get__(self, obj: Any, owner: Any = None) -> Any:
+        if obj is None:
+            return self
+        value = self.slot.__get__(obj, owner)
+        if value is None or obj._parsed & self.bit:
+            return value
+        value = self.parse(value)
+        self.slot.__set__(obj, value)
+        obj._parsed |= self.bit
+        return value
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        self.slot.__set__(obj, value)
+        obj._parsed |= self.bit
+
+
+def _slots(fields: Tuple[Tuple[str, str, Parser], ...]) -> Tuple[str, ...]:
+    """Slot names for ``FIELDS``: lazily parsed fields are stored under ``_<name>``."""
+    return tuple(f"_{name}" if parse else name for name, _, parse in fields)
+
+
+class Model:
+    """
+    Base class of the response models.
+
+    Subclasses declare ``FIELDS`` as ``(attribute, response key, parser)``
+    triples (``parser`` None for values used as-is) and
+    ``__slots__ = _slots(FIELDS)``. Response keys not listed are dropped.
+    """
+
+    __slots__ = ("_parsed",)
+
+    FIELDS: Tuple[Tuple[str, str, Parser], ...] = ()
+    _setters: List[Tuple[Callable[[Any, Any], None], str]] = []
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        setters = []
+        bit = 1
+        for name, key, parse in cls.FIELDS:
+            if parse:
+                slot = cls.__dict__[f"_{name}"]
+                setattr(cls, name, _Lazy(name, slot, bit, parse))
+                bit <<= 1
+            else:
+                slot = cls.__dict__[name]
+            setters.append((slot.__set__, key))
+        cls._setters = setters
+
+    @classmethod
+    def from_dict(cls, record: Dict[str, Any]) -> "Model":
+        """Wrap one response record."""
+        return cls.decode_many((record,))[0]
+
+    @classmethod
+    def decode_many(cls, records: Iterable[Dict[str, Any]]) -> List["Model"]:
+        """Wrap a list of response records."""
+        new = cls.__new__
+        setters = cls._setters
+        result = []
+        for record in records:
+            obj = new(cls)
+            obj._parsed = 0
+            get = record.get
+            for set_value, key in setters:
+                set_value(obj, get(key))
+            result.append(obj)
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Mapping of attribute name to parsed value."""
+        return {name: getattr(self, name) for name, _, _ in self.FIELDS}
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name, _, _ in self.FIELDS[:4])
+        return f"{type(self).__name__}({fields}, ...)"
+
+
+class Depth(Model):
+    """
+    Order book snapshot from ``get_depth``.
+
+    Attributes:
+        bids, asks: ``(price, quantity)`` Decimal pairs, best bid last and best ask first
+        last_update_id: Update id of the snapshot
+        timestamp: Matching engine time in epoch milliseconds (the API reports microseconds)
+    """
+
+    FIELDS = (
+        ("bids", "bids", _levels),
+        ("asks", "asks", _levels),
+        ("last_update_id", "lastUpdateId", _int),
+        ("timestamp", "timestamp", _us_to_ms),
+    )
+    __slots__ = _slots(FIELDS)
+
+    def __repr__(self) -> str:
+        return f"Depth(last_update_id={self.last_update_id!r})"
+
+
+class Trade(Model):
+    """Public trade from ``get_recent_trades`` / ``get_historical_trades``."""
+
+    FIELDS = (
+        ("id", "id", _int),
+        ("price", "price", Decimal),
+        ("quantity", "quantity", Decimal),
+        ("quote_quantity", "quoteQuantity", Decimal),
+        ("timestamp", "timestamp", _timestamp_ms),
+        ("is_buyer_maker", "isBuyerMaker", None),
+    )
+    __slots__ = _slots(FIELDS)
+
+
+class Fill(Model):
+    """Account fill from ``get_fill_history``."""
+
+    FIELDS = (
+        ("trade_id", "tradeId", _int),
+        ("order_id", "orderId", None),
+        ("client_id", "clientId", None),
+        ("symbol", "symbol", None),
+        ("side", "side", None),
+        ("price", "price", Decimal),
+        ("quantity", "quantity", Decimal),
+        ("fee", "fee", Decimal),
+        ("fee_symbol", "feeSymbol", None),
+        ("is_maker", "isMaker", None),
+        ("system_order_type", "systemOrderType", None),
+        ("timestamp", "timestamp", _timestamp_ms),
+    )
+    __slots__ = _slots(FIELDS)
+
+
+class OpenOrder(Model):
+    """Open order from ``get_open_orders``."""
+
+    FIELDS = (
+        ("id", "id", None),
+        ("client_id", "clientId", None),
+        ("symbol", "symbol", None),
+        ("side", "side", None),
+        ("order_type", "orderType", None),
+        ("status", "status", None),
+        ("time_in_force", "timeInForce", None),
+        ("price", "price", Decimal),
+        ("quantity", "quantity", Decimal),
+        ("quote_quantity", "quoteQuantity", Decimal),
+        ("executed_quantity", "executedQuantity", Decimal),
+        ("executed_quote_quantity", "executedQuoteQuantity", Decimal),
+        ("trigger_price", "triggerPrice", Decimal),
+        ("post_only", "postOnly", None),
+        ("reduce_only", "reduceOnly", None),
+        ("self_trade_prevention", "selfTradePrevention", None),
+        ("strategy_id", "strategyId", None),
+        ("created_at", "createdAt", _timestamp_ms),
+    )
+    __slots__ = _slots(FIELDS)
+
+
+class Ticker(Model):
+    """Market statistics from ``get_tickers``."""
+
+    FIELDS = (
+        ("symbol", "symbol", None),
+        ("first_price", "firstPrice", Decimal),
+        ("last_price", "lastPrice", Decimal),
+        ("price_change", "priceChange", Decimal),
+        ("price_change_percent", "priceChangePercent", Decimal),
+        ("high", "high", Decimal),
+        ("low", "low", Decimal),
+        ("volume", "volume", Decimal),
+        ("quote_volume", "quoteVolume", Decimal),
+        ("trades", "trades", _int),
+    )
+    __slots__ = _slots(FIELDS)
@@ -0,0 +1,266 @@
+"""
+Live open-order tracking for Backpack Exchange.
+
+This module provides the OrderTracker class, which keeps an in-memory index
+of open orders from the private ``account.orderUpdate`` stream and
+reconciles it against ``get_open_orders`` when (re)attached.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+# Order update event fields mapped to the keys used by get_open_orders.
+EVENT_FIELDS = {
+    "i": "id",
+    "c": "clientId",
+    "s": "symbol",
+    "S": "side",
+    "o": "orderType",
+    "f": "timeInForce",
+    "p": "price",
+    "P": "triggerPrice",
+    "q": "quantity",
+    "Q": "quoteQuantity",
+    "z": "executedQuantity",
+    "Z": "executedQuoteQuantity",
+    "X": "status",
+    "V": "selfTradePrevention",
+}
+
+OPEN_STATUSES = frozenset({"New", "PartiallyFilled", "TriggerPending"})
+
+
+class OrderTracker:
+    """
+    In-memory index of open orders maintained from ``account.orderUpdate``.
+
+    Orders are stored as dicts shaped like ``get_open_orders`` results and
+    indexed by order id, client id and symbol, so lookups need no network
+    call. Orders leave the index when they reach a terminal status (Filled,
+    Cancelled, Expired, TriggerFailed); late events for recently closed
+    orders are ignored.
+
+    Example:
+        >>> tracker = OrderTracker(client=AuthenticationClient(key, secret))
+        >>> tracker.attach(WebSocketClient(key, secret))
+        >>> tracker.open_orders("SOL_USDC")
+    """
+
+    def __init__(
+        self,
+        client: Any = None,
+        symbol: Optional[str] = None,
+        on_update: Optional[Callable[[Dict[str, Any], Dict[str, Any]], None]] = None,
+        closed_history: int = 10000,
+    ):
+        """
+        Initialize an empty tracker.
+
+        Args:
+            client: Optional authenticated client providing ``get_open_orders`` for reconciliation
+            symbol: Track only this market (default: all markets)
+            on_update: Optional callback ``(order, event)`` invoked after each applied event
+            closed_history: Number of closed order ids remembered to drop late events
+        """
+        self.client = client
+        self.symbol = symbol
+        self.on_update = on_update
+        self.closed_history = closed_history
+        self.reconciles = 0
+        self._orders: Dict[str, Dict[str, Any]] = {}
+        self._by_client_id: Dict[int, str] = {}
+        self._by_symbol: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._updated: Dict[str, int] = {}
+        self._closed: "OrderedDict[str, str]" = OrderedDict()
+        self._buffer: Optional[List[Dict[str, Any]]] = None
+        self._lock = threading.RLock()
+
+    @property
+    def stream(self) -> str:
+        """The order update stream name for this tracker."""
+        if self.symbol:
+            return f"account.orderUpdate.{self.symbol}"
+        return "account.orderUpdate"
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def __contains__(self, order_id: str) -> bool:
+        return order_id in self._orders
+
+    def get(self, order_id: str) -> Optional[Dict[str, Any]]:
+        """Open order by exchange order id, or None."""
+        return self._orders.get(order_id)
+
+    def by_client_id(self, client_id: int) -> Optional[Dict[str, Any]]:
+        """Open order by client id, or None."""
+        order_id = self._by_client_id.get(int(client_id))
+        return self._orders.get(order_id) if order_id is not None else None
+
+    def open_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Open orders, optionally for one market.
+
+        Args:
+            symbol: Market symbol filter
+
+        Returns:
+            List of open orders
+        """
+        with self._lock:
+            if symbol is None:
+                return list(self._orders.values())
+            return list(self._by_symbol.get(symbol, {}).values())
+
+    def closed_status(self, order_id: str) -> Optional[str]:
+        """Terminal status of a recently closed order, or None."""
+        return self._closed.get(order_id)
+
+    def _index(self, order: Dict[str, Any]) -> None:
+        order_id = order["id"]
+        self._orders[order_id] = order
+        self._by_symbol.setdefault(order["symbol"], {})[order_id] = order
+        if order.get("clientId") is not None:
+            self._by_client_id[int(order["clientId"])] = order_id
+
+    def _remove(self, order_id: str, status: str) -> None:
+        order = self._orders.pop(order_id, None)
+        self._updated.pop(order_id, None)
+        if order is not None:
+            orders = self._by_symbol.get(order["symbol"])
+            if orders is not None:
+                orders.pop(order_id, None)
+                if not orders:
+                    del self._by_symbol[order["symbol"]]
+            if order.get("clientId") is not None:
+                self._by_client_id.pop(int(order["clientId"]), None)
+        self._closed[order_id] = status
+        while len(self._closed) > self.closed_history:
+            self._closed.popitem(last=False)
+
+    def _apply(self, event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        order_id = event.get("i")
+        if order_id is None or order_id in self._closed:
+            return None
+        engine_time = event.get("T")
+        if engine_time is not None and self._updated.get(order_id, -1) > engine_time:
+            return None
+        order = dict(self._orders.get(order_id) or {})
+        for key, field in EVENT_FIELDS.items():
+            if key in event:
+                order[field] = event[key]
+        status = order.get("status")
+        if status is None:
+            order["status"] = status = "New"
+        if status in OPEN_STATUSES:
+            self._index(order)
+            if engine_time is not None:
+                self._updated[order_id] = engine_time
+        else:
+            self._remove(order_id, status)
+        return order
+
+    def apply_update(self, event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Apply an ``account.orderUpdate`` event.
+
+        Suitable as a WebSocketClient callback. Events arriving during a
+        reconciliation are buffered and replayed on top of the snapshot.
+
+        Args:
+            event: Order update event
+
+        Returns:
+            The order after the update, or None if the event was ignored or buffered
+        """
+        with self._lock:
+            if self._buffer is not None:
+                self._buffer.append(event)
+                return None
+            order = self._apply(event)
+        if order is not None and self.on_update is not None:
+            self.on_update(order, event)
+        return order
+
+    def load(self, orders: List[Dict[str, Any]]) -> None:
+        """
+        Replace the index with a ``get_open_orders`` snapshot and replay buffered events.
+
+        Args:
+            orders: Open orders as returned by ``get_open_orders``
+        """
+        with self._lock:
+            self._orders = {}
+            self._by_client_id = {}
+            self._by_symbol = {}
+            self._updated = {}
+            for order in orders:
+                if self.symbol is None or order.get("symbol") == self.symbol:
+                    self._closed.pop(order["id"], None)
+                    self._index(dict(order))
+            self._replay()
+
+    def _replay(self) -> None:
+        buffered, self._buffer = self._buffer or [], None
+        for event in buffered:
+            self._apply(event)
+
+    def reconcile(self) -> None:
+        """Re-seed the index from the client's ``get_open_orders``."""
+        with self._lock:
+            self._buffer = []
+        self.reconciles += 1
+        try:
+            orders = self.client.get_open_orders(symbol=self.symbol)
+        except Exception:
+            with self._lock:
+                self._replay()
+            raise
+        self.load(orders or [])
+
+    async def reconcile_async(self) -> None:
+        """Re-seed the index from an async client's ``get_open_orders``."""
+        self._buffer = []
+        self.reconciles += 1
+        try:
+            orders = await self.client.get_open_orders(symbol=self.symbol)
+        except Exception:
+            self._replay()
+            raise
+        self.load(orders or [])
+
+    def attach(self, ws_client: Any) -> "OrderTracker":
+        """
+        Subscribe to the private order stream and seed from ``get_open_orders``.
+
+        The tracker reconciles again whenever the client reports a gap on the stream.
+
+        Args:
+            ws_client: A connected WebSocketClient with API credentials
+
+        Returns:
+            This tracker
+        """
+        ws_client.subscribe([self.stream], self.apply_update, is_private=True)
+        if self.client is not None:
+            ws_client.on_gap(lambda stream: self.reconcile(), [self.stream])
+            self.reconcile()
+        return self
+
+    async def follow(self, ws_client: Any) -> None:
+        """
+        Maintain the index from an AsyncWebSocketClient until the stream ends.
+
+        Requires ``client`` to be an AsyncAuthenticationClient (or None).
+
+        Args:
+            ws_client: A connected AsyncWebSocketClient with API credentials
+        """
+        await ws_client.subscribe([self.stream], is_private=True)
+        stream = ws_client.stream(self.stream)
+        if self.client is not None:
+            ws_client.on_gap(lambda name: self.reconcile_async(), [self.stream])
+            await self.reconcile_async()
+        async for event in stream:
+            self.apply_update(event)
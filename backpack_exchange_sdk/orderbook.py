@@ -0,0 +1,383 @@
+"""
+Local L2 order book for Backpack Exchange.
+
+This module provides the OrderBook class, which is seeded from a REST depth
+snapshot (``get_depth``) and kept current by ``depth.<symbol>`` WebSocket
+updates, with update-id gap detection and automatic resynchronisation.
+"""
+
+import asyncio
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Tuple
+
+Level = Tuple[float, float]
+
+
+class OrderBookSide:
+    """
+    One side of the book stored as parallel sorted price/size lists.
+
+    Prices are kept so that the best level is always the last element: bids
+    ascending, asks as negated prices ascending. Best-level reads are O(1),
+    lookups O(log n), and updates near the top of book are cheap list edits.
+    """
+
+    __slots__ = ("_keys", "_sizes", "_sign")
+
+    def __init__(self, is_bid: bool):
+        self._keys: List[float] = []
+        self._sizes: List[float] = []
+        self._sign = 1.0 if is_bid else -1.0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._sizes.clear()
+
+    def load(self, levels: List[List[str]]) -> None:
+        """Replace all levels from ``[price, size]`` string pairs."""
+        sign = self._sign
+        pairs = sorted((sign * float(price), float(size)) for price, size in levels if float(size) != 0)
+        self._keys = [key for key, _ in pairs]
+        self._sizes = [size for _, size in pairs]
+
+    def update(self, levels: List[List[str]]) -> None:
+        """Apply ``[price, size]`` deltas; a zero size removes the level."""
+        keys = self._keys
+        sizes = self._sizes
+        sign = self._sign
+        for price, size in levels:
+            key = sign * float(price)
+            quantity = float(size)
+            i = bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                if quantity == 0:
+                    del keys[i]
+                    del sizes[i]
+                else:
+                    sizes[i] = quantity
+            elif quantity != 0:
+                keys.insert(i, key)
+                sizes.insert(i, quantity)
+
+    def best(self) -> Optional[Level]:
+        """Best price level as ``(price, size)``, or None if empty."""
+        if not self._keys:
+            return None
+        return self._sign * self._keys[-1], self._sizes[-1]
+
+    def size_at(self, price: float) -> float:
+        """Resting size at ``price`` (0.0 if there is no such level)."""
+        key = self._sign * float(price)
+        i = bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            return self._sizes[i]
+        return 0.0
+
+    def levels(self, depth: Optional[int] = None) -> List[Level]:
+        """Levels from best to worst, optionally limited to ``depth``."""
+        count = len(self._keys) if depth is None else min(depth, len(self._keys))
+        sign = self._sign
+        keys = self._keys
+        sizes = self._sizes
+        return [(sign * keys[-1 - i], sizes[-1 - i]) for i in range(count)]
+
+
+class OrderBook:
+    """
+    Local L2 order book maintained from REST snapshots and depth updates.
+
+    Updates received before the first snapshot are buffered and replayed
+    (at most ``max_buffer`` of them; the oldest are dropped first). When an
+    update's first id does not follow the last applied id, the book is marked
+    out of sync and, if a client was given, re-seeded from ``get_depth`` on a
+    background thread so the WebSocket thread is never blocked. Resyncs are
+    serialized, and a resync that fails (an error, or snapshots that never
+    connect to the buffered updates) is retried on a later update with
+    exponential backoff.
+
+    Example:
+        >>> book = OrderBook("SOL_USDC", client=PublicClient())
+        >>> book.attach(WebSocketClient())
+        >>> book.best_bid(), book.best_ask()
+    """
+
+    APPLIED = "applied"
+    STALE = "stale"
+    GAP = "gap"
+    BUFFERED = "buffered"
+
+    RETRY_DELAY = 0.1
+    MAX_RETRY_DELAY = 5.0
+
+    def __init__(self, symbol: str, client: Any = None, max_buffer: int = 10000):
+        """
+        Initialize an empty book.
+
+        Args:
+            symbol: Market symbol (e.g., 'SOL_USDC')
+            client: Optional client providing ``get_depth`` for snapshots
+            max_buffer: Maximum updates buffered while the book is out of sync
+        """
+        self.symbol = symbol
+        self.client = client
+        self.bids = OrderBookSide(is_bid=True)
+        self.asks = OrderBookSide(is_bid=False)
+        self.last_update_id: Optional[int] = None
+        self.timestamp: Optional[int] = None
+        self.snapshots = 0
+        self.max_buffer = max_buffer
+        self.last_error: Optional[Exception] = None
+        self._buffer: List[Dict[str, Any]] = []
+        self._lock = threading.RLock()
+        self._resync_lock = threading.Lock()
+        self._resync_running = False
+        self._needs_resync = False
+        self._retry_at = 0.0
+        self._retry_delay = self.RETRY_DELAY
+
+    @property
+    def synced(self) -> bool:
+        """Whether the book has a snapshot and no detected gap since."""
+        return self.last_update_id is not None
+
+    @property
+    def stream(self) -> str:
+        """The depth stream name for this book."""
+        return f"depth.{self.symbol}"
+
+    def apply_snapshot(self, depth: Dict[str, Any]) -> bool:
+        """
+        Seed the book from a ``get_depth`` response and replay buffered updates.
+
+        Args:
+            depth: Depth response with ``bids``, ``asks`` and ``lastUpdateId``
+
+        Returns:
+            True if the book is in sync afterwards, False if the buffered
+            updates do not connect to the snapshot
+        """
+        with self._lock:
+            self.bids.load(depth.get("bids") or [])
+            self.asks.load(depth.get("asks") or [])
+            self.last_update_id = int(depth["lastUpdateId"])
+            self.timestamp = depth.get("timestamp")
+            buffered, self._buffer = self._buffer, []
+            for i, event in enumerate(buffered):
+                if self._apply(event) == self.GAP:
+                    self._buffer.extend(buffered[i + 1 :])
+                    return False
+            return True
+
+    def _apply(self, event: Dict[str, Any]) -> str:
+        if self.last_update_id is None:
+            self._buffer.append(event)
+            if len(self._buffer) > self.max_buffer:
+                del self._buffer[: len(self._buffer) - self.max_buffer]
+            return self.BUFFERED
+        first_id = int(event["U"])
+        last_id = int(event["u"])
+        if last_id <= self.last_update_id:
+            return self.STALE
+        if first_id > self.last_update_id + 1:
+            self.last_update_id = None
+            self._buffer = [event]
+            self._needs_resync = True
+            self._retry_at = 0.0
+            return self.GAP
+        self.bids.update(event.get("b") or ())
+        self.asks.update(event.get("a") or ())
+        self.last_update_id = last_id
+        self.timestamp = event.get("T", self.timestamp)
+        return self.APPLIED
+
+    def apply_update(self, event: Dict[str, Any]) -> str:
+        """
+        Apply a ``depth.*`` stream event.
+
+        Suitable as a WebSocketClient callback. On a gap, or on a buffered
+        update while an earlier resync has failed, the book resyncs from the
+        client (if one was given) on a background thread.
+
+        Args:
+            event: Depth event with ``U``/``u`` update ids and ``b``/``a`` deltas
+
+        Returns:
+            One of APPLIED, STALE, GAP or BUFFERED
+        """
+        with self._lock:
+            result = self._apply(event)
+            start = result in (self.GAP, self.BUFFERED) and self._resync_due()
+            if start:
+                self._resync_running = True
+        if start:
+            threading.Thread(target=self._background_resync, daemon=True).start()
+        return result
+
+    def _resync_due(self) -> bool:
+        return (
+            self.client is not None
+            and self._needs_resync
+            and not self._resync_running
+            and time.monotonic() >= self._retry_at
+        )
+
+    def _resync_failed(self, error: Optional[Exception] = None) -> None:
+        with self._lock:
+            self.last_error = error
+            self._needs_resync = True
+            self._retry_at = time.monotonic() + self._retry_delay
+            self._retry_delay = min(self._retry_delay * 2, self.MAX_RETRY_DELAY)
+
+    def _resync_succeeded(self) -> None:
+        with self._lock:
+            self._needs_resync = False
+            self._retry_delay = self.RETRY_DELAY
+
+    def _background_resync(self) -> None:
+        try:
+            with self._resync_lock:
+                if not self.synced:
+                    self._resync(3)
+        except Exception as e:
+            self._resync_failed(e)
+        finally:
+            with self._lock:
+                self._resync_running = False
+
+    def _on_gap(self, stream: str) -> None:
+        with self._lock:
+            self.last_update_id = None
+            self._needs_resync = True
+            self._retry_at = 0.0
+            start = self._resync_due()
+            if start:
+                self._resync_running = True
+        if start:
+            threading.Thread(target=self._background_resync, daemon=True).start()
+
+    def _require_client(self) -> None:
+        if self.client is None:
+            raise ValueError("OrderBook needs a client providing get_depth to fetch snapshots")
+
+    def _resync(self, attempts: int) -> bool:
+        with self._lock:
+            self.last_update_id = None
+        for _ in range(attempts):
+            self.snapshots += 1
+            if self.apply_snapshot(self.client.get_depth(self.symbol)):
+                self._resync_succeeded()
+                return True
+        self._resync_failed()
+        return False
+
+    def resync(self, attempts: int = 3) -> bool:
+        """
+        Fetch a fresh snapshot from the client and re-seed the book.
+
+        Waits for a resync already in progress. If every attempt fails, later
+        updates retry in the background.
+
+        Args:
+            attempts: Snapshots to try while buffered updates do not connect
+
+        Returns:
+            True if the book is in sync afterwards
+
+        Raises:
+            ValueError: If the book has no client
+        """
+        self._require_client()
+        with self._resync_lock:
+            return self._resync(attempts)
+
+    def attach(self, ws_client: Any) -> "OrderBook":
+        """
+        Subscribe to the depth stream on a WebSocketClient and seed the book.
+
+        Updates arriving while the snapshot is fetched are buffered, and the
+        book re-snapshots whenever the client reports a gap on the stream.
+
+        Args:
+            ws_client: A connected WebSocketClient
+
+        Returns:
+            This order book
+
+        Raises:
+            ValueError: If the book has no client
+        """
+        self._require_client()
+        with self._lock:
+            self.last_update_id = None
+        ws_client.subscribe([self.stream], self.apply_update)
+        ws_client.on_gap(self._on_gap, [self.stream])
+        self.resync()
+        return self
+
+    async def follow(self, ws_client: Any) -> None:
+        """
+        Maintain the book from an AsyncWebSocketClient until the stream ends.
+
+        Requires ``client`` to be an AsyncPublicClient. A failed resync is
+        retried on a later update with exponential backoff.
+
+        Args:
+            ws_client: A connected AsyncWebSocketClient
+
+        Raises:
+            ValueError: If the book has no client
+        """
+        self._require_client()
+        lock = asyncio.Lock()
+
+        async def resync(name: str = None) -> None:
+            async with lock:
+                # Updates consumed while the snapshot is in flight are buffered.
+                self.last_update_id = None
+                self.snapshots += 1
+                try:
+                    depth = await self.client.get_depth(self.symbol)
+                except Exception as e:
+                    self._resync_failed(e)
+                    return
+                if self.apply_snapshot(depth):
+                    self._resync_succeeded()
+                else:
+                    self._resync_failed()
+
+        await ws_client.subscribe([self.stream])
+        ws_client.on_gap(resync, [self.stream])
+        stream = ws_client.stream(self.stream)
+        await resync()
+        async for event in stream:
+            if self._apply(event) in (self.GAP, self.BUFFERED) and self._resync_due():
+                await resync()
+
+    def best_bid(self) -> Optional[Level]:
+        """Best bid as ``(price, size)``, or None."""
+        return self.bids.best()
+
+    def best_ask(self) -> Optional[Level]:
+        """Best ask as ``(price, size)``, or None."""
+        return self.asks.best()
+
+    def mid_price(self) -> Optional[float]:
+        """Mid price, or None if either side is empty."""
+        bid = self.bids.best()
+        ask = self.asks.best()
+        if bid is None or ask is None:
+            return None
+        return (bid[0] + ask[0]) / 2
+
+    def spread(self) -> Optional[float]:
+        """Best ask minus best bid, or None if either side is empty."""
+        bid = self.bids.best()
+        ask = self.asks.best()
+        if bid is None or ask is None:
+            return None
+        return ask[0] - bid[0]
@@ -5,15 +5,18 @@ This module provides the PublicClient class which handles all public
 API endpoints that don't require authentication.
 """
 
-from typing import Optional, List
+from typing import List, Optional
 
 from backpack_exchange_sdk._base.client import BaseClient
+from backpack_exchange_sdk._base.hooks import RequestHook
+from backpack_exchange_sdk._base.ratelimit import RateLimiter
 from backpack_exchange_sdk._mixins.public.assets import AssetsMixin
 from backpack_exchange_sdk._mixins.public.borrow_lend_markets import BorrowLendMarketsMixin
 from backpack_exchange_sdk._mixins.public.market import MarketMixin
 from backpack_exchange_sdk._mixins.public.prediction import PredictionMixin
 from backpack_exchange_sdk._mixins.public.system import SystemMixin
 from backpack_exchange_sdk._mixins.public.trades import TradesMixin
+from backpack_exchange_sdk.recording import Recorder
 
 
 class PublicClient(
@@ -51,6 +54,10 @@ class PublicClient(
         max_retries: int = 0,
         backoff_factor: float = 0.1,
         status_forcelist: Optional[List[int]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce_requests: bool = False,
+        recorder: Optional[Recorder] = None,
+        hooks: Optional[List[RequestHook]] = None,
     ):
         """Initialize the public client."""
         super().__init__(
@@ -59,4 +66,8 @@ class PublicClient(
             max_retries=max_retries,
             backoff_factor=backoff_factor,
             status_forcelist=status_forcelist,
+            rate_limiter=rate_limiter,
+            coalesce_requests=coalesce_requests,
+            recorder=recorder,
+            hooks=hooks,
         )
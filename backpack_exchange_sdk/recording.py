@@ -0,0 +1,225 @@
+"""
+Record-and-replay capture of WebSocket and REST traffic.
+
+A capture is an append-only binary log. Each record is a fixed header
+followed by a key and a payload::
+
+    <B kind> <d receive time, epoch seconds> <H key length> <I payload length> key payload
+
+WebSocket records hold the raw frame text with an empty key; REST records
+hold the response body with ``"<METHOD> <url> <status>"`` as the key. Files
+ending in ``.gz`` (or opened with ``compress=True``) are gzip-compressed;
+appending adds a new gzip member, which readers handle transparently.
+"""
+
+import gzip
+import os
+import struct
+import threading
+import time
+from typing import IO, Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Union
+
+from backpack_exchange_sdk._base import codec
+
+MAGIC = b"BPCAP1\n"
+HEADER = struct.Struct("<BdHI")
+
+WS_FRAME = 1
+REST_RESPONSE = 2
+
+
+class Record(NamedTuple):
+    """One captured frame or response."""
+
+    kind: int
+    timestamp: float
+    key: str
+    payload: bytes
+
+
+def _open(path: str, mode: str, compress: Optional[bool]) -> IO[bytes]:
+    if compress is None:
+        compress = path.endswith(".gz")
+    if compress:
+        return gzip.open(path, mode)
+    return open(path, mode)
+
+
+class Recorder:
+    """
+    Thread-safe writer of capture files.
+
+    Example:
+        >>> recorder = Recorder("session.cap.gz")
+        >>> ws = WebSocketClient(recorder=recorder)
+        >>> client = PublicClient(recorder=recorder)
+    """
+
+    def __init__(self, path: str, compress: Optional[bool] = None):
+        """
+        Open (or append to) a capture file.
+
+        Args:
+            path: File path
+            compress: gzip the file (default: when the path ends in '.gz')
+        """
+        self.path = path
+        self.records = 0
+        self._lock = threading.Lock()
+        new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._file = _open(path, "ab", compress)
+        if new:
+            self._file.write(MAGIC)
+
+    def record(
+        self,
+        kind: int,
+        payload: Union[bytes, str],
+        key: str = "",
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """
+        Append one record.
+
+        Args:
+            kind: WS_FRAME or REST_RESPONSE
+            payload: Raw frame or response body
+            key: Record key (empty for frames)
+            timestamp: Receive time in epoch seconds (default: now)
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        if isinstance(payload, str):
+            payload = payload.encode()
+        key_bytes = key.encode()
+        with self._lock:
+            self._file.write(HEADER.pack(kind, timestamp, len(key_bytes), len(payload)))
+            self._file.write(key_bytes)
+            self._file.write(payload)
+            self.records += 1
+
+    def record_frame(self, frame: Union[bytes, str]) -> None:
+        """Append a received WebSocket frame."""
+        self.record(WS_FRAME, frame)
+
+    def record_response(self, method: str, url: str, status: int, body: bytes) -> None:
+        """Append a received REST response."""
+        self.record(REST_RESPONSE, body, f"{method} {url} {status}")
+
+    def flush(self) -> None:
+        """Flush buffered records to disk."""
+        with self._lock:
+            self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def read_records(path: str, compress: Optional[bool] = None) -> Iterator[Record]:
+    """
+    Iterate over the records of a capture file.
+
+    Args:
+        path: File path
+        compress: Whether the file is gzipped (default: when the path ends in '.gz')
+
+    Raises:
+        ValueError: If the file is not a capture file
+    """
+    with _open(path, "rb", compress) as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a capture file")
+        while True:
+            header = f.read(HEADER.size)
+            if len(header) < HEADER.size:
+                return
+            kind, timestamp, key_length, payload_length = HEADER.unpack(header)
+            key = f.read(key_length).decode()
+            payload = f.read(payload_length)
+            if len(payload) < payload_length:
+                return
+            yield Record(kind, timestamp, key, payload)
+
+
+class Replayer:
+    """
+    Replays captured WebSocket frames through WebSocketClient-style callbacks.
+
+    Frames are decoded with the current codec and passed to the callbacks of
+    their stream, with the recorded spacing divided by ``speed`` (``None``
+    replays as fast as possible).
+
+    Example:
+        >>> replayer = Replayer("session.cap.gz", speed=10)
+        >>> replayer.subscribe(["depth.SOL_USDC"], book.apply_update)
+        >>> replayer.run()
+    """
+
+    def __init__(self, path: str, speed: Optional[float] = 1.0, compress: Optional[bool] = None):
+        """
+        Args:
+            path: Capture file path
+            speed: Playback speed multiplier, or None for no delays
+            compress: Whether the file is gzipped (default: when the path ends in '.gz')
+        """
+        self.path = path
+        self.speed = speed
+        self.compress = compress
+        self.callbacks: Dict[str, List[Callable]] = {}
+        self.delivered = 0
+
+    def subscribe(self, streams: List[str], callback: Callable, is_private: bool = False) -> None:
+        """Register a callback for streams, like WebSocketClient.subscribe."""
+        for stream in streams:
+            self.callbacks.setdefault(stream, []).append(callback)
+
+    def unsubscribe(self, streams: List[str]) -> None:
+        """Remove the callbacks of streams."""
+        for stream in streams:
+            self.callbacks.pop(stream, None)
+
+    def on_gap(self, callback: Callable[[str], Any], streams: Optional[List[str]] = None) -> None:
+        """Accepted for WebSocketClient compatibility; a capture has no reconnects."""
+
+    def frames(self) -> Iterator[Record]:
+        """Captured WebSocket frames in order."""
+        return (r for r in read_records(self.path, self.compress) if r.kind == WS_FRAME)
+
+    def responses(self) -> Iterator[Record]:
+        """Captured REST responses in order."""
+        return (r for r in read_records(self.path, self.compress) if r.kind == REST_RESPONSE)
+
+    def run(self) -> int:
+        """
+        Replay every frame to the subscribed callbacks.
+
+        Returns:
+            Number of messages delivered
+        """
+        start: Optional[float] = None
+        first: Optional[float] = None
+        for record in self.frames():
+            if self.speed:
+                if start is None:
+                    start, first = time.monotonic(), record.timestamp
+                delay = (record.timestamp - first) / self.speed - (time.monotonic() - start)
+                if delay > 0:
+                    time.sleep(delay)
+            try:
+                message = codec.loads(record.payload)
+            except ValueError:
+                continue
+            callbacks = self.callbacks.get(message.get("stream")) if isinstance(message, dict) else None
+            if callbacks:
+                for callback in callbacks:
+                    callback(message["data"])
+                self.delivered += 1
+        return self.delivered
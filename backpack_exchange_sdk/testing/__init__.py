@@ -0,0 +1,9 @@
+"""
+Testing utilities for Backpack Exchange SDK.
+
+Requires aiohttp (``pip install backpack_exchange_sdk[async]``).
+"""
+
+from backpack_exchange_sdk.testing.mock_exchange import MockExchange
+
+__all__ = ["MockExchange"]
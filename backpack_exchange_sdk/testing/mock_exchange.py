@@ -0,0 +1,811 @@
+"""
+Local stand-in for the Backpack Exchange REST and WebSocket APIs.
+
+MockExchange serves the routes of ``openapi.json`` from an aiohttp server on a
+background thread. Requests to routes with an instruction are authenticated
+the way the exchange does it: the signing string is rebuilt from the received
+parameters, the ``X-Signature`` is verified against the ED25519 key in
+``X-API-Key`` and ``X-Timestamp`` must be within ``X-Window``. Private
+WebSocket subscriptions are verified the same way.
+
+Markets, depth, trades, tickers and klines are synthetic. Balances and orders
+are kept per API key: limit orders rest until cancelled (there is no
+matching), market orders fill immediately at the best price (and are listed
+in the fill history), and both emit ``account.orderUpdate`` events. Other documented routes answer with an empty
+body of the documented shape.
+
+Faults can be injected for load and reconnect testing: fixed latency, random
+or scheduled 429/5xx responses and WebSocket disconnects.
+
+Run standalone with ``python -m backpack_exchange_sdk.testing.mock_exchange``.
+"""
+
+import argparse
+import asyncio
+import base64
+import binascii
+import functools
+import itertools
+import json
+import os
+import random
+import re
+import threading
+import time
+from collections import Counter, deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from aiohttp import WSMsgType, web
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives.asymmetric import ed25519
+
+from backpack_exchange_sdk._base import codec
+from backpack_exchange_sdk.backfill import INTERVAL_SECONDS, MAX_KLINES_PER_REQUEST
+
+DEFAULT_SPEC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "openapi.json")
+DEFAULT_MARKETS = {"SOL_USDC": 150.0, "BTC_USDC": 60000.0}
+DEFAULT_BALANCES = {"USDC": "100000", "SOL": "1000", "BTC": "10"}
+MAX_WINDOW = 60000
+
+ERROR_CODES = {429: "TOO_MANY_REQUESTS", 503: "MAINTENANCE"}
+
+_INSTRUCTION = re.compile(r"\*\*Instruction:\*\* `(\w+)`")
+
+Handler = Callable[[Any, Optional[str]], Any]
+
+
+class _Reject(Exception):
+    def __init__(self, status: int, code: str, message: str):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.message = message
+
+
+def _error(status: int, code: str, message: str) -> web.Response:
+    return web.json_response({"code": code, "message": message}, status=status)
+
+
+def _signing_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return str(value).lower()
+    return str(value)
+
+
+def signing_string(instruction: str, params: Any, timestamp: int, window: int) -> str:
+    """
+    Signing string the exchange expects for a request.
+
+    Args:
+        instruction: Route instruction (ignored for batch bodies, which use 'orderExecute' per order)
+        params: Query parameters or JSON body; a list is treated as a batch of orders
+        timestamp: X-Timestamp in milliseconds
+        window: X-Window in milliseconds
+
+    Returns:
+        The string whose signature must match X-Signature
+    """
+    batch = params if isinstance(params, list) else [params]
+    if isinstance(params, list):
+        instruction = "orderExecute"
+    parts = []
+    for item in batch:
+        fields = sorted((key, _signing_value(value)) for key, value in (item or {}).items())
+        parts.append("&".join([f"instruction={instruction}"] + [f"{key}={value}" for key, value in fields]))
+    return "&".join(parts) + f"&timestamp={timestamp}&window={window}"
+
+
+def _empty_body(operation: Dict[str, Any]) -> Any:
+    content = (operation.get("responses", {}).get("200") or {}).get("content")
+    if not content:
+        return None
+    schema = next(iter(content.values())).get("schema") or {}
+    return [] if schema.get("type") == "array" else {}
+
+
+def _kline_time(seconds: int) -> str:
+    return datetime.fromtimestamp(seconds, timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+class _Market:
+    """Synthetic order book around a fixed mid price, on a grid of ticks."""
+
+    tick = 0.01
+
+    def __init__(self, symbol: str, price: float, levels: int, rng: random.Random):
+        self.symbol = symbol
+        self.base, self.quote = symbol.split("_")[:2]
+        self.mid = price
+        self.rng = rng
+        center = round(price / self.tick)
+        self.bids = {center - 1 - i: self._quantity() for i in range(levels)}
+        self.asks = {center + 1 + i: self._quantity() for i in range(levels)}
+        self.sequence = 1
+        self.trade_ids = itertools.count(1)
+        self.trades: Deque[Dict[str, Any]] = deque(maxlen=1000)
+        self.volume = 0.0
+
+    def _quantity(self) -> str:
+        return f"{self.rng.uniform(0.1, 50):.2f}"
+
+    def price(self, ticks: int) -> str:
+        return f"{ticks * self.tick:.2f}"
+
+    def best(self, side: str) -> Tuple[str, str]:
+        """Best ``(price, quantity)`` on the side an order of ``side`` takes from."""
+        if side == "Bid":
+            ticks = min(self.asks)
+            return self.price(ticks), self.asks[ticks]
+        ticks = max(self.bids)
+        return self.price(ticks), self.bids[ticks]
+
+    def step(self, now_us: int) -> Dict[str, Dict[str, Any]]:
+        """Change one level per side and print one trade; returns the events by stream."""
+        bid = self.rng.choice(list(self.bids))
+        ask = self.rng.choice(list(self.asks))
+        self.bids[bid] = self._quantity()
+        self.asks[ask] = self._quantity()
+        self.sequence += 1
+        buyer_maker = self.rng.random() < 0.5
+        price, _ = self.best("Ask" if buyer_maker else "Bid")
+        quantity = f"{self.rng.uniform(0.01, 5):.2f}"
+        trade_id = next(self.trade_ids)
+        self.volume += float(quantity)
+        self.trades.append(
+            {
+                "id": trade_id,
+                "price": price,
+                "quantity": quantity,
+                "quoteQuantity": f"{float(price) * float(quantity):.4f}",
+                "timestamp": now_us // 1000,
+                "isBuyerMaker": buyer_maker,
+            }
+        )
+        best_bid, best_ask = max(self.bids), min(self.asks)
+        return {
+            f"depth.{self.symbol}": {
+                "e": "depth",
+                "E": now_us,
+                "s": self.symbol,
+                "a": [[self.price(ask), self.asks[ask]]],
+                "b": [[self.price(bid), self.bids[bid]]],
+                "U": self.sequence,
+                "u": self.sequence,
+                "T": now_us,
+            },
+            f"trade.{self.symbol}": {
+                "e": "trade",
+                "E": now_us,
+                "s": self.symbol,
+                "p": price,
+                "q": quantity,
+                "t": trade_id,
+                "T": now_us,
+                "m": buyer_maker,
+            },
+            f"bookTicker.{self.symbol}": {
+                "e": "bookTicker",
+                "E": now_us,
+                "s": self.symbol,
+                "a": self.price(best_ask),
+                "A": self.asks[best_ask],
+                "b": self.price(best_bid),
+                "B": self.bids[best_bid],
+                "u": self.sequence,
+                "T": now_us,
+            },
+        }
+
+    def market(self) -> Dict[str, Any]:
+        return {
+            "symbol": self.symbol,
+            "baseSymbol": self.base,
+            "quoteSymbol": self.quote,
+            "marketType": "SPOT",
+            "orderBookState": "Open",
+            "filters": {
+                "price": {"tickSize": "0.01", "minPrice": "0.01", "maxPrice": None},
+                "quantity": {"stepSize": "0.01", "minQuantity": "0.01", "maxQuantity": None},
+            },
+        }
+
+    def depth(self) -> Dict[str, Any]:
+        return {
+            "asks": [[self.price(t), self.asks[t]] for t in sorted(self.asks)],
+            "bids": [[self.price(t), self.bids[t]] for t in sorted(self.bids)],
+            "lastUpdateId": str(self.sequence),
+            "timestamp": int(time.time() * 1e6),
+        }
+
+    def ticker(self) -> Dict[str, Any]:
+        last = self.trades[-1]["price"] if self.trades else self.price(round(self.mid / self.tick))
+        return {
+            "symbol": self.symbol,
+            "firstPrice": f"{self.mid:.2f}",
+            "lastPrice": last,
+            "priceChange": f"{float(last) - self.mid:.2f}",
+            "priceChangePercent": f"{(float(last) - self.mid) / self.mid:.6f}",
+            "high": self.price(min(self.asks)),
+            "low": self.price(max(self.bids)),
+            "volume": f"{self.volume:.2f}",
+            "quoteVolume": f"{self.volume * self.mid:.2f}",
+            "trades": str(len(self.trades)),
+        }
+
+    def klines(self, interval: str, start: int, end: int) -> List[Dict[str, Any]]:
+        """Candles in ``[start, end)``; the same window always yields the same candles."""
+        seconds = INTERVAL_SECONDS[interval]
+        rows = []
+        t = start - start % seconds
+        while t < end and len(rows) < MAX_KLINES_PER_REQUEST:
+            rng = random.Random(f"{self.symbol}:{interval}:{t}")
+            open_, close = (self.mid * (1 + rng.uniform(-0.01, 0.01)) for _ in range(2))
+            volume = rng.uniform(10, 1000)
+            rows.append(
+                {
+                    "start": _kline_time(t),
+                    "end": _kline_time(t + seconds),
+                    "open": f"{open_:.2f}",
+                    "high": f"{max(open_, close) * 1.002:.2f}",
+                    "low": f"{min(open_, close) * 0.998:.2f}",
+                    "close": f"{close:.2f}",
+                    "volume": f"{volume:.2f}",
+                    "quoteVolume": f"{volume * self.mid:.2f}",
+                    "trades": str(rng.randint(1, 500)),
+                }
+            )
+            t += seconds
+        return rows
+
+
+class _Connection:
+    __slots__ = ("ws", "streams", "key")
+
+    def __init__(self, ws: web.WebSocketResponse):
+        self.ws = ws
+        self.streams: Set[str] = set()
+        self.key: Optional[str] = None
+
+
+class MockExchange:
+    """
+    Local Backpack exchange for load and reconnect testing.
+
+    Attributes:
+        stats: Counters of ``requests``, ``rejected`` (authentication failures),
+            ``injected`` faults, ``ws_connections``, ``ws_messages`` and ``disconnects``
+
+    Example:
+        >>> with MockExchange(rate=100, error_rate=0.01) as exchange:
+        ...     client = AuthenticationClient(key, secret, base_url=exchange.url, max_retries=3)
+        ...     ws = WebSocketClient(key, secret, base_url=exchange.ws_url)
+    """
+
+    def __init__(
+        self,
+        markets: Optional[Dict[str, float]] = None,
+        api_keys: Optional[Iterable[str]] = None,
+        rate: float = 10.0,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_statuses: Tuple[int, ...] = (429, 500, 503),
+        disconnect_every: Optional[float] = None,
+        depth_levels: int = 20,
+        spec: Optional[str] = DEFAULT_SPEC,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: Optional[int] = None,
+    ):
+        """
+        Configure the exchange. Nothing listens until ``start()``.
+
+        Args:
+            markets: Initial mid price per market symbol (default SOL_USDC and BTC_USDC)
+            api_keys: Accepted base64 public keys (default: any valid ED25519 key)
+            rate: Market data updates per second per market (0 to stop publishing)
+            latency: Seconds added before every HTTP response
+            error_rate: Probability that an HTTP request fails with one of ``error_statuses``
+            error_statuses: Statuses used for random faults
+            disconnect_every: Close every WebSocket connection at this interval in seconds
+            depth_levels: Price levels per side of each synthetic book
+            spec: Path of the OpenAPI document whose routes are served (default: the copy shipped with
+                the package; None for built-in routes only)
+            host: Interface to listen on
+            port: Port to listen on (0 for any free port)
+            seed: Seed for the synthetic data
+
+        Raises:
+            FileNotFoundError: If ``spec`` does not exist
+        """
+        self.api_keys = set(api_keys) if api_keys is not None else None
+        self.rate = rate
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.disconnect_every = disconnect_every
+        self.host = host
+        self.port = port
+        self.stats: Counter = Counter()
+        self.balances = dict(DEFAULT_BALANCES)
+        self._rng = random.Random(seed)
+        self.markets = {
+            symbol: _Market(symbol, price, depth_levels, self._rng)
+            for symbol, price in (markets or DEFAULT_MARKETS).items()
+        }
+        self.routes = self._build_routes(spec)
+        self._faults: Deque[int] = deque()
+        self._order_ids = itertools.count(int(time.time() * 1e3))
+        self._accounts: Dict[str, Dict[str, Any]] = {}
+        self._connections: Set[_Connection] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._runner: Optional[web.AppRunner] = None
+        self._thread: Optional[threading.Thread] = None
+        self._publisher: Optional["asyncio.Future[None]"] = None
+
+    # -- server lifecycle -------------------------------------------------
+
+    @property
+    def url(self) -> str:
+        """Base URL for REST clients."""
+        return f"http://{self.host}:{self.port}/"
+
+    @property
+    def ws_url(self) -> str:
+        """URL for WebSocket clients."""
+        return f"ws://{self.host}:{self.port}/"
+
+    def start(self) -> "MockExchange":
+        """Serve on a daemon thread until ``stop()``."""
+        if self._thread is not None:
+            return self
+        started = threading.Event()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, args=(started,), name="MockExchange", daemon=True)
+        self._thread.start()
+        started.wait()
+        return self
+
+    def _run(self, started: threading.Event) -> None:
+        asyncio.set_event_loop(self._loop)
+        app = web.Application()
+        app.router.add_get("/", self._websocket)
+        app.router.add_route("*", "/{path:.*}", self._http)
+        self._runner = web.AppRunner(app)
+        self._loop.run_until_complete(self._runner.setup())
+        site = web.TCPSite(self._runner, self.host, self.port)
+        self._loop.run_until_complete(site.start())
+        self.port = site._server.sockets[0].getsockname()[1]
+        self._publisher = asyncio.ensure_future(self._publish())
+        started.set()
+        self._loop.run_forever()
+
+    def stop(self) -> None:
+        """Close every connection and stop serving."""
+        if self._thread is None:
+            return
+
+        async def shutdown() -> None:
+            self._publisher.cancel()
+            await self._disconnect(1001)
+            await self._runner.cleanup()
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self._loop).result(10)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._thread = None
+
+    def __enter__(self) -> "MockExchange":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    # -- fault injection --------------------------------------------------
+
+    def fail_next(self, status: int = 503, count: int = 1) -> None:
+        """Fail the next ``count`` HTTP requests with ``status``."""
+        self._faults.extend([status] * count)
+
+    def disconnect(self, code: int = 1011) -> None:
+        """Close every WebSocket connection now (1001 tells clients the server is shutting down)."""
+        asyncio.run_coroutine_threadsafe(self._disconnect(code), self._loop).result(5)
+
+    def _fault(self) -> Optional[int]:
+        if self._faults:
+            return self._faults.popleft()
+        if self.error_rate and self._rng.random() < self.error_rate:
+            return self._rng.choice(self.error_statuses)
+        return None
+
+    async def _disconnect(self, code: int) -> None:
+        for connection in list(self._connections):
+            await connection.ws.close(code=code)
+            self.stats["disconnects"] += 1
+
+    # -- authentication ---------------------------------------------------
+
+    def _authenticate(
+        self, key: Any, signature: Any, timestamp: Any, window: Any, message: Callable[[int, int], str]
+    ) -> str:
+        if not (key and signature and timestamp):
+            raise _Reject(401, "UNAUTHORIZED", "Missing authentication headers")
+        try:
+            timestamp, window = int(timestamp), int(window or 5000)
+        except (TypeError, ValueError):
+            raise _Reject(400, "INVALID_CLIENT_REQUEST", "Invalid timestamp or window")
+        if window > MAX_WINDOW:
+            raise _Reject(400, "INVALID_CLIENT_REQUEST", f"Window must be at most {MAX_WINDOW}")
+        if abs(time.time() * 1e3 - timestamp) > window:
+            raise _Reject(400, "INVALID_CLIENT_REQUEST", "Request has expired")
+        if self.api_keys is not None and key not in self.api_keys:
+            raise _Reject(401, "UNAUTHORIZED", "Unknown API key")
+        try:
+            public_key = ed25519.Ed25519PublicKey.from_public_bytes(base64.b64decode(key))
+            public_key.verify(base64.b64decode(signature), message(timestamp, window).encode())
+        except (InvalidSignature, ValueError, binascii.Error):
+            raise _Reject(400, "INVALID_CLIENT_REQUEST", "Invalid signature, could not verify signature")
+        return key
+
+    def _verify(self, request: web.Request, instruction: str, params: Any) -> str:
+        headers = request.headers
+        return self._authenticate(
+            headers.get("X-API-Key"),
+            headers.get("X-Signature"),
+            headers.get("X-Timestamp"),
+            headers.get("X-Window"),
+            functools.partial(signing_string, instruction, params),
+        )
+
+    # -- HTTP -------------------------------------------------------------
+
+    def _build_routes(self, spec: Optional[str]) -> Dict[Tuple[str, str], Tuple[Optional[str], Handler]]:
+        routes: Dict[Tuple[str, str], Tuple[Optional[str], Handler]] = {}
+        if spec is not None:
+            if not os.path.exists(spec):
+                raise FileNotFoundError(f"OpenAPI spec not found: {spec}")
+            with open(spec, encoding="utf-8") as f:
+                paths = json.load(f)["paths"]
+            for path, operations in paths.items():
+                for method, operation in operations.items():
+                    match = _INSTRUCTION.search(operation.get("description", ""))
+                    body = _empty_body(operation)
+                    routes[(method.upper(), path)] = (
+                        match.group(1) if match else None,
+                        lambda params, key, body=body: body,
+                    )
+        routes.update(
+            {
+                ("GET", "/api/v1/status"): (None, lambda params, key: {"status": "Ok", "message": None}),
+                ("GET", "/api/v1/ping"): (None, lambda params, key: "pong"),
+                ("GET", "/api/v1/time"): (None, lambda params, key: str(int(time.time() * 1e3))),
+                ("GET", "/api/v1/assets"): (None, self._assets),
+                ("GET", "/api/v1/markets"): (None, lambda params, key: [m.market() for m in self.markets.values()]),
+                ("GET", "/api/v1/market"): (None, lambda params, key: self._market(params).market()),
+                ("GET", "/api/v1/ticker"): (None, lambda params, key: self._market(params).ticker()),
+                ("GET", "/api/v1/tickers"): (None, lambda params, key: [m.ticker() for m in self.markets.values()]),
+                ("GET", "/api/v1/depth"): (None, lambda params, key: self._market(params).depth()),
+                ("GET", "/api/v1/trades"): (None, self._trades),
+                ("GET", "/api/v1/klines"): (None, self._klines),
+                ("GET", "/api/v1/capital"): ("balanceQuery", self._balances),
+                ("GET", "/api/v1/capital/collateral"): ("collateralQuery", self._collateral),
+                ("GET", "/api/v1/position"): ("positionQuery", lambda params, key: []),
+                ("GET", "/api/v1/order"): ("orderQuery", self._get_order),
+                ("POST", "/api/v1/order"): ("orderExecute", self._execute_order),
+                ("DELETE", "/api/v1/order"): ("orderCancel", self._cancel_order),
+                ("GET", "/api/v1/orders"): ("orderQueryAll", self._open_orders),
+                ("GET", "/wapi/v1/history/fills"): ("fillHistoryQueryAll", self._fills),
+                ("POST", "/api/v1/orders"): ("orderExecute", self._execute_orders),
+                ("DELETE", "/api/v1/orders"): ("orderCancelAll", self._cancel_orders),
+            }
+        )
+        return routes
+
+    async def _http(self, request: web.Request) -> web.Response:
+        self.stats["requests"] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        status = self._fault()
+        if status is not None:
+            self.stats["injected"] += 1
+            return _error(status, ERROR_CODES.get(status, "INTERNAL_ERROR"), "Injected fault")
+        route = self.routes.get((request.method, request.path))
+        if route is None:
+            return _error(404, "RESOURCE_NOT_FOUND", f"No route for {request.method} {request.path}")
+        instruction, handler = route
+        # The exchange parses query values by type, so booleans sign as 'true'/'false'.
+        params: Any = {
+            key: value.lower() if value in ("True", "False") else value for key, value in request.query.items()
+        }
+        body = await request.read()
+        if body:
+            try:
+                params = codec.loads(body)
+            except ValueError:
+                return _error(400, "INVALID_CLIENT_REQUEST", "Invalid JSON body")
+        try:
+            key = self._verify(request, instruction, params) if instruction else None
+            result = handler(params, key)
+        except _Reject as e:
+            if e.status == 401 or e.code == "INVALID_CLIENT_REQUEST":
+                self.stats["rejected"] += 1
+            return _error(e.status, e.code, e.message)
+        if result is None:
+            return web.Response(status=200)
+        if isinstance(result, str):
+            return web.Response(text=result)
+        return web.Response(body=codec.dumps(result), content_type="application/json")
+
+    # -- market data --------------------------------------------------------
+
+    def _market(self, params: Dict[str, Any]) -> _Market:
+        symbol = params.get("symbol")
+        if not symbol:
+            raise _Reject(400, "INVALID_CLIENT_REQUEST", "Missing symbol")
+        market = self.markets.get(symbol)
+        if market is None:
+            raise _Reject(400, "INVALID_MARKET", f"Market {symbol} not found")
+        return market
+
+    def _assets(self, params: Dict[str, Any], key: Optional[str]) -> List[Dict[str, Any]]:
+        symbols = sorted({asset for market in self.markets.values() for asset in (market.base, market.quote)})
+        return [{"symbol": symbol, "tokens": []} for symbol in symbols]
+
+    def _trades(self, params: Dict[str, Any], key: Optional[str]) -> List[Dict[str, Any]]:
+        limit = min(int(params.get("limit", 100)), 1000)
+        trades = list(self._market(params).trades)
+        return trades[-limit:] if limit else []
+
+    def _klines(self, params: Dict[str, Any], key: Optional[str]) -> List[Dict[str, Any]]:
+        market = self._market(params)
+        interval = params.get("interval")
+        if interval not in INTERVAL_SECONDS or "startTime" not in params:
+            raise _Reject(400, "INVALID_CLIENT_REQUEST", "Invalid interval or missing startTime")
+        end = int(params.get("endTime") or time.time())
+        return market.klines(interval, int(params["startTime"]), end)
+
+    async def _publish(self) -> None:
+        last_disconnect = time.monotonic()
+        while True:
+            await asyncio.sleep(1.0 / self.rate if self.rate > 0 else 0.1)
+            if self.rate > 0:
+                now_us = int(time.time() * 1e6)
+                events: Dict[str, Dict[str, Any]] = {}
+                for market in self.markets.values():
+                    events.update(market.step(now_us))
+                for connection in list(self._connections):
+                    for stream in connection.streams.intersection(events):
+                        await self._send(connection, stream, events[stream])
+            if self.disconnect_every and time.monotonic() - last_disconnect >= self.disconnect_every:
+                last_disconnect = time.monotonic()
+                await self._disconnect(1011)
+
+    # -- account ------------------------------------------------------------
+
+    def _account(self, key: str) -> Dict[str, Any]:
+        account = self._accounts.get(key)
+        if account is None:
+            account = {
+                "balances": {
+                    asset: {"available": amount, "locked": "0", "staked": "0"}
+                    for asset, amount in self.balances.items()
+                },
+                "orders": {},
+                "fills": [],
+            }
+            self._accounts[key] = account
+        return account
+
+    def _balances(self, params: Dict[str, Any], key: str) -> Dict[str, Any]:
+        return self._account(key)["balances"]
+
+    def _collateral(self, params: Dict[str, Any], key: str) -> Dict[str, Any]:
+        equity = self._account(key)["balances"].get("USDC", {}).get("available", "0")
+        return {"netEquity": equity, "netEquityAvailable": equity, "collateral": []}
+
+    def _find_order(self, params: Dict[str, Any], key: str) -> Dict[str, Any]:
+        orders = self._account(key)["orders"]
+        order = orders.get(str(params.get("orderId")))
+        if order is None and params.get("clientId") is not None:
+            order = next((o for o in orders.values() if o.get("clientId") == int(params["clientId"])), None)
+        if order is None:
+            raise _Reject(404, "RESOURCE_NOT_FOUND", "Order not found")
+        return order
+
+    def _get_order(self, params: Dict[str, Any], key: str) -> Dict[str, Any]:
+        return self._find_order(params, key)
+
+    def _open_orders(self, params: Dict[str, Any], key: str) -> List[Dict[str, Any]]:
+        symbol = params.get("symbol")
+        return [o for o in self._account(key)["orders"].values() if symbol is None or o["symbol"] == symbol]
+
+    def _fills(self, params: Dict[str, Any], key: str) -> List[Dict[str, Any]]:
+        symbol = params.get("symbol")
+        fills = [f for f in reversed(self._account(key)["fills"]) if symbol is None or f["symbol"] == symbol]
+        offset = int(params.get("offset", 0))
+        return fills[offset : offset + int(params.get("limit", 100))]
+
+    def _execute_order(self, params: Dict[str, Any], key: str) -> Dict[str, Any]:
+        market = self._market(params)
+        side, order_type = params.get("side"), params.get("orderType")
+        if side not in ("Bid", "Ask") or order_type not in ("Limit", "Market"):
+            raise _Reject(400, "INVALID_ORDER", "Invalid side or order type")
+        if params.get("quantity") is None:
+            raise _Reject(400, "INVALID_QUANTITY", "Missing quantity")
+        if order_type == "Limit" and params.get("price") is None:
+            raise _Reject(400, "INVALID_PRICE", "Missing price")
+        order = {
+            "id": str(next(self._order_ids)),
+            "clientId": params.get("clientId"),
+            "symbol": market.symbol,
+            "side": side,
+            "orderType": order_type,
+            "timeInForce": params.get("timeInForce", "GTC"),
+            "selfTradePrevention": params.get("selfTradePrevention", "RejectTaker"),
+            "postOnly": bool(params.get("postOnly", False)),
+            "price": params.get("price"),
+            "quantity": str(params["quantity"]),
+            "executedQuantity": "0",
+            "executedQuoteQuantity": "0",
+            "status": "New",
+            "createdAt": int(time.time() * 1e3),
+        }
+        if order_type == "Market":
+            price, _ = market.best(side)
+            order.update(
+                status="Filled",
+                executedQuantity=order["quantity"],
+                executedQuoteQuantity=f"{float(price) * float(order['quantity']):.4f}",
+            )
+            self._account(key)["fills"].append(
+                {
+                    "tradeId": next(self._order_ids),
+                    "orderId": order["id"],
+                    "clientId": order["clientId"],
+                    "symbol": market.symbol,
+                    "side": side,
+                    "price": price,
+                    "quantity": order["quantity"],
+                    "fee": f"{float(order['executedQuoteQuantity']) * 0.001:.6f}",
+                    "feeSymbol": market.quote,
+                    "isMaker": False,
+                    "systemOrderType": None,
+                    "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(order["createdAt"] / 1e3))
+                    + f".{order['createdAt'] % 1000:03d}",
+                }
+            )
+            self._order_event(key, "orderFill", order)
+        else:
+            self._account(key)["orders"][order["id"]] = order
+            self._order_event(key, "orderAccepted", order)
+        return order
+
+    def _execute_orders(self, orders: Any, key: str) -> List[Dict[str, Any]]:
+        if not isinstance(orders, list):
+            raise _Reject(400, "INVALID_CLIENT_REQUEST", "Expected a list of orders")
+        results = []
+        for params in orders:
+            try:
+                results.append(self._execute_order(params, key))
+            except _Reject as e:
+                results.append({"operation": "Err", "code": e.code, "message": e.message})
+        return results
+
+    def _cancel(self, key: str, order: Dict[str, Any]) -> Dict[str, Any]:
+        self._account(key)["orders"].pop(order["id"], None)
+        order = dict(order, status="Cancelled")
+        self._order_event(key, "orderCancelled", order)
+        return order
+
+    def _cancel_order(self, params: Dict[str, Any], key: str) -> Dict[str, Any]:
+        return self._cancel(key, self._find_order(params, key))
+
+    def _cancel_orders(self, params: Dict[str, Any], key: str) -> List[Dict[str, Any]]:
+        return [self._cancel(key, order) for order in self._open_orders(params, key)]
+
+    def _order_event(self, key: str, event_type: str, order: Dict[str, Any]) -> None:
+        now_us = int(time.time() * 1e6)
+        event = {
+            "e": event_type,
+            "E": now_us,
+            "s": order["symbol"],
+            "c": order["clientId"],
+            "S": order["side"],
+            "o": order["orderType"],
+            "f": order["timeInForce"],
+            "q": order["quantity"],
+            "p": order["price"],
+            "X": order["status"],
+            "i": order["id"],
+            "z": order["executedQuantity"],
+            "Z": order["executedQuoteQuantity"],
+            "V": order["selfTradePrevention"],
+            "T": now_us,
+        }
+        for connection in list(self._connections):
+            if connection.key != key:
+                continue
+            for stream in ("account.orderUpdate", f"account.orderUpdate.{order['symbol']}"):
+                if stream in connection.streams:
+                    asyncio.ensure_future(self._send(connection, stream, event))
+
+    # -- WebSocket ----------------------------------------------------------
+
+    async def _send(self, connection: _Connection, stream: str, data: Dict[str, Any]) -> None:
+        try:
+            await connection.ws.send_str(codec.dumps({"stream": stream, "data": data}).decode())
+            self.stats["ws_messages"] += 1
+        except (ConnectionError, RuntimeError):
+            self._connections.discard(connection)
+
+    async def _websocket(self, request: web.Request) -> web.StreamResponse:
+        if not web.WebSocketResponse().can_prepare(request).ok:
+            return await self._http(request)
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        connection = _Connection(ws)
+        self._connections.add(connection)
+        self.stats["ws_connections"] += 1
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                try:
+                    message = codec.loads(msg.data)
+                except ValueError:
+                    continue
+                streams = list(message.get("params") or [])
+                if message.get("method") == "SUBSCRIBE":
+                    if any(stream.startswith("account.") for stream in streams):
+                        try:
+                            connection.key = self._authenticate(
+                                *(list(message.get("signature") or []) + [None] * 4)[:4],
+                                message=lambda ts, window: f"instruction=subscribe&timestamp={ts}&window={window}",
+                            )
+                        except _Reject as e:
+                            self.stats["rejected"] += 1
+                            error = {"id": message.get("id"), "error": {"code": 4006, "message": e.message}}
+                            await ws.send_str(codec.dumps(error).decode())
+                            streams = [stream for stream in streams if not stream.startswith("account.")]
+                    connection.streams.update(streams)
+                elif message.get("method") == "UNSUBSCRIBE":
+                    connection.streams.difference_update(streams)
+        finally:
+            self._connections.discard(connection)
+        return ws
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run a MockExchange until interrupted."""
+    parser = argparse.ArgumentParser(description="Local mock Backpack exchange")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--rate", type=float, default=10.0, help="market data updates per second per market")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every HTTP response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="probability of a 429/5xx response")
+    parser.add_argument("--disconnect-every", type=float, default=None, help="seconds between forced disconnects")
+    parser.add_argument("--markets", default=None, help="e.g. SOL_USDC=150,BTC_USDC=60000")
+    args = parser.parse_args(argv)
+    markets = None
+    if args.markets:
+        markets = {symbol: float(price) for symbol, price in (item.split("=") for item in args.markets.split(","))}
+    exchange = MockExchange(
+        markets=markets,
+        rate=args.rate,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        disconnect_every=args.disconnect_every,
+        host=args.host,
+        port=args.port,
+    ).start()
+    print(f"REST: {exchange.url}  WebSocket: {exchange.ws_url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        exchange.stop()
+
+
+if __name__ == "__main__":
+    main()
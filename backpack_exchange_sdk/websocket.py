@@ -1,12 +1,20 @@
 import base64
-import json
+import functools
+import queue
 import threading
 import time
-from typing import Callable, Dict, List, Optional
+import zlib
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 import websocket
 from cryptography.hazmat.primitives.asymmetric import ed25519
 
+from backpack_exchange_sdk._base import codec
+from backpack_exchange_sdk._base.clock import ClockSync
+from backpack_exchange_sdk._base.utils import backoff_delay
+from backpack_exchange_sdk.dispatch import Dispatcher
+from backpack_exchange_sdk.recording import Recorder
+
 
 class WebSocketClient:
     """
@@ -14,19 +22,58 @@ class WebSocketClient:
     Handles real-time data streams including market data, account updates, and trading information.
     """
 
-    def __init__(self, api_key: str = None, secret_key: str = None):
+    DEFAULT_BASE_URL = "wss://ws.backpack.exchange"
+
+    def __init__(
+        self,
+        api_key: str = None,
+        secret_key: str = None,
+        base_url: str = None,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+        shutdown_delay: float = 30.0,
+        dispatcher: Optional[Dispatcher] = None,
+        recorder: Optional[Recorder] = None,
+        clock: Optional[ClockSync] = None,
+    ):
         """
         Initialize WebSocket client.
 
         Args:
             api_key (str, optional): API key for authenticated streams
             secret_key (str, optional): Secret key for authenticated streams
+            base_url (str, optional): Custom WebSocket URL
+            reconnect_delay (float): Initial reconnect delay; doubles (with jitter) per failed attempt
+            max_reconnect_delay (float): Upper bound of the reconnect delay
+            shutdown_delay (float): Minimum delay when the server is shutting down (status 1001)
+            dispatcher (Dispatcher, optional): Run callbacks on the dispatcher's workers instead of
+                the socket thread
+            recorder (Recorder, optional): Capture every raw frame before it is decoded
+            clock (ClockSync, optional): Server clock used to timestamp private subscriptions
         """
         self.ws = None
         self.api_key = api_key
         self.secret_key = secret_key
-        self.base_url = "wss://ws.backpack.exchange"
+        self.base_url = base_url or self.DEFAULT_BASE_URL
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.shutdown_delay = shutdown_delay
+        self.dispatcher = dispatcher
+        self.recorder = recorder
+        self.clock = clock
         self.callbacks: Dict[str, List[Callable]] = {}
+        self.subscriptions: Dict[str, bool] = {}
+        self.gap_callbacks: List[Tuple[Optional[Set[str]], Callable[[str], Any]]] = []
+        self.gaps: Dict[str, int] = {}
+        self.conflated = 0
+        self._conflated: Dict[str, bool] = {}
+        self._latest: Dict[str, Any] = {}
+        self._unread: Set[str] = set()
+        self._latest_lock = threading.Lock()
+        self._attempt = 0
+        self._closing = False
+        self._close_code: Optional[int] = None
+        self._wake = threading.Event()
         self.connected = threading.Event()
         self.last_pong = time.time()
         self._connect()
@@ -36,16 +83,50 @@ class WebSocketClient:
 
     def _connect(self):
         """
-        Establish WebSocket connection and set up event handlers.
-        Includes automatic reconnection on connection loss.
+        Start the connection thread.
+
+        The thread runs one WebSocketApp per connection and, when it ends,
+        waits out the reconnect delay and opens the next one, so reconnects
+        neither recurse nor block a socket callback.
         """
+        self._thread = threading.Thread(target=self._run, name="WebSocketClient", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._closing:
+            self._close_code = None
+            self.ws = self._create_app()
+            self.ws.run_forever()
+            if self._closing:
+                return
+            # Reconnect with jittered exponential backoff; if the server is shutting
+            # down (status 1001), wait at least shutdown_delay
+            delay = backoff_delay(self._attempt, self.reconnect_delay, self.max_reconnect_delay)
+            if self._close_code == 1001:
+                delay = max(delay, self.shutdown_delay)
+            self._attempt += 1
+            print(f"Reconnecting in {delay:.1f}s...")
+            self._wake.wait(delay)
+
+    def _create_app(self) -> websocket.WebSocketApp:
+        """WebSocketApp with this client's event handlers."""
 
         def on_message(ws, message):
             """Handle incoming WebSocket messages"""
             try:
-                data = json.loads(message)
+                if self.recorder is not None:
+                    self.recorder.record_frame(message)
+                if self._conflated:
+                    stream = codec.peek_stream(message)
+                    if stream in self._conflated:
+                        self._store_latest(stream, message)
+                        return
+                data = codec.loads(message)
                 stream = data.get("stream")
                 if stream and stream in self.callbacks:
+                    if self.dispatcher is not None:
+                        self.dispatcher.submit(stream, data["data"], self.callbacks[stream])
+                        return
                     for callback in self.callbacks[stream]:
                         callback(data["data"])
             except Exception as e:
@@ -57,25 +138,19 @@ class WebSocketClient:
             self.connected.clear()
 
         def on_close(ws, close_status_code, close_msg):
-            """
-            Handle connection closure
-            If server is shutting down (status 1001), wait 30s before reconnecting
-            """
+            """Handle connection closure (the connection thread then reconnects)"""
             print(f"WebSocket connection closed: {close_status_code} - {close_msg}")
             self.connected.clear()
-
-            if close_status_code == 1001:  # Server shutting down
-                print("Server shutting down, waiting 30s before reconnecting...")
-                time.sleep(30)  # Wait for grace period
-            else:
-                time.sleep(5)  # Normal reconnection delay
-
-            self._connect()
+            self._close_code = close_status_code
 
         def on_open(ws):
             """Handle WebSocket connection establishment"""
             print("WebSocket connection established")
+            self._attempt = 0
             self.connected.set()
+            if self.subscriptions:
+                self._resubscribe()
+                self._emit_gaps(list(self.subscriptions))
 
         def on_pong(ws, message):
             """Update last pong time"""
@@ -89,8 +164,8 @@ class WebSocketClient:
             if hasattr(ws, "sock") and ws.sock:
                 ws.sock.pong(message)
 
-        # Initialize WebSocket connection with handlers
-        self.ws = websocket.WebSocketApp(
+        # No need for ping_interval as server handles pinging
+        return websocket.WebSocketApp(
             self.base_url,
             on_message=on_message,
             on_error=on_error,
@@ -100,12 +175,6 @@ class WebSocketClient:
             on_pong=on_pong,
         )
 
-        # Start WebSocket connection in a separate thread
-        # No need for ping_interval as server handles pinging
-        wst = threading.Thread(target=self.ws.run_forever)
-        wst.daemon = True
-        wst.start()
-
     def _generate_signature(self, streams: List[str], timestamp: int, window: int = 5000) -> Dict[str, str]:
         """
         Generate authentication signature for private streams.
@@ -132,46 +201,165 @@ class WebSocketClient:
         signature = private_key.sign(sign_str.encode())
         return base64.b64encode(signature).decode()
 
-    def subscribe(self, streams: List[str], callback: Callable, is_private: bool = False):
+    def subscribe(
+        self,
+        streams: List[str],
+        callback: Optional[Callable] = None,
+        is_private: bool = False,
+        conflate: bool = False,
+        decode_on_read: bool = True,
+    ):
         """
         Subscribe to one or more data streams.
 
+        Conflated streams are not pushed to callbacks: only the newest message
+        per stream is kept and read with ``latest()``. With ``decode_on_read``
+        the frame is stored raw and decoded only when read, so frames that
+        are overwritten before being read are never parsed.
+
         Args:
             streams (List[str]): List of stream names to subscribe to
-            callback (Callable): Function to handle incoming messages
+            callback (Callable): Function to handle incoming messages (not used with conflate)
             is_private (bool): Whether these are private authenticated streams
+            conflate (bool): Keep only the latest message per stream instead of calling back
+            decode_on_read (bool): Defer JSON decoding of conflated streams until latest()
+        """
+        if conflate:
+            if callback is not None:
+                raise ValueError("Conflated streams are read with latest(); do not pass a callback")
+            for stream in streams:
+                self._conflated[stream] = decode_on_read
+        elif callback is None:
+            raise ValueError("callback is required unless conflate=True")
+        self._subscribe_streams({stream: callback for stream in streams}, is_private)
+
+    def _store_latest(self, stream: str, message: str):
+        """Replace the latest message of a conflated stream."""
+        if not self._conflated.get(stream, True):
+            message = codec.loads(message).get("data")
+        with self._latest_lock:
+            if stream in self._unread:
+                self.conflated += 1
+            self._latest[stream] = message
+            self._unread.add(stream)
+
+    def latest(self, stream: str, default: Any = None) -> Any:
         """
+        Newest message data of a conflated stream.
+
+        Args:
+            stream (str): Stream name subscribed with ``conflate=True``
+            default: Value returned before the first message
+
+        Returns:
+            The message data, or ``default``
+        """
+        with self._latest_lock:
+            value = self._latest.get(stream, default)
+            if stream in self._unread:
+                self._unread.discard(stream)
+                if self._conflated.get(stream, False):
+                    value = codec.loads(value).get("data")
+                    self._latest[stream] = value
+            return value
+
+    def _subscribe_streams(self, callbacks: Dict[str, Callable], is_private: bool = False):
+        """Register one callback per stream and send a single SUBSCRIBE for all of them."""
         # Wait for connection to be established
         if not self.connected.is_set():
             if not self.connected.wait(timeout=10):
                 raise Exception("WebSocket connection not available")
 
         # Register callbacks for each stream
-        for stream in streams:
-            if stream not in self.callbacks:
-                self.callbacks[stream] = []
-            self.callbacks[stream].append(callback)
+        for stream, callback in callbacks.items():
+            if callback is not None:
+                if stream not in self.callbacks:
+                    self.callbacks[stream] = []
+                self.callbacks[stream].append(callback)
+            self.subscriptions[stream] = is_private
 
-        # Prepare subscription message
+        # Send subscription request
+        try:
+            self.ws.send(self._subscribe_message(list(callbacks), is_private))
+        except Exception as e:
+            print(f"Error subscribing to streams: {e}")
+            raise
+
+    def _timestamp(self) -> int:
+        """Signature timestamp in epoch milliseconds, corrected by the clock if one is set."""
+        if self.clock is not None:
+            return self.clock.now_ms()
+        return int(time.time() * 1000)
+
+    def _subscribe_message(self, streams: List[str], is_private: bool = False) -> str:
+        """
+        Build a SUBSCRIBE message, signed with a fresh timestamp for private streams.
+
+        Args:
+            streams (List[str]): Stream names
+            is_private (bool): Whether these are private authenticated streams
+
+        Returns:
+            str: JSON message
+        """
         subscribe_data = {"method": "SUBSCRIBE", "params": streams}
 
         # Add authentication for private streams
         if is_private:
-            timestamp = int(time.time() * 1000)
-            auth_data = self._generate_signature(streams, timestamp)
+            auth_data = self._generate_signature(streams, self._timestamp())
             subscribe_data["signature"] = [
                 auth_data["api-key"],
                 auth_data["signature"],
                 auth_data["timestamp"],
                 auth_data["window"],
             ]
+        return codec.dumps(subscribe_data).decode()
 
-        # Send subscription request
+    def _resubscribe(self):
+        """Replay SUBSCRIBE for every registered stream after a reconnect."""
+        public = [stream for stream, private in self.subscriptions.items() if not private]
+        private = [stream for stream, private in self.subscriptions.items() if private]
         try:
-            self.ws.send(json.dumps(subscribe_data))
+            if public:
+                self.ws.send(self._subscribe_message(public))
+            if private:
+                self.ws.send(self._subscribe_message(private, is_private=True))
         except Exception as e:
-            print(f"Error subscribing to streams: {e}")
-            raise
+            print(f"Error resubscribing to streams: {e}")
+
+    def on_gap(self, callback: Callable[[str], Any], streams: Optional[List[str]] = None):
+        """
+        Register a callback for stream gaps.
+
+        After a reconnect every restored stream may have missed messages; the
+        callback is then invoked with each affected stream name, on a separate
+        thread so it may make REST calls (e.g. to re-snapshot a book).
+
+        Args:
+            callback (Callable): Function called with the stream name
+            streams (List[str], optional): Only report these streams (default: all)
+        """
+        self.gap_callbacks.append((set(streams) if streams is not None else None, callback))
+
+    def _emit_gaps(self, streams: List[str]):
+        """Count a gap for each stream and notify gap callbacks in the background."""
+        calls = []
+        for stream in streams:
+            self.gaps[stream] = self.gaps.get(stream, 0) + 1
+            for wanted, callback in self.gap_callbacks:
+                if wanted is None or stream in wanted:
+                    calls.append((callback, stream))
+        if not calls:
+            return
+
+        def notify():
+            for callback, stream in calls:
+                try:
+                    callback(stream)
+                except Exception as e:
+                    print(f"Error handling gap on {stream}: {e}")
+
+        threading.Thread(target=notify, daemon=True).start()
 
     def unsubscribe(self, streams: List[str]):
         """
@@ -181,15 +369,230 @@ class WebSocketClient:
             streams (List[str]): List of stream names to unsubscribe from
         """
         unsubscribe_data = {"method": "UNSUBSCRIBE", "params": streams}
-        self.ws.send(json.dumps(unsubscribe_data))
+        self.ws.send(codec.dumps(unsubscribe_data).decode())
 
         # Remove callbacks for unsubscribed streams
         for stream in streams:
             if stream in self.callbacks:
                 del self.callbacks[stream]
+            self.subscriptions.pop(stream, None)
+            self._conflated.pop(stream, None)
+            with self._latest_lock:
+                self._latest.pop(stream, None)
+                self._unread.discard(stream)
 
     def close(self):
         """Gracefully close the WebSocket connection"""
+        self._closing = True
+        self._wake.set()
         if self.ws:
             self.ws.close()
             self.connected.clear()
+
+
+class ShardedWebSocketClient:
+    """
+    Streams spread over several WebSocket connections.
+
+    Each shard is an independent WebSocketClient with its own reader thread,
+    reconnect and resubscribe. Streams are assigned by CRC32 hash of the
+    stream name, or, when ``weights`` are given, to the least loaded shard.
+    Messages from every shard are delivered to the per-stream callbacks, the
+    merged ``on_message`` callback and the merged queue, on the reader
+    thread of the shard that received them.
+
+    Example:
+        >>> client = ShardedWebSocketClient(shards=4, weights={"depth": 5, "trade": 1})
+        >>> client.subscribe([f"depth.{s}" for s in symbols], handle_depth)
+    """
+
+    def __init__(
+        self,
+        api_key: str = None,
+        secret_key: str = None,
+        shards: int = 4,
+        weights: Optional[Dict[str, float]] = None,
+        on_message: Optional[Callable[[str, Any], None]] = None,
+        queue_size: Optional[int] = None,
+        base_url: str = None,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+        dispatcher: Optional[Dispatcher] = None,
+        recorder: Optional[Recorder] = None,
+        clock: Optional[ClockSync] = None,
+    ):
+        """
+        Open ``shards`` connections.
+
+        Args:
+            api_key (str, optional): API key for authenticated streams
+            secret_key (str, optional): Secret key for authenticated streams
+            shards (int): Number of connections
+            weights (Dict[str, float], optional): Load per stream, keyed by stream name or by
+                stream type (e.g. 'depth' for every 'depth.*' stream); unlisted streams weigh 1
+            on_message (Callable, optional): Merged callback ``(stream, data)`` for every message
+            queue_size (int, optional): Also deliver ``(stream, data)`` to a merged queue of this size
+                (0 for unbounded); the oldest message is dropped when it is full
+            base_url (str, optional): Custom WebSocket URL
+            reconnect_delay (float): Initial reconnect delay of each shard
+            max_reconnect_delay (float): Upper bound of each shard's reconnect delay
+            dispatcher (Dispatcher, optional): Dispatcher shared by every shard
+            recorder (Recorder, optional): Recorder shared by every shard
+            clock (ClockSync, optional): Server clock used by every shard to sign private subscriptions
+        """
+        if shards < 1:
+            raise ValueError("shards must be positive")
+        self.weights = weights
+        self.on_message = on_message
+        self.queue: Optional["queue.Queue[Any]"] = queue.Queue(queue_size) if queue_size is not None else None
+        self.dropped = 0
+        self.callbacks: Dict[str, List[Callable]] = {}
+        self.assignments: Dict[str, int] = {}
+        self.loads = [0.0] * shards
+        self._lock = threading.Lock()
+        self.shards = [
+            WebSocketClient(
+                api_key,
+                secret_key,
+                base_url=base_url,
+                reconnect_delay=reconnect_delay,
+                max_reconnect_delay=max_reconnect_delay,
+                dispatcher=dispatcher,
+                recorder=recorder,
+                clock=clock,
+            )
+            for _ in range(shards)
+        ]
+
+    def _weight(self, stream: str) -> float:
+        if stream in self.weights:
+            return self.weights[stream]
+        return self.weights.get(stream.split(".", 1)[0], 1.0)
+
+    def shard_for(self, stream: str) -> int:
+        """Index of the shard carrying ``stream``, assigning one if needed."""
+        with self._lock:
+            index = self.assignments.get(stream)
+            if index is None:
+                if self.weights is None:
+                    index = zlib.crc32(stream.encode()) % len(self.shards)
+                else:
+                    index = min(range(len(self.shards)), key=self.loads.__getitem__)
+                    self.loads[index] += self._weight(stream)
+                self.assignments[stream] = index
+            return index
+
+    def _dispatch(self, stream: str, data: Any) -> None:
+        for callback in self.callbacks.get(stream, ()):
+            callback(data)
+        if self.on_message is not None:
+            self.on_message(stream, data)
+        if self.queue is not None:
+            while True:
+                try:
+                    self.queue.put_nowait((stream, data))
+                    return
+                except queue.Full:
+                    try:
+                        self.queue.get_nowait()
+                        with self._lock:
+                            self.dropped += 1
+                    except queue.Empty:
+                        pass
+
+    def subscribe(
+        self,
+        streams: List[str],
+        callback: Optional[Callable] = None,
+        is_private: bool = False,
+        conflate: bool = False,
+        decode_on_read: bool = True,
+    ):
+        """
+        Subscribe to streams on their shards.
+
+        Each shard receives one SUBSCRIBE for its new streams; adding a
+        callback to an already subscribed stream sends nothing.
+
+        Args:
+            streams (List[str]): Stream names
+            callback (Callable, optional): Per-stream callback receiving the message data
+            is_private (bool): Whether these are private authenticated streams
+            conflate (bool): Keep only the latest message per stream, read with latest()
+            decode_on_read (bool): Defer JSON decoding of conflated streams until latest()
+        """
+        if conflate:
+            grouped: Dict[int, List[str]] = {}
+            for stream in streams:
+                grouped.setdefault(self.shard_for(stream), []).append(stream)
+            for index, shard_streams in grouped.items():
+                self.shards[index].subscribe(
+                    shard_streams, is_private=is_private, conflate=True, decode_on_read=decode_on_read
+                )
+            return
+        by_shard: Dict[int, Dict[str, Callable]] = {}
+        for stream in streams:
+            if stream not in self.callbacks:
+                self.callbacks[stream] = []
+                by_shard.setdefault(self.shard_for(stream), {})[stream] = functools.partial(self._dispatch, stream)
+            if callback is not None:
+                self.callbacks[stream].append(callback)
+        for index, callbacks in by_shard.items():
+            self.shards[index]._subscribe_streams(callbacks, is_private)
+
+    def on_gap(self, callback: Callable[[str], Any], streams: Optional[List[str]] = None):
+        """
+        Register a gap callback on the shards carrying ``streams`` (default: every shard).
+
+        Args:
+            callback (Callable): Function called with the stream name
+            streams (List[str], optional): Only report these streams
+        """
+        if streams is None:
+            for shard in self.shards:
+                shard.on_gap(callback)
+            return
+        by_shard: Dict[int, List[str]] = {}
+        for stream in streams:
+            by_shard.setdefault(self.shard_for(stream), []).append(stream)
+        for index, shard_streams in by_shard.items():
+            self.shards[index].on_gap(callback, shard_streams)
+
+    def unsubscribe(self, streams: List[str]):
+        """
+        Unsubscribe from streams on their shards.
+
+        Args:
+            streams (List[str]): Stream names
+        """
+        by_shard: Dict[int, List[str]] = {}
+        with self._lock:
+            for stream in streams:
+                self.callbacks.pop(stream, None)
+                index = self.assignments.pop(stream, None)
+                if index is not None:
+                    by_shard.setdefault(index, []).append(stream)
+                    if self.weights is not None:
+                        self.loads[index] -= self._weight(stream)
+        for index, shard_streams in by_shard.items():
+            self.shards[index].unsubscribe(shard_streams)
+
+    def latest(self, stream: str, default: Any = None) -> Any:
+        """Newest message data of a conflated stream, or ``default``."""
+        return self.shards[self.shard_for(stream)].latest(stream, default)
+
+    def get(self, timeout: Optional[float] = None) -> Any:
+        """
+        Next ``(stream, data)`` from the merged queue.
+
+        Raises:
+            queue.Empty: If no message arrives within ``timeout``
+        """
+        if self.queue is None:
+            raise RuntimeError("ShardedWebSocketClient was created without queue_size")
+        return self.queue.get(timeout=timeout)
+
+    def close(self):
+        """Close every shard."""
+        for shard in self.shards:
+            shard.close()
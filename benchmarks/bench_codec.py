@@ -0,0 +1,85 @@
+"""
+Decode throughput of each installed JSON codec on depth and trade frames.
+
+The frames mirror the shape and size of Backpack ``depth.<symbol>`` and
+``trade.<symbol>`` stream messages. Pass a file of recorded frames (one raw
+message per line) to measure real traffic instead.
+
+Run from the repository root with: python -m benchmarks.bench_codec [frames.jsonl]
+"""
+
+import json
+import random
+import sys
+import time
+from typing import List
+
+from backpack_exchange_sdk._base import codec
+
+
+def synthetic_frames(count: int = 20000, seed: int = 7) -> List[bytes]:
+    rng = random.Random(seed)
+    frames = []
+    update_id = 1_000_000
+    for i in range(count):
+        if i % 4 == 3:
+            data = {
+                "e": "trade",
+                "E": 1700000000000000 + i,
+                "s": "SOL_USDC",
+                "p": f"{140 + rng.random():.2f}",
+                "q": f"{rng.random() * 10:.3f}",
+                "b": str(rng.getrandbits(40)),
+                "a": str(rng.getrandbits(40)),
+                "t": i,
+                "T": 1700000000000000 + i,
+                "m": rng.random() < 0.5,
+            }
+            stream = "trade.SOL_USDC"
+        else:
+            levels = rng.randint(1, 12)
+            data = {
+                "e": "depth",
+                "E": 1700000000000000 + i,
+                "s": "SOL_USDC",
+                "a": [[f"{141 + rng.random():.2f}", f"{rng.random() * 100:.2f}"] for _ in range(levels)],
+                "b": [[f"{139 + rng.random():.2f}", f"{rng.random() * 100:.2f}"] for _ in range(levels)],
+                "U": update_id + 1,
+                "u": update_id + levels,
+                "T": 1700000000000000 + i,
+            }
+            update_id += levels
+            stream = "depth.SOL_USDC"
+        frames.append(json.dumps({"stream": stream, "data": data}).encode())
+    return frames
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], "rb") as f:
+            frames = [line.rstrip(b"\n") for line in f if line.strip()]
+    else:
+        frames = synthetic_frames()
+    texts = [frame.decode() for frame in frames]
+    total_bytes = sum(len(frame) for frame in frames)
+    original = codec.get_codec()
+    print(f"{len(frames)} frames, {total_bytes / 1e6:.2f} MB")
+    try:
+        for name in codec.available_codecs():
+            selected = codec.set_codec(name)
+            best = float("inf")
+            for _ in range(5):
+                start = time.perf_counter()
+                for text in texts:
+                    selected.loads(text)
+                best = min(best, time.perf_counter() - start)
+            print(
+                f"{name:<10} {len(frames) / best:12,.0f} frames/s "
+                f"{total_bytes / best / 1e6:8.1f} MB/s {best / len(frames) * 1e6:8.2f} us/frame"
+            )
+    finally:
+        codec.set_codec(original)
+
+
+if __name__ == "__main__":
+    main()
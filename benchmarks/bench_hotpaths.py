@@ -0,0 +1,166 @@
+"""
+Registered benchmarks for the SDK's hot paths.
+
+Isolated benchmarks time one step on in-memory data: signing strings,
+signatures, order payload assembly, frame decoding and WebSocket message
+dispatch. End-to-end benchmarks go through a local MockExchange over
+loopback (requires aiohttp).
+
+Run them with: python -m benchmarks.run
+"""
+
+import base64
+import itertools
+import threading
+
+from cryptography.hazmat.primitives.asymmetric import ed25519
+
+from backpack_exchange_sdk import AuthenticationClient, PublicClient, WebSocketClient
+from backpack_exchange_sdk._base import codec
+from backpack_exchange_sdk._base.utils import Signer, build_batch_signing_string, build_signing_string
+from backpack_exchange_sdk.columnar import TradeColumns
+from backpack_exchange_sdk.models import Trade
+from benchmarks.bench_codec import synthetic_frames
+from benchmarks.bench_signing import BATCH, ORDER, TIMESTAMP, WINDOW
+from benchmarks.harness import benchmark
+
+try:
+    from backpack_exchange_sdk.testing import MockExchange
+except ImportError:
+    MockExchange = None  # aiohttp may not be installed
+
+KEY = ed25519.Ed25519PrivateKey.generate()
+SECRET_B64 = base64.b64encode(KEY.private_bytes_raw()).decode()
+PUBLIC_B64 = base64.b64encode(KEY.public_key().public_bytes_raw()).decode()
+
+
+class _PayloadClient(AuthenticationClient):
+    """Client whose requests stop after payload assembly."""
+
+    def _send_request(self, method, endpoint, action, params=None, extra_headers=None):
+        return params
+
+
+@benchmark("signing.build_signing_string")
+def _signing_string():
+    return lambda: build_signing_string("orderExecute", ORDER, TIMESTAMP, WINDOW), 20000
+
+
+@benchmark("signing.build_batch_signing_string_50")
+def _batch_signing_string():
+    return lambda: build_batch_signing_string(BATCH, TIMESTAMP, WINDOW), 1000
+
+
+@benchmark("signing.signer_sign")
+def _signer_sign():
+    signer = Signer(KEY)
+    return lambda: signer.sign("orderExecute", ORDER, TIMESTAMP, WINDOW), 5000
+
+
+@benchmark("signing.signer_batch_headers_50")
+def _signer_batch():
+    signer = Signer(KEY)
+    return lambda: signer.batch_headers(PUBLIC_B64, BATCH, TIMESTAMP, WINDOW), 500
+
+
+@benchmark("request.execute_order_payload")
+def _execute_order_payload():
+    client = _PayloadClient(PUBLIC_B64, SECRET_B64)
+    return (
+        lambda: client.execute_order(
+            "Limit", "Bid", "SOL_USDC", price="141.52", quantity="12.5", clientId=1, postOnly=True, timeInForce="GTC"
+        ),
+        20000,
+    )
+
+
+@benchmark("request.signed_headers")
+def _signed_headers():
+    client = AuthenticationClient(PUBLIC_B64, SECRET_B64)
+    return lambda: client._generate_signature("orderExecute", client._timestamp(), ORDER), 5000
+
+
+@benchmark("codec.decode_frame")
+def _decode_frame():
+    frames = itertools.cycle([frame.decode() for frame in synthetic_frames(2000)])
+    return lambda: codec.loads(next(frames)), 20000
+
+
+TRADES = [
+    {
+        "id": n,
+        "price": "141.52",
+        "quantity": "0.5",
+        "quoteQuantity": "70.76",
+        "timestamp": 1700000000000 + n,
+        "isBuyerMaker": n % 2 == 0,
+    }
+    for n in range(1000)
+]
+
+
+@benchmark("models.trade_decode_many_1000")
+def _trade_decode_many():
+    return lambda: Trade.decode_many(TRADES), 200
+
+
+@benchmark("columnar.trade_columns_1000")
+def _trade_columns():
+    return lambda: TradeColumns.from_trades(TRADES), 200
+
+
+def _dispatch(conflate: bool):
+    exchange = MockExchange(rate=0).start()
+    client = WebSocketClient(base_url=exchange.ws_url)
+    if conflate:
+        client.subscribe(["depth.SOL_USDC", "trade.SOL_USDC"], conflate=True)
+    else:
+        client.subscribe(["depth.SOL_USDC", "trade.SOL_USDC"], lambda data: None)
+    frames = itertools.cycle([frame.decode() for frame in synthetic_frames(2000)])
+    ws = client.ws
+
+    def cleanup():
+        client.close()
+        exchange.stop()
+
+    return lambda: ws.on_message(ws, next(frames)), 20000, cleanup
+
+
+def _rest_depth():
+    exchange = MockExchange(rate=0).start()
+    client = PublicClient(base_url=exchange.url)
+    return lambda: client.get_depth("SOL_USDC"), 300, exchange.stop
+
+
+def _rest_order():
+    exchange = MockExchange(rate=0).start()
+    client = AuthenticationClient(PUBLIC_B64, SECRET_B64, base_url=exchange.url)
+    return lambda: client.execute_order("Market", "Bid", "SOL_USDC", quantity="1"), 300, exchange.stop
+
+
+def _order_to_event():
+    exchange = MockExchange(rate=0).start()
+    client = AuthenticationClient(PUBLIC_B64, SECRET_B64, base_url=exchange.url)
+    ws = WebSocketClient(PUBLIC_B64, SECRET_B64, base_url=exchange.ws_url)
+    received = threading.Event()
+    ws.subscribe(["account.orderUpdate"], lambda data: received.set(), is_private=True)
+
+    def round_trip():
+        received.clear()
+        client.execute_order("Market", "Bid", "SOL_USDC", quantity="1")
+        if not received.wait(5):
+            raise TimeoutError("no orderUpdate event")
+
+    def cleanup():
+        ws.close()
+        exchange.stop()
+
+    return round_trip, 200, cleanup
+
+
+if MockExchange is not None:
+    benchmark("ws.on_message_dispatch")(lambda: _dispatch(conflate=False))
+    benchmark("ws.on_message_conflated")(lambda: _dispatch(conflate=True))
+    benchmark("e2e.rest_get_depth", group="end_to_end")(_rest_depth)
+    benchmark("e2e.rest_execute_order", group="end_to_end")(_rest_order)
+    benchmark("e2e.order_to_ws_event", group="end_to_end")(_order_to_event)
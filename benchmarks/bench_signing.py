@@ -0,0 +1,64 @@
+"""
+Per-sign cost of Signer versus the build_signing_string/sign_message functions.
+
+Run from the repository root with: python -m benchmarks.bench_signing
+"""
+
+import timeit
+
+from cryptography.hazmat.primitives.asymmetric import ed25519
+
+from backpack_exchange_sdk._base.utils import (
+    Signer,
+    build_batch_signing_string,
+    build_signing_string,
+    sign_message,
+)
+
+TIMESTAMP = 1700000000000
+WINDOW = 5000
+ORDER = {
+    "symbol": "SOL_USDC",
+    "side": "Bid",
+    "orderType": "Limit",
+    "price": "141.52",
+    "quantity": "12.5",
+    "postOnly": True,
+    "clientId": 123456,
+    "selfTradePrevention": "RejectTaker",
+}
+BATCH = [dict(ORDER, price=str(140 + i / 100), clientId=i) for i in range(50)]
+
+
+def report(name: str, func, number: int) -> float:
+    per_call = min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+    print(f"{name:<40} {per_call:10.2f} us")
+    return per_call
+
+
+def main() -> None:
+    key = ed25519.Ed25519PrivateKey.generate()
+    signer = Signer(key)
+
+    print("Signing string only")
+    old = report("build_signing_string", lambda: build_signing_string("orderExecute", ORDER, TIMESTAMP, WINDOW), 50000)
+    new = report("Signer.signing_bytes", lambda: signer.signing_bytes("orderExecute", ORDER, TIMESTAMP, WINDOW), 50000)
+    print(f"{'speedup':<40} {old / new:10.2f} x\n")
+
+    print("Batch signing string (50 orders)")
+    old = report("build_batch_signing_string", lambda: build_batch_signing_string(BATCH, TIMESTAMP, WINDOW), 2000)
+    new = report("Signer.batch_signing_bytes", lambda: signer.batch_signing_bytes(BATCH, TIMESTAMP, WINDOW), 2000)
+    print(f"{'speedup':<40} {old / new:10.2f} x\n")
+
+    print("Full signature")
+    old = report(
+        "sign_message(build_signing_string)",
+        lambda: sign_message(key, build_signing_string("orderExecute", ORDER, TIMESTAMP, WINDOW)),
+        10000,
+    )
+    new = report("Signer.sign", lambda: signer.sign("orderExecute", ORDER, TIMESTAMP, WINDOW), 10000)
+    print(f"{'speedup':<40} {old / new:10.2f} x")
+
+
+if __name__ == "__main__":
+    main()
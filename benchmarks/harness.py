@@ -0,0 +1,183 @@
+"""
+Minimal benchmark harness: registration, timing, JSON baselines and comparison.
+
+A benchmark is a setup function returning ``(func, number)``: ``func`` is
+called ``number`` times per sample and the per-call time of each sample is
+recorded. Setup functions may return a third item, a cleanup callable.
+"""
+
+import fnmatch
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+
+Setup = Callable[[], Tuple[Any, ...]]
+
+
+class Benchmark(NamedTuple):
+    name: str
+    group: str
+    setup: Setup
+
+
+REGISTRY: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, group: str = "isolated") -> Callable[[Setup], Setup]:
+    """Register a setup function under ``name``."""
+
+    def register(setup: Setup) -> Setup:
+        REGISTRY[name] = Benchmark(name, group, setup)
+        return setup
+
+    return register
+
+
+def measure(func: Callable[[], Any], number: int, repeat: int = 5) -> Dict[str, float]:
+    """
+    Time ``func``.
+
+    Returns:
+        ``{"min_us", "median_us", "ops_per_s", "number", "repeat"}`` per call
+    """
+    func()  # warm-up
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number * 1e6)
+    median = statistics.median(samples)
+    return {
+        "min_us": round(min(samples), 3),
+        "median_us": round(median, 3),
+        "ops_per_s": round(1e6 / median, 1),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def run(pattern: str = "*", repeat: int = 5, scale: float = 1.0) -> Dict[str, Dict[str, float]]:
+    """
+    Run the registered benchmarks whose names match ``pattern``.
+
+    Args:
+        pattern: fnmatch pattern on benchmark names
+        repeat: Samples per benchmark
+        scale: Multiplier for each benchmark's call count (e.g. 0.1 for a quick run)
+
+    Returns:
+        Results keyed by benchmark name
+    """
+    results = {}
+    for name in sorted(REGISTRY):
+        if not fnmatch.fnmatch(name, pattern):
+            continue
+        prepared = REGISTRY[name].setup()
+        func, number = prepared[0], prepared[1]
+        try:
+            results[name] = measure(func, max(1, int(number * scale)), repeat)
+        finally:
+            if len(prepared) > 2:
+                prepared[2]()
+    return results
+
+
+def environment() -> Dict[str, str]:
+    """Machine and library details stored with a baseline."""
+    from backpack_exchange_sdk import __version__
+    from backpack_exchange_sdk._base import codec
+
+    return {
+        "sdk": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "codec": codec.get_codec().name,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def baseline_path(name: str) -> str:
+    return name if name.endswith(".json") else os.path.join(BASELINE_DIR, f"{name}.json")
+
+
+def save_baseline(name: str, results: Dict[str, Dict[str, float]]) -> str:
+    """Write results and environment to ``baselines/<name>.json``; returns the path."""
+    path = baseline_path(name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"environment": environment(), "results": results}, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return path
+
+
+def load_baseline(name: str) -> Dict[str, Any]:
+    with open(baseline_path(name), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float = 0.10,
+) -> List[Dict[str, Any]]:
+    """
+    Compare median times with a baseline.
+
+    Args:
+        results: Current results
+        baseline: Baseline results
+        threshold: Relative change below which a difference is reported as noise
+
+    Returns:
+        One row per benchmark: ``name``, ``baseline_us``, ``current_us``, ``change``
+        (relative, positive is slower) and ``status`` ('slower', 'faster', 'same', 'new' or 'missing')
+    """
+    rows = []
+    for name in sorted(set(results) | set(baseline)):
+        current = results.get(name, {}).get("median_us")
+        previous = baseline.get(name, {}).get("median_us")
+        change: Optional[float] = None
+        if current is None:
+            status = "missing"
+        elif previous is None:
+            status = "new"
+        else:
+            change = current / previous - 1
+            status = "slower" if change > threshold else "faster" if change < -threshold else "same"
+        rows.append({"name": name, "baseline_us": previous, "current_us": current, "change": change, "status": status})
+    return rows
+
+
+def _us(value: Optional[float]) -> str:
+    return f"{value:12.2f}" if value is not None else f"{'-':>12}"
+
+
+def format_results(results: Dict[str, Dict[str, float]]) -> str:
+    lines = [f"{'benchmark':<36} {'median us':>12} {'min us':>12} {'ops/s':>14}"]
+    for name, result in sorted(results.items()):
+        lines.append(f"{name:<36} {_us(result['median_us'])} {_us(result['min_us'])} {result['ops_per_s']:14,.0f}")
+    return "\n".join(lines)
+
+
+def format_comparison(rows: List[Dict[str, Any]]) -> str:
+    lines = [f"{'benchmark':<36} {'baseline us':>12} {'current us':>12} {'change':>9}  status"]
+    for row in rows:
+        change = f"{row['change'] * 100:+8.1f}%" if row["change"] is not None else f"{'-':>9}"
+        lines.append(f"{row['name']:<36} {_us(row['baseline_us'])} {_us(row['current_us'])} {change}  {row['status']}")
+    return "\n".join(lines)
+
+
+def warn_if_different(stored: Dict[str, str]) -> None:
+    current = environment()
+    for key in ("python", "implementation", "machine", "codec"):
+        if stored.get(key) != current[key]:
+            print(f"warning: baseline {key} is {stored.get(key)!r}, running on {current[key]!r}", file=sys.stderr)
@@ -0,0 +1,61 @@
+"""
+Run the benchmark suite, store baselines and compare against them.
+
+Examples (from the repository root):
+    python -m benchmarks.run                          # run everything, print results
+    python -m benchmarks.run --save main              # store baselines/main.json
+    python -m benchmarks.run --compare main           # report changes against a baseline
+    python -m benchmarks.run -k "signing.*" --quick   # a subset with fewer calls
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from benchmarks import bench_hotpaths  # noqa: F401  (registers the benchmarks)
+from benchmarks.harness import (
+    compare,
+    format_comparison,
+    format_results,
+    load_baseline,
+    run,
+    save_baseline,
+    warn_if_different,
+)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Backpack Exchange SDK benchmarks")
+    parser.add_argument("-k", "--filter", default="*", help="fnmatch pattern on benchmark names")
+    parser.add_argument("--repeat", type=int, default=5, help="samples per benchmark")
+    parser.add_argument("--quick", action="store_true", help="run a tenth of the calls per sample")
+    parser.add_argument("--save", metavar="NAME", help="store results as baselines/NAME.json (or a .json path)")
+    parser.add_argument("--compare", metavar="NAME", help="compare with baselines/NAME.json (or a .json path)")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative change treated as noise")
+    parser.add_argument("--fail-on-regression", action="store_true", help="exit with status 1 if anything is slower")
+    args = parser.parse_args(argv)
+
+    results = run(args.filter, repeat=args.repeat, scale=0.1 if args.quick else 1.0)
+    if not results:
+        print(f"No benchmarks match {args.filter!r}", file=sys.stderr)
+        return 2
+    print(format_results(results))
+
+    status = 0
+    if args.compare:
+        stored = load_baseline(args.compare)
+        warn_if_different(stored.get("environment", {}))
+        rows = compare(results, stored["results"], args.threshold)
+        if args.filter != "*":
+            rows = [row for row in rows if row["name"] in results]
+        print()
+        print(format_comparison(rows))
+        if args.fail_on_regression and any(row["status"] == "slower" for row in rows):
+            status = 1
+    if args.save:
+        print(f"\nSaved {save_baseline(args.save, results)}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
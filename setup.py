@@ -14,13 +14,19 @@ setup(
         "Source": "https://github.com/solomeowl/backpack_exchange_sdk",
     },
     packages=find_packages(exclude=["tests"]),
-    package_data={"backpack_exchange_sdk": ["py.typed"]},
+    package_data={"backpack_exchange_sdk": ["py.typed", "testing/openapi.json"]},
     install_requires=[
         "requests>=2.31.0",
         "cryptography>=42.0.5",
         "websocket-client>=1.7.0",
     ],
     extras_require={
+        "async": [
+            "aiohttp>=3.8.0",
+        ],
+        "fast": [
+            "orjson>=3.8.0",
+        ],
         "dev": [
             "black>=24.2.0",
             "isort>=5.13.2",
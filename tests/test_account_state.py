@@ -0,0 +1,112 @@
+import time
+
+from backpack_exchange_sdk import AccountState
+
+
+class AccountClient:
+    def __init__(self):
+        self.positions = [
+            {"symbol": "SOL_USDC_PERP", "netQuantity": "2", "entryPrice": "140"},
+            {"symbol": "BTC_USDC_PERP", "netQuantity": "0"},
+        ]
+        self.balances = {"USDC": {"available": "100", "locked": "0", "staked": "0"}}
+        self.balance_calls = 0
+
+    def get_open_positions(self):
+        return self.positions
+
+    def get_balances(self):
+        self.balance_calls += 1
+        return dict(self.balances)
+
+    def get_collateral(self):
+        return {"netEquity": "1000"}
+
+
+class FakeWs:
+    def __init__(self):
+        self.callbacks = {}
+
+    def subscribe(self, streams, callback, is_private=False):
+        for stream in streams:
+            self.callbacks[stream] = callback
+
+    def on_gap(self, callback, streams=None):
+        pass
+
+
+def test_seed_and_position_updates():
+    state = AccountState(AccountClient())
+    state.seed()
+    assert list(state.positions) == ["SOL_USDC_PERP"]
+    assert state.balance("USDC")["available"] == "100"
+    assert state.collateral["netEquity"] == "1000"
+
+    state.apply_position_update({"e": "positionAdjusted", "s": "SOL_USDC_PERP", "q": "3", "M": "141"})
+    assert state.position("SOL_USDC_PERP") == {
+        "symbol": "SOL_USDC_PERP",
+        "netQuantity": "3",
+        "entryPrice": "140",
+        "markPrice": "141",
+    }
+    state.apply_position_update({"e": "positionOpened", "s": "ETH_USDC_PERP", "q": "-1"})
+    assert state.position("ETH_USDC_PERP")["netQuantity"] == "-1"
+    state.apply_position_update({"e": "positionClosed", "s": "ETH_USDC_PERP", "q": "0"})
+    assert state.position("ETH_USDC_PERP") is None
+    assert set(state.snapshot()["positions"]) == {"SOL_USDC_PERP"}
+
+
+def test_reconcile_reports_drift():
+    client = AccountClient()
+    drifts = []
+    state = AccountState(client, on_drift=drifts.append)
+    state.seed()
+    assert state.reconcile() == {"positions": {}, "balances": {}}
+    client.positions = []
+    client.balances = {"USDC": {"available": "90", "locked": "5", "staked": "0"}}
+    drift = state.reconcile()
+    assert set(drift["positions"]) == {"SOL_USDC_PERP"}
+    assert set(drift["balances"]) == {"USDC"}
+    assert drifts == [drift] and state.drifts == 1
+    assert state.positions == {} and state.balance("USDC")["available"] == "90"
+
+
+def test_reconcile_keeps_stream_updates_made_during_the_fetch():
+    client = AccountClient()
+    state = AccountState(client)
+    state.seed()
+    stale = [{"symbol": "SOL_USDC_PERP", "netQuantity": "2"}]
+
+    def fetch_while_streaming():
+        state.apply_position_update({"e": "positionAdjusted", "s": "SOL_USDC_PERP", "q": "3"})
+        state.apply_position_update({"e": "positionOpened", "s": "ETH_USDC_PERP", "q": "-1"})
+        return stale
+
+    client.get_open_positions = fetch_while_streaming
+    assert state.reconcile() == {"positions": {}, "balances": {}}
+    assert state.position("SOL_USDC_PERP")["netQuantity"] == "3"
+    assert state.position("ETH_USDC_PERP")["netQuantity"] == "-1"
+
+    client.get_open_positions = lambda: stale
+    assert set(state.reconcile()["positions"]) == {"SOL_USDC_PERP", "ETH_USDC_PERP"}
+    assert list(state.positions) == ["SOL_USDC_PERP"] and state.position("SOL_USDC_PERP")["netQuantity"] == "2"
+
+
+def test_fills_trigger_one_debounced_balance_refresh():
+    client = AccountClient()
+    ws = FakeWs()
+    state = AccountState(client, reconcile_interval=60, refresh_delay=0.05).attach(ws)
+    try:
+        assert client.balance_calls == 1
+        client.balances = {"USDC": {"available": "50", "locked": "0", "staked": "0"}}
+        for _ in range(5):
+            ws.callbacks["account.orderUpdate"]({"e": "orderFill", "i": "1"})
+        ws.callbacks["account.orderUpdate"]({"e": "orderAccepted", "i": "2"})
+        deadline = time.time() + 2
+        while state.balance("USDC")["available"] != "50" and time.time() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.1)
+    finally:
+        state.stop()
+    assert state.balance("USDC")["available"] == "50"
+    assert client.balance_calls == 2
@@ -0,0 +1,103 @@
+import asyncio
+import base64
+import json
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+from cryptography.hazmat.primitives.asymmetric import ed25519  # noqa: E402
+
+from backpack_exchange_sdk import AsyncAuthenticationClient, AsyncPublicClient  # noqa: E402
+from backpack_exchange_sdk._base.errors import BackpackRateLimitError  # noqa: E402
+from backpack_exchange_sdk._base.utils import build_signing_string  # noqa: E402
+
+SECRET = ed25519.Ed25519PrivateKey.generate()
+SECRET_B64 = base64.b64encode(SECRET.private_bytes_raw()).decode()
+PUBLIC_B64 = base64.b64encode(SECRET.public_key().public_bytes_raw()).decode()
+
+
+async def serve(routes):
+    app = web.Application()
+    app.add_routes(routes)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/"
+
+
+def test_public_client_fans_out_on_one_session():
+    async def depth(request):
+        await asyncio.sleep(0.05)
+        return web.json_response({"symbol": request.query["symbol"], "bids": [], "asks": []})
+
+    async def main():
+        runner, url = await serve([web.get("/api/v1/depth", depth)])
+        try:
+            async with AsyncPublicClient(base_url=url) as client:
+                symbols = [f"S{i}_USDC" for i in range(50)]
+                results = await asyncio.gather(*(client.get_depth(s) for s in symbols))
+                session = client.session
+            assert [r["symbol"] for r in results] == symbols
+            assert session.closed
+        finally:
+            await runner.cleanup()
+
+    asyncio.run(main())
+
+
+def test_authenticated_client_signs_requests():
+    seen = {}
+
+    async def open_orders(request):
+        params = dict(request.query)
+        message = build_signing_string(
+            "orderQueryAll", params, int(request.headers["X-Timestamp"]), int(request.headers["X-Window"])
+        )
+        SECRET.public_key().verify(base64.b64decode(request.headers["X-Signature"]), message.encode())
+        seen["key"] = request.headers["X-API-Key"]
+        return web.json_response([{"id": "1", "symbol": params["symbol"]}])
+
+    async def execute(request):
+        body = await request.json()
+        return web.json_response({"id": "2", **body})
+
+    async def main():
+        runner, url = await serve([web.get("/api/v1/orders", open_orders), web.post("/api/v1/order", execute)])
+        try:
+            async with AsyncAuthenticationClient(PUBLIC_B64, SECRET_B64, base_url=url) as client:
+                orders = await client.get_open_orders(symbol="SOL_USDC")
+                placed = await client.execute_order("Limit", "Bid", "SOL_USDC", price="1", quantity="2")
+        finally:
+            await runner.cleanup()
+        assert orders == [{"id": "1", "symbol": "SOL_USDC"}]
+        assert placed["price"] == "1" and placed["postOnly"] is False
+        assert seen["key"] == PUBLIC_B64
+
+    asyncio.run(main())
+
+
+def test_retries_then_maps_errors():
+    calls = []
+
+    async def limited(request):
+        calls.append(1)
+        return web.json_response({"code": "TOO_MANY_REQUESTS", "message": "slow down"}, status=429)
+
+    async def main():
+        runner, url = await serve([web.get("/api/v1/ticker", limited)])
+        try:
+            async with AsyncPublicClient(base_url=url, max_retries=2, backoff_factor=0) as client:
+                with pytest.raises(BackpackRateLimitError):
+                    await client.get_ticker("SOL_USDC")
+        finally:
+            await runner.cleanup()
+
+    asyncio.run(main())
+    assert len(calls) == 3
+
+
+def test_query_params_lowercase_booleans():
+    assert json.dumps(AsyncPublicClient._query_params({"a": True, "b": 1})) == '{"a": "true", "b": 1}'
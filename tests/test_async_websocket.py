@@ -0,0 +1,85 @@
+import asyncio
+import json
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+
+from backpack_exchange_sdk import AsyncWebSocketClient  # noqa: E402
+
+
+async def serve(handler):
+    app = web.Application()
+    app.add_routes([web.get("/", handler)])
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"ws://127.0.0.1:{port}/"
+
+
+def test_streams_are_delivered_per_iterator_and_resubscribed_after_reconnect():
+    subscriptions = []
+
+    async def handler(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        msg = await ws.receive()
+        payload = json.loads(msg.data)
+        subscriptions.append(payload["params"])
+        for i in range(2):
+            for stream in payload["params"]:
+                await ws.send_str(json.dumps({"stream": stream, "data": {"n": i, "s": stream}}))
+        if len(subscriptions) == 1:
+            await ws.close()
+        else:
+            await asyncio.sleep(1)
+        return ws
+
+    async def main():
+        runner, url = await serve(handler)
+        try:
+            async with AsyncWebSocketClient(base_url=url, reconnect_delay=0.01) as ws:
+                await ws.subscribe(["depth.SOL_USDC", "trade.SOL_USDC"])
+                gaps = []
+
+                async def on_gap(name):
+                    gaps.append(name)
+
+                ws.on_gap(on_gap, ["depth.SOL_USDC"])
+                depth = ws.stream("depth.SOL_USDC")
+                trades = ws.stream("trade.SOL_USDC")
+                got_depth = [await asyncio.wait_for(depth.get(), 2) for _ in range(4)]
+                got_trades = [await asyncio.wait_for(trades.get(), 2) for _ in range(4)]
+                await ws.unsubscribe(["trade.SOL_USDC"])
+                remaining = [m async for m in trades]
+        finally:
+            await runner.cleanup()
+        assert [m["n"] for m in got_depth] == [0, 1, 0, 1]
+        assert gaps == ["depth.SOL_USDC"] and depth.gaps == 1
+        assert {m["s"] for m in got_trades} == {"trade.SOL_USDC"}
+        assert remaining == []
+        assert subscriptions == [["depth.SOL_USDC", "trade.SOL_USDC"]] * 2
+
+    asyncio.run(main())
+
+
+def test_private_subscribe_requires_credentials():
+    async def handler(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        await ws.receive()
+        return ws
+
+    async def main():
+        runner, url = await serve(handler)
+        try:
+            async with AsyncWebSocketClient(base_url=url) as ws:
+                with pytest.raises(ValueError):
+                    await ws.subscribe(["account.orderUpdate"], is_private=True)
+        finally:
+            await runner.cleanup()
+
+    asyncio.run(main())
@@ -0,0 +1,105 @@
+import base64
+import time
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from cryptography.hazmat.primitives.asymmetric import ed25519  # noqa: E402
+
+from backpack_exchange_sdk import AuthenticationClient, ClockSync, OrderTracker, WebSocketClient  # noqa: E402
+from backpack_exchange_sdk._base.errors import (  # noqa: E402
+    BackpackInvalidRequestError,
+    BackpackNotFoundError,
+    BackpackUnauthorizedError,
+)
+from backpack_exchange_sdk.testing import MockExchange  # noqa: E402
+
+SECRET = ed25519.Ed25519PrivateKey.generate()
+SECRET_B64 = base64.b64encode(SECRET.private_bytes_raw()).decode()
+PUBLIC_B64 = base64.b64encode(SECRET.public_key().public_bytes_raw()).decode()
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline
+        time.sleep(0.02)
+
+
+@pytest.fixture(scope="module")
+def exchange():
+    with MockExchange(api_keys=[PUBLIC_B64], rate=20, seed=3) as exchange:
+        yield exchange
+
+
+@pytest.fixture
+def client(exchange):
+    client = AuthenticationClient(PUBLIC_B64, SECRET_B64, base_url=exchange.url)
+    yield client
+    client.cancel_open_orders("SOL_USDC")
+
+
+def test_signed_requests_are_accepted(client):
+    assert client.get_balances()["USDC"]["available"] == "100000"
+    assert client.get_collateral()["netEquity"] == "100000"
+    assert client.get_fill_history(limit=10) == []
+
+
+def test_bad_signatures_are_rejected(exchange):
+    other = base64.b64encode(ed25519.Ed25519PrivateKey.generate().private_bytes_raw()).decode()
+    with pytest.raises(BackpackInvalidRequestError, match="signature"):
+        AuthenticationClient(PUBLIC_B64, other, base_url=exchange.url).get_balances()
+
+    unknown = ed25519.Ed25519PrivateKey.generate()
+    key = base64.b64encode(unknown.public_key().public_bytes_raw()).decode()
+    secret = base64.b64encode(unknown.private_bytes_raw()).decode()
+    with pytest.raises(BackpackUnauthorizedError):
+        AuthenticationClient(key, secret, base_url=exchange.url).get_balances()
+
+    skewed = ClockSync(client=object())
+    skewed.offset = -10.0
+    with pytest.raises(BackpackInvalidRequestError, match="expired"):
+        AuthenticationClient(PUBLIC_B64, SECRET_B64, base_url=exchange.url, clock=skewed).get_balances()
+
+
+def test_order_lifecycle(client):
+    order = client.execute_order("Limit", "Bid", "SOL_USDC", price="140.00", quantity="1.5", clientId=42, postOnly=True)
+    assert order["status"] == "New"
+    assert [o["id"] for o in client.get_open_orders(symbol="SOL_USDC")] == [order["id"]]
+    assert client.get_users_open_orders("SOL_USDC", clientId=42)["id"] == order["id"]
+    assert client.cancel_open_order("SOL_USDC", orderId=order["id"])["status"] == "Cancelled"
+    with pytest.raises(BackpackNotFoundError):
+        client.get_users_open_orders("SOL_USDC", orderId=order["id"])
+
+    filled = client.execute_order("Market", "Ask", "SOL_USDC", quantity="2")
+    assert filled["status"] == "Filled" and filled["executedQuantity"] == "2"
+
+
+def test_batch_orders_verify_batch_signature(client):
+    orders = [
+        {"symbol": "SOL_USDC", "side": "Bid", "orderType": "Limit", "price": f"13{i}.00", "quantity": "1"}
+        for i in range(3)
+    ]
+    orders.append({"symbol": "NOPE_USDC", "side": "Bid", "orderType": "Limit", "price": "1", "quantity": "1"})
+    results = client.execute_batch_orders(orders)
+    assert [r.get("status") for r in results[:3]] == ["New"] * 3
+    assert results[3]["operation"] == "Err" and results[3]["code"] == "INVALID_MARKET"
+
+
+def test_private_stream_and_reconnect(exchange, client):
+    ws = WebSocketClient(PUBLIC_B64, SECRET_B64, base_url=exchange.ws_url, reconnect_delay=0.05)
+    try:
+        tracker = OrderTracker(client=client, symbol="SOL_USDC").attach(ws)
+        gaps = []
+        ws.on_gap(gaps.append)
+        order = client.execute_order("Limit", "Ask", "SOL_USDC", price="160.00", quantity="1")
+        wait_for(lambda: tracker.get(order["id"]) is not None)
+
+        exchange.disconnect()
+        wait_for(lambda: gaps == ["account.orderUpdate.SOL_USDC"])
+        client.cancel_open_order("SOL_USDC", orderId=order["id"])
+        wait_for(lambda: tracker.closed_status(order["id"]) == "Cancelled")
+        assert tracker.reconciles == 2
+    finally:
+        ws.close()
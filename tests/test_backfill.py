@@ -0,0 +1,90 @@
+import asyncio
+import threading
+from datetime import datetime, timezone
+
+import pytest
+
+from backpack_exchange_sdk.backfill import backfill_klines, backfill_klines_async, interval_seconds, kline_windows
+from backpack_exchange_sdk.columnar import KlineColumns, parse_timestamp
+
+
+def iso(ts):
+    return datetime.fromtimestamp(ts, timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def candles(start, end, step=60):
+    # Inclusive end mimics an API that returns the boundary candle twice across windows.
+    return [
+        {
+            "start": iso(t),
+            "end": iso(t + step),
+            "open": "1",
+            "high": "2",
+            "low": "0.5",
+            "close": str(t),
+            "volume": "10",
+            "quoteVolume": "15",
+            "trades": "3",
+        }
+        for t in range(start, end + 1, step)
+    ]
+
+
+class KlineSource:
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def get_klines(self, symbol, interval, start_time, end_time=None, priceType=None):
+        with self.lock:
+            self.calls.append((start_time, end_time, priceType))
+        return candles(start_time, end_time, interval_seconds(interval))
+
+
+def test_kline_windows_cover_range():
+    assert kline_windows(0, 250 * 60, "1m", max_candles=100) == [(0, 6000), (6000, 12000), (12000, 15000)]
+
+
+def test_parse_timestamp_formats():
+    assert parse_timestamp("2024-01-01 00:00:00") == 1704067200
+    assert parse_timestamp("2024-01-01T00:00:00Z") == 1704067200
+    assert parse_timestamp("1704067200000") == 1704067200
+    assert parse_timestamp(1704067200) == 1704067200
+
+
+def test_backfill_dedupes_boundaries_and_returns_columns():
+    source = KlineSource()
+    start = 1704067200
+    end = start + 2500 * 60
+    result = backfill_klines(source, "SOL_USDC", "1m", start, end, price_type="Mark", max_candles=1000)
+    assert len(source.calls) == 3
+    assert all(call[2] == "Mark" for call in source.calls)
+    assert len(result) == 2500
+    assert result.start[0] == start and result.start[-1] == end - 60
+    assert list(result.start) == sorted(set(result.start))
+    assert result.close[10] == float(start + 600)
+
+
+def test_backfill_async_and_numpy_views():
+    np = pytest.importorskip("numpy")
+    source = KlineSource()
+
+    class AsyncSource:
+        async def get_klines(self, *args):
+            await asyncio.sleep(0)
+            return source.get_klines(*args)
+
+    start = 1704067200
+    result = asyncio.run(
+        backfill_klines_async(AsyncSource(), "SOL_USDC", "1h", start, start + 48 * 3600, max_candles=10)
+    )
+    arrays = result.to_numpy()
+    assert arrays["start"].dtype == np.int64 and arrays["close"].dtype == np.float64
+    assert len(arrays["start"]) == 48
+    assert (np.diff(arrays["start"]) == 3600).all()
+
+
+def test_concat_and_slice():
+    part = KlineColumns.from_klines(candles(0, 540))
+    merged = KlineColumns.concat([part.slice(0, 300), part.slice(300, 600)])
+    assert list(merged.start) == list(part.start)
@@ -0,0 +1,22 @@
+from benchmarks.harness import compare, measure
+
+
+def test_measure_reports_per_call_times():
+    calls = []
+    result = measure(lambda: calls.append(1), number=10, repeat=3)
+    assert len(calls) == 31
+    assert 0 <= result["min_us"] <= result["median_us"] and result["ops_per_s"] > 0
+
+
+def test_compare_classifies_changes():
+    baseline = {name: {"median_us": 10.0} for name in ("a", "b", "c", "gone")}
+    results = {"a": {"median_us": 12.0}, "b": {"median_us": 8.0}, "c": {"median_us": 10.5}, "new": {"median_us": 1.0}}
+    rows = {row["name"]: row for row in compare(results, baseline, threshold=0.1)}
+    assert {name: row["status"] for name, row in rows.items()} == {
+        "a": "slower",
+        "b": "faster",
+        "c": "same",
+        "gone": "missing",
+        "new": "new",
+    }
+    assert abs(rows["a"]["change"] - 0.2) < 1e-9
@@ -0,0 +1,86 @@
+import base64
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from cryptography.hazmat.primitives.asymmetric import ed25519
+
+from backpack_exchange_sdk import AuthenticationClient
+from backpack_exchange_sdk._base.errors import BackpackInvalidRequestError
+from backpack_exchange_sdk._base.utils import build_batch_signing_string, merge_batch_results
+
+KEY = ed25519.Ed25519PrivateKey.generate()
+SECRET_B64 = base64.b64encode(KEY.private_bytes_raw()).decode()
+PUBLIC_B64 = base64.b64encode(KEY.public_key().public_bytes_raw()).decode()
+
+
+class BatchHandler(BaseHTTPRequestHandler):
+    batch_sizes = []
+
+    def do_POST(self):
+        orders = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        message = build_batch_signing_string(orders, int(self.headers["X-Timestamp"]), int(self.headers["X-Window"]))
+        KEY.public_key().verify(base64.b64decode(self.headers["X-Signature"]), message.encode())
+        self.batch_sizes.append(len(orders))
+        if any(order["price"] == "bad" for order in orders):
+            body, status = {"code": "INVALID_ORDER", "message": "bad price"}, 400
+        else:
+            body, status = [{"operation": "Ok", "clientId": order["clientId"]} for order in orders], 200
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_submit_orders_bulk_chunks_and_preserves_order():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), BatchHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        client = AuthenticationClient(PUBLIC_B64, SECRET_B64, base_url=f"http://127.0.0.1:{server.server_port}/")
+        orders = [
+            {
+                "symbol": "SOL_USDC",
+                "side": "Bid",
+                "orderType": "Limit",
+                "price": str(100 + i),
+                "quantity": "1",
+                "clientId": i,
+            }
+            for i in range(120)
+        ]
+        orders[55]["price"] = "bad"
+        results = client.submit_orders_bulk(orders, chunk_size=50)
+    finally:
+        server.shutdown()
+    assert sorted(BatchHandler.batch_sizes) == [20, 50, 50]
+    assert len(results) == 120
+    assert [r["clientId"] for r in results[:50]] == list(range(50))
+    assert all(r["operation"] == "Err" and r["code"] == "INVALID_ORDER" for r in results[50:100])
+    assert [r["clientId"] for r in results[100:]] == list(range(100, 120))
+
+
+def test_merge_batch_results_expands_errors_per_order():
+    error = BackpackInvalidRequestError(code="INVALID_ORDER", message="bad")
+    merged = merge_batch_results([[{}], [{}, {}]], [[{"operation": "Ok"}], error])
+    assert merged[0] == {"operation": "Ok"}
+    assert merged[1] == merged[2] == {"operation": "Err", "code": "INVALID_ORDER", "message": str(error)}
+    assert merged[1] is not merged[2]
+
+
+def test_merge_batch_results_rejects_mismatched_responses():
+    ok = [{"operation": "Ok"}]
+    merged = merge_batch_results([[{}, {}], [{}], [{}]], [ok, {"code": "x"}, ok])
+    assert [r["operation"] for r in merged] == ["Err", "Err", "Err", "Ok"]
+    assert merged[0] == merged[1]
+    assert merged[0]["code"] == "UNEXPECTED_RESPONSE"
+    assert merged[0]["message"] == "Expected 2 order results, got 1"
+    assert merged[2]["message"] == "Expected 1 order results, got dict"
+
+
+def test_submit_orders_bulk_with_no_orders():
+    assert AuthenticationClient(PUBLIC_B64, SECRET_B64).submit_orders_bulk([]) == []
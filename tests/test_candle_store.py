@@ -0,0 +1,155 @@
+import asyncio
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from backpack_exchange_sdk.backfill import interval_seconds
+from backpack_exchange_sdk.candle_store import CandleStore, merge_ranges, subtract_ranges
+from backpack_exchange_sdk.columnar import KlineColumns
+
+
+class KlineSource:
+    def __init__(self):
+        self.calls = []
+
+    def get_klines(self, symbol, interval, start_time, end_time=None, priceType=None):
+        self.calls.append((start_time, end_time, priceType))
+        step = interval_seconds(interval)
+        return [
+            {
+                "start": str(t),
+                "open": "1",
+                "high": "2",
+                "low": "0.5",
+                "close": str(t),
+                "volume": "10",
+                "quoteVolume": "15",
+                "trades": "3",
+            }
+            for t in range(start_time, end_time + 1, step)
+        ]
+
+
+def test_range_helpers():
+    assert merge_ranges([(5, 8), (0, 3), (3, 4), (7, 10), (12, 12)]) == [(0, 4), (5, 10)]
+    assert subtract_ranges(0, 20, [(2, 4), (6, 8), (15, 30)]) == [(0, 2), (4, 6), (8, 15)]
+    assert subtract_ranges(3, 5, [(0, 10)]) == []
+
+
+def test_sync_fetches_only_missing_ranges(tmp_path):
+    store = CandleStore(str(tmp_path))
+    source = KlineSource()
+    assert store.sync(source, "SOL_USDC", "1m", 6000, 12000, max_candles=50) == [(6000, 12000)]
+    assert len(source.calls) == 2
+    assert store.sync(source, "SOL_USDC", "1m", 6000, 12000) == []
+    assert len(source.calls) == 2
+
+    # Extending on both sides fetches only the two new pieces (prepend merges, append extends the files).
+    assert store.sync(source, "SOL_USDC", "1m", 3000, 15000) == [(3000, 6000), (12000, 15000)]
+    assert store.coverage("SOL_USDC", "1m") == [(3000, 15000)]
+    candles = store.read("SOL_USDC", "1m")
+    assert list(candles.start) == list(range(3000, 15000, 60))
+    assert candles.close[0] == 3000.0
+    assert list(store.read("SOL_USDC", "1m", 6000, 6180).start) == [6000, 6060, 6120]
+    assert store.missing("SOL_USDC", "1m", 0, 16000) == [(0, 3000), (15000, 16000)]
+
+
+def test_store_persists_and_maps_columns(tmp_path):
+    np = pytest.importorskip("numpy")
+    CandleStore(str(tmp_path)).sync(KlineSource(), "SOL_USDC", "1h", 0, 36000, price_type="Mark")
+    path = tmp_path / "SOL_USDC" / "1h" / "Mark"
+    assert json.loads((path / "meta.json").read_text())["covered"] == [[0, 36000]]
+    assert os.path.getsize(path / "close.0.bin") == 10 * 8
+
+    reopened = CandleStore(str(tmp_path))
+    assert reopened.missing("SOL_USDC", "1h", 0, 36000, price_type="Mark") == []
+    arrays = reopened.read("SOL_USDC", "1h", price_type="Mark").to_numpy()
+    assert arrays["start"].dtype == np.int64 and not arrays["close"].flags.writeable
+    assert (np.diff(arrays["start"]) == 3600).all()
+    assert len(reopened.read("SOL_USDC", "1h")) == 0
+
+
+def test_interrupted_append_is_repaired(tmp_path):
+    CandleStore(str(tmp_path)).sync(KlineSource(), "SOL_USDC", "1m", 0, 600)
+    with open(tmp_path / "SOL_USDC" / "1m" / "default" / "open.0.bin", "ab") as f:
+        f.write(b"\0" * 12)
+    assert len(CandleStore(str(tmp_path)).read("SOL_USDC", "1m")) == 10
+
+
+def test_interrupted_merge_keeps_previous_generation(tmp_path, monkeypatch):
+    CandleStore(str(tmp_path)).sync(KlineSource(), "SOL_USDC", "1m", 600, 1200)
+    path = tmp_path / "SOL_USDC" / "1m" / "default"
+    replace = os.replace
+
+    def crash_on_switch(src, dst):
+        with open(src, encoding="utf-8") as f:
+            if json.load(f)["generation"] == 1:
+                raise OSError("crash before switching generations")
+        replace(src, dst)
+
+    store = CandleStore(str(tmp_path))
+    monkeypatch.setattr(os, "replace", crash_on_switch)
+    with pytest.raises(OSError):
+        store.sync(KlineSource(), "SOL_USDC", "1m", 0, 600)
+    monkeypatch.setattr(os, "replace", replace)
+
+    reopened = CandleStore(str(tmp_path))
+    assert list(reopened.read("SOL_USDC", "1m").start) == list(range(600, 1200, 60))
+    files = sorted(name for name in os.listdir(path) if name.endswith(".bin"))
+    assert files == sorted(f"{field}.0.bin" for field in KlineColumns.FIELDS)
+    assert reopened.sync(KlineSource(), "SOL_USDC", "1m", 0, 600) == [(0, 600)]
+    assert list(CandleStore(str(tmp_path)).read("SOL_USDC", "1m").start) == list(range(0, 1200, 60))
+    assert json.loads((path / "meta.json").read_text())["generation"] == 1
+
+
+def test_read_is_not_blocked_by_sync(tmp_path):
+    store = CandleStore(str(tmp_path))
+    store.sync(KlineSource(), "SOL_USDC", "1m", 600, 1200)
+    fetching, release = threading.Event(), threading.Event()
+
+    class SlowSource(KlineSource):
+        def get_klines(self, *args, **kwargs):
+            fetching.set()
+            release.wait(5)
+            return super().get_klines(*args, **kwargs)
+
+    worker = threading.Thread(target=store.sync, args=(SlowSource(), "SOL_USDC", "1m", 1200, 1800))
+    worker.start()
+    assert fetching.wait(5)
+    assert len(store.read("SOL_USDC", "1m")) == 10
+    release.set()
+    worker.join(5)
+    assert len(store.read("SOL_USDC", "1m")) == 20
+
+
+def test_open_candles_are_not_stored(tmp_path):
+    store = CandleStore(str(tmp_path))
+    now = int(time.time()) // 60 * 60
+    store.sync(KlineSource(), "SOL_USDC", "1m", now - 600, now + 600)
+    ((covered_start, covered_end),) = store.coverage("SOL_USDC", "1m")
+    assert covered_start == now - 600 and covered_end <= time.time() - 60
+    assert max(store.read("SOL_USDC", "1m").start) < covered_end
+
+
+def test_sync_async_with_mock_exchange(tmp_path):
+    pytest.importorskip("aiohttp")
+    from backpack_exchange_sdk import AsyncPublicClient, PublicClient
+    from backpack_exchange_sdk.testing import MockExchange
+
+    start = (int(time.time()) - 86400) // 3600 * 3600
+    with MockExchange(rate=0, seed=17) as exchange:
+        store = CandleStore(str(tmp_path))
+
+        async def main():
+            async with AsyncPublicClient(base_url=exchange.url) as client:
+                return await store.sync_async(client, "BTC_USDC", "5m", start, start + 7200)
+
+        assert asyncio.run(main()) == [(start, start + 7200)]
+        requests = exchange.stats["requests"]
+        assert store.sync(PublicClient(base_url=exchange.url), "BTC_USDC", "5m", start, start + 3600) == []
+        assert exchange.stats["requests"] == requests
+        direct = PublicClient(base_url=exchange.url).get_klines("BTC_USDC", "5m", start, start + 7200, as_arrays=True)
+        assert list(store.read("BTC_USDC", "5m").close) == list(direct.close)
@@ -0,0 +1,92 @@
+import base64
+import time
+from decimal import Decimal
+
+import pytest
+
+from backpack_exchange_sdk import AuthenticationClient, PublicClient
+from backpack_exchange_sdk.catalog import MarketCatalog, MarketFilters
+
+MARKETS = [
+    {
+        "symbol": "SOL_USDC",
+        "filters": {
+            "price": {"tickSize": "0.01", "minPrice": "0.01", "maxPrice": None},
+            "quantity": {"stepSize": "0.01", "minQuantity": "0.01", "maxQuantity": "1000"},
+        },
+    },
+    {"symbol": "BTC_USDC", "filters": {"price": {"tickSize": "0.1"}, "quantity": {"stepSize": "0.00001"}}},
+]
+
+
+class MarketSource:
+    def __init__(self):
+        self.calls = 0
+
+    def get_markets(self):
+        self.calls += 1
+        return MARKETS
+
+    def get_assets(self):
+        return [{"symbol": "SOL", "tokens": []}]
+
+
+def test_catalog_caches_until_ttl_expires():
+    source = MarketSource()
+    catalog = MarketCatalog(source, ttl=60, include_assets=True)
+    assert catalog.market("SOL_USDC")["symbol"] == "SOL_USDC"
+    assert "BTC_USDC" in catalog
+    assert catalog.asset("SOL") == {"symbol": "SOL", "tokens": []}
+    catalog.filters("BTC_USDC")
+    assert source.calls == 1
+    catalog.updated -= 61
+    assert catalog.symbols() == ["SOL_USDC", "BTC_USDC"]
+    assert source.calls == 2
+
+
+def test_background_refresh():
+    source = MarketSource()
+    catalog = MarketCatalog(source, ttl=0.05, background=True)
+    try:
+        deadline = time.time() + 2
+        while source.calls < 3 and time.time() < deadline:
+            time.sleep(0.01)
+        assert source.calls >= 3
+        assert catalog.filters("SOL_USDC").tick_size == Decimal("0.01")
+    finally:
+        catalog.stop()
+
+
+def test_filters_round_and_validate():
+    filters = MarketFilters(MARKETS[0])
+    assert filters.round_price("141.23456") == Decimal("141.23")
+    assert filters.round_quantity("0.019") == Decimal("0.01")
+    assert filters.validate(price="141.23", quantity="1") == []
+    errors = filters.validate(price="141.234", quantity="2000")
+    assert len(errors) == 2
+
+
+def test_catalog_shared_between_clients():
+    public = PublicClient(base_url="http://catalog.test/")
+    auth = AuthenticationClient("key", base64.b64encode(bytes(32)).decode(), base_url="http://catalog.test/")
+    assert public.market_catalog is auth.market_catalog
+    assert public.market_catalog is not PublicClient().market_catalog
+
+
+def test_shared_catalog_fetches_with_the_calling_client():
+    pytest.importorskip("aiohttp")
+    from backpack_exchange_sdk import LatencyRecorder, RateLimiter
+    from backpack_exchange_sdk.testing import MockExchange
+
+    latency = LatencyRecorder()
+    limiter = RateLimiter()
+    with MockExchange(rate=0, seed=3) as exchange:
+        auth = AuthenticationClient(
+            "key", base64.b64encode(bytes(32)).decode(), base_url=exchange.url, hooks=[latency], rate_limiter=limiter
+        )
+        catalog = auth.market_catalog
+        assert catalog.client.rate_limiter is limiter and catalog.client.session is auth.session
+        assert catalog.market("SOL_USDC")["symbol"] == "SOL_USDC"
+    assert latency.summary()["api/v1/markets"]["total"]["count"] == 1
+    public = PublicClient(base_url="http://catalog-public.test/")
+    assert public.market_catalog.client is public
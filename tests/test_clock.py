@@ -0,0 +1,89 @@
+import asyncio
+import base64
+import time
+
+import pytest
+
+from backpack_exchange_sdk import AuthenticationClient, ClockSync
+
+
+class SkewedServer:
+    """Server clock 2.5s ahead of local time; replies stamped mid-flight."""
+
+    def __init__(self, delays):
+        self.delays = list(delays)
+
+    def get_system_time(self):
+        delay = self.delays.pop(0)
+        time.sleep(delay / 2)
+        stamp = str(int((time.time() + 2.5) * 1e3))
+        time.sleep(delay / 2)
+        return stamp
+
+
+class AsyncSkewedServer:
+    async def get_system_time(self):
+        return int((time.time() + 2.5) * 1e3)
+
+
+def test_min_rtt_sample_wins():
+    clock = ClockSync(client=object(), samples=4)
+    clock.add_sample(100.0, 100_300, 100.4)  # slow, asymmetric: offset 0.1
+    clock.add_sample(200.0, 200_011, 200.02)  # fast: offset 0.001
+    clock.add_sample(300.0, 300_500, 300.6)
+    assert abs(clock.rtt - 0.02) < 1e-6
+    assert abs(clock.offset - 0.001) < 1e-6
+
+
+def test_sync_estimates_offset():
+    clock = ClockSync(SkewedServer([0.02, 0.002, 0.01]))
+    offset = clock.sync(3)
+    assert clock.synced
+    assert abs(offset - 2.5) < 0.01
+    assert abs(clock.now_ms() - (time.time() + 2.5) * 1e3) < 20
+
+
+def test_sync_async():
+    clock = ClockSync(AsyncSkewedServer())
+    offset = asyncio.run(clock.sync_async(2))
+    assert abs(offset - 2.5) < 0.01
+
+
+def test_background_sampling_with_async_client():
+    clock = ClockSync(AsyncSkewedServer(), interval=0.01)
+    with pytest.raises(TypeError):
+        clock.start()
+    with pytest.raises(TypeError):
+        clock.sample()
+
+    async def main():
+        clock.start_async()
+        for _ in range(100):
+            if clock.synced:
+                break
+            await asyncio.sleep(0.01)
+        clock.stop()
+
+    asyncio.run(main())
+    assert abs(clock.offset - 2.5) < 0.01 and clock.last_error is None
+
+
+def test_background_errors_are_reported():
+    class Down:
+        def get_system_time(self):
+            raise ConnectionError("down")
+
+    clock = ClockSync(Down(), interval=0.01, background=True)
+    deadline = time.time() + 5
+    while clock.last_error is None and time.time() < deadline:
+        time.sleep(0.01)
+    clock.stop()
+    assert isinstance(clock.last_error, ConnectionError) and not clock.synced
+
+
+def test_authenticated_client_uses_clock_for_timestamp():
+    clock = ClockSync(client=object())
+    clock.offset = 10.0
+    client = AuthenticationClient("key", base64.b64encode(bytes(32)).decode(), clock=clock)
+    assert abs(client._timestamp() - (time.time() + 10.0) * 1e3) < 50
+    assert abs(AuthenticationClient("key", base64.b64encode(bytes(32)).decode())._timestamp() - time.time() * 1e3) < 50
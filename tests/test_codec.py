@@ -0,0 +1,36 @@
+import pytest
+
+from backpack_exchange_sdk._base import codec
+
+
+@pytest.fixture(autouse=True)
+def restore_codec():
+    original = codec.get_codec()
+    yield
+    codec.set_codec(original)
+
+
+@pytest.mark.parametrize("name", codec.available_codecs())
+def test_codecs_round_trip_and_raise_value_error(name):
+    selected = codec.set_codec(name)
+    assert codec.get_codec() is selected and selected.name == name
+    frame = {"stream": "depth.SOL_USDC", "data": {"a": [["1.5", "2"]], "U": 1, "u": 2, "x": True}}
+    assert codec.loads(codec.dumps(frame)) == frame
+    assert codec.loads(codec.dumps(frame).decode()) == frame
+    with pytest.raises(ValueError):
+        codec.loads(b"pong")
+
+
+def test_stdlib_is_always_available_and_unknown_is_rejected():
+    assert codec.available_codecs()[-1] == "stdlib"
+    with pytest.raises(ValueError):
+        codec.set_codec("simdjson")
+
+
+def test_peek_stream_reads_top_level_name():
+    assert codec.peek_stream('{"stream":"bookTicker.SOL_USDC","data":{"a":"1"}}') == "bookTicker.SOL_USDC"
+    assert codec.peek_stream('{"data": {"a": "1"}, "stream": "depth.SOL_USDC"}') == "depth.SOL_USDC"
+    assert codec.peek_stream('{"id": 1, "result": null}') is None
+    nested = '{"data":{"stream":"x"},"stream":"bookTicker.SOL_USDC"}'
+    assert codec.peek_stream(nested) == "bookTicker.SOL_USDC"
+    assert codec.peek_stream('{"stream":"a\\"b","data":{}}') == 'a"b'
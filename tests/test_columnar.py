@@ -0,0 +1,109 @@
+import base64
+import time
+
+import pytest
+
+from backpack_exchange_sdk.columnar import FillColumns, KlineColumns, TradeColumns
+
+TRADES = [
+    {
+        "id": 3,
+        "price": "10.5",
+        "quantity": "2",
+        "quoteQuantity": "21",
+        "timestamp": 1700000000300,
+        "isBuyerMaker": True,
+    },
+    {
+        "id": 1,
+        "price": "10.1",
+        "quantity": "1",
+        "quoteQuantity": "10.1",
+        "timestamp": 1700000000100,
+        "isBuyerMaker": False,
+    },
+    {
+        "id": 2,
+        "price": "10.2",
+        "quantity": "3",
+        "quoteQuantity": "30.6",
+        "timestamp": 1700000000200,
+        "isBuyerMaker": False,
+    },
+]
+
+
+def test_trades_sorted_into_typed_columns():
+    columns = TradeColumns.from_trades(TRADES)
+    assert len(columns) == 3 and repr(columns) == "TradeColumns(3 rows)"
+    assert list(columns.id) == [1, 2, 3]
+    assert list(columns.price) == [10.1, 10.2, 10.5]
+    assert list(columns.is_buyer_maker) == [0, 0, 1]
+    assert list(columns.slice(1700000000200, 1700000000300).id) == [2]
+
+
+def test_fills_columns_and_numpy_views():
+    np = pytest.importorskip("numpy")
+    fills = FillColumns.from_fills(
+        [
+            {
+                "tradeId": 8,
+                "orderId": "12",
+                "side": "Ask",
+                "price": "11",
+                "quantity": "1",
+                "fee": "0.01",
+                "isMaker": True,
+                "timestamp": "2024-01-01T00:00:02",
+            },
+            {
+                "tradeId": 7,
+                "orderId": "11",
+                "side": "Bid",
+                "price": "10",
+                "quantity": "2",
+                "fee": "0.02",
+                "isMaker": False,
+                "timestamp": "2024-01-01T00:00:01.500",
+            },
+        ]
+    )
+    assert list(fills.timestamp) == [1704067201500, 1704067202000]
+    assert list(fills.side) == [1, -1] and list(fills.order_id) == [11, 12]
+    arrays = fills.to_numpy()
+    assert arrays["timestamp"].dtype == np.int64 and arrays["price"].dtype == np.float64
+    assert arrays["side"].dtype == np.int8
+    assert float((arrays["price"] * arrays["quantity"] * arrays["side"]).sum()) == 9.0
+    assert set(TradeColumns().to_numpy()) == set(TradeColumns.FIELDS)
+
+
+def test_as_arrays_from_mock_exchange():
+    pytest.importorskip("aiohttp")
+    from cryptography.hazmat.primitives.asymmetric import ed25519
+
+    from backpack_exchange_sdk import AuthenticationClient, PublicClient
+    from backpack_exchange_sdk.testing import MockExchange
+
+    secret = ed25519.Ed25519PrivateKey.generate()
+    secret_b64 = base64.b64encode(secret.private_bytes_raw()).decode()
+    public_b64 = base64.b64encode(secret.public_key().public_bytes_raw()).decode()
+
+    with MockExchange(api_keys=[public_b64], rate=50, seed=13) as exchange:
+        public = PublicClient(base_url=exchange.url)
+        start = (int(time.time()) - 3600) // 60 * 60
+        klines = public.get_klines("SOL_USDC", "1m", start, start + 600, as_arrays=True)
+        assert isinstance(klines, KlineColumns) and len(klines) == 10
+        assert klines.start[0] == start
+
+        deadline = time.time() + 5
+        while not public.get_recent_trades("SOL_USDC"):
+            assert time.time() < deadline
+            time.sleep(0.05)
+        trades = public.get_recent_trades("SOL_USDC", as_arrays=True)
+        assert len(trades) > 0 and list(trades.timestamp) == sorted(trades.timestamp)
+
+        client = AuthenticationClient(public_b64, secret_b64, base_url=exchange.url)
+        for side in ("Bid", "Ask", "Bid"):
+            client.execute_order("Market", side, "SOL_USDC", quantity="1")
+        fills = client.get_fill_history(symbol="SOL_USDC", as_arrays=True)
+        assert list(fills.side) == [1, -1, 1] and list(fills.quantity) == [1.0, 1.0, 1.0]
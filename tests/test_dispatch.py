@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from backpack_exchange_sdk.dispatch import BLOCK, CONFLATE, Dispatcher, policy_for
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.005)
+    return condition()
+
+
+def test_policy_lookup():
+    policies = {"bookTicker": CONFLATE, "depth.SOL_USDC": BLOCK}
+    assert policy_for("bookTicker.SOL_USDC", policies, "drop_oldest") == CONFLATE
+    assert policy_for("depth.SOL_USDC", policies, "drop_oldest") == BLOCK
+    assert policy_for("depth.BTC_USDC", policies, "drop_oldest") == "drop_oldest"
+    with pytest.raises(ValueError):
+        Dispatcher(policy="newest")
+
+
+def test_slow_stream_does_not_delay_others_and_order_is_kept():
+    dispatcher = Dispatcher(workers=2)
+    release = threading.Event()
+    fast = []
+    try:
+        dispatcher.submit("trade.SLOW", 0, [lambda data: release.wait(2)])
+        for i in range(100):
+            dispatcher.submit("trade.FAST", i, [fast.append])
+        assert wait_for(lambda: len(fast) == 100)
+        assert fast == list(range(100))
+        release.set()
+        assert wait_for(lambda: dispatcher.stats()["trade.SLOW"]["delivered"] == 1)
+    finally:
+        release.set()
+        dispatcher.close()
+
+
+def test_overflow_policies_count_drops_and_conflations():
+    dispatcher = Dispatcher(workers=1, queue_size=3, policies={"bookTicker": CONFLATE})
+    release = threading.Event()
+    got = {"depth.X": [], "bookTicker.X": []}
+    try:
+        dispatcher.submit("gate", None, [lambda data: release.wait(2)])
+        for i in range(10):
+            dispatcher.submit("depth.X", i, [got["depth.X"].append])
+            dispatcher.submit("bookTicker.X", i, [got["bookTicker.X"].append])
+        stats = dispatcher.stats()
+        assert stats["depth.X"]["dropped"] == 7 and stats["depth.X"]["depth"] == 3
+        assert stats["bookTicker.X"]["conflated"] == 9 and stats["bookTicker.X"]["depth"] == 1
+        release.set()
+        assert wait_for(lambda: len(got["depth.X"]) == 3 and len(got["bookTicker.X"]) == 1)
+    finally:
+        release.set()
+        dispatcher.close()
+    assert got == {"depth.X": [7, 8, 9], "bookTicker.X": [9]}
+
+
+def test_block_policy_applies_back_pressure():
+    dispatcher = Dispatcher(workers=1, queue_size=2, policy=BLOCK)
+    release = threading.Event()
+    got = []
+    done = threading.Event()
+
+    def produce():
+        for i in range(5):
+            dispatcher.submit("depth.X", i, [lambda data: (release.wait(2), got.append(data))])
+        done.set()
+
+    try:
+        producer = threading.Thread(target=produce)
+        producer.start()
+        assert not done.wait(0.2)
+        release.set()
+        assert done.wait(2)
+        assert wait_for(lambda: len(got) == 5)
+    finally:
+        release.set()
+        dispatcher.close()
+    assert got == [0, 1, 2, 3, 4]
+    assert dispatcher.stats()["depth.X"]["dropped"] == 0
+
+
+def test_async_stream_conflates_to_latest():
+    aiohttp = pytest.importorskip("aiohttp")  # noqa: F841
+    from backpack_exchange_sdk.async_websocket import AsyncStream
+
+    async def main():
+        stream = AsyncStream("bookTicker.X", policy=CONFLATE)
+        for i in range(5):
+            stream._put({"n": i})
+        return await stream.get(), stream.conflated, stream.depth
+
+    assert asyncio.run(main()) == ({"n": 4}, 4, 0)
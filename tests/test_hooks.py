@@ -0,0 +1,142 @@
+import asyncio
+import base64
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from cryptography.hazmat.primitives.asymmetric import ed25519  # noqa: E402
+
+from backpack_exchange_sdk import (  # noqa: E402
+    AsyncAuthenticationClient,
+    AuthenticationClient,
+    LatencyRecorder,
+    OpenTelemetryHook,
+    PublicClient,
+    RequestHook,
+)
+from backpack_exchange_sdk._base.errors import BackpackInvalidRequestError  # noqa: E402
+from backpack_exchange_sdk.testing import MockExchange  # noqa: E402
+
+SECRET = ed25519.Ed25519PrivateKey.generate()
+SECRET_B64 = base64.b64encode(SECRET.private_bytes_raw()).decode()
+PUBLIC_B64 = base64.b64encode(SECRET.public_key().public_bytes_raw()).decode()
+
+
+@pytest.fixture(scope="module")
+def exchange():
+    with MockExchange(api_keys=[PUBLIC_B64], rate=0, seed=5) as exchange:
+        yield exchange
+
+
+class CallLog(RequestHook):
+    def __init__(self):
+        self.calls = []
+
+    def before_sign(self, ctx):
+        self.calls.append(("before_sign", ctx.instruction))
+
+    def before_send(self, ctx):
+        self.calls.append(("before_send", "X-Signature" in (ctx.headers or {})))
+
+    def after_response(self, ctx, result):
+        self.calls.append(("after_response", ctx.status_code))
+
+    def on_error(self, ctx, error):
+        self.calls.append(("on_error", type(error).__name__))
+
+
+def test_hooks_called_in_order(exchange):
+    log = CallLog()
+    client = AuthenticationClient(PUBLIC_B64, SECRET_B64, base_url=exchange.url, hooks=[log])
+    client.execute_order("Market", "Bid", "SOL_USDC", quantity="1")
+    with pytest.raises(BackpackInvalidRequestError):
+        client.execute_order("Market", "Bid", "DOGE_USDC", quantity="1")
+    assert log.calls == [
+        ("before_sign", "orderExecute"),
+        ("before_send", True),
+        ("after_response", 200),
+        ("before_sign", "orderExecute"),
+        ("before_send", True),
+        ("on_error", "BackpackInvalidRequestError"),
+    ]
+
+
+def test_latency_recorder_histograms_and_prometheus(exchange):
+    latency = LatencyRecorder()
+    public = PublicClient(base_url=exchange.url, hooks=[latency])
+    for _ in range(3):
+        public.get_depth("SOL_USDC")
+    with pytest.raises(BackpackInvalidRequestError):
+        public.get_depth("DOGE_USDC")
+
+    summary = latency.summary()["api/v1/depth"]
+    assert summary["total"]["count"] == 4
+    assert summary["wire"]["mean"] > 0 and summary["sign"]["mean"] >= 0
+    assert latency.errors[("api/v1/depth", "BackpackInvalidRequestError")] == 1
+
+    text = latency.prometheus()
+    assert "# TYPE backpack_request_duration_seconds histogram" in text
+    assert 'backpack_request_duration_seconds_count{instruction="api/v1/depth",phase="wire"} 4' in text
+    assert 'backpack_request_duration_seconds_bucket{instruction="api/v1/depth",phase="wire",le="+Inf"} 4' in text
+    assert 'backpack_request_errors_total{instruction="api/v1/depth",error="BackpackInvalidRequestError"} 1' in text
+
+
+def test_async_client_reports_phases(exchange):
+    latency = LatencyRecorder()
+
+    async def main():
+        async with AsyncAuthenticationClient(PUBLIC_B64, SECRET_B64, base_url=exchange.url, hooks=[latency]) as client:
+            await client.execute_batch_orders(
+                [{"orderType": "Market", "side": "Bid", "symbol": "SOL_USDC", "quantity": "1"}]
+            )
+            await client.get_balances()
+
+    asyncio.run(main())
+    summary = latency.summary()
+    assert summary["orderExecute"]["sign"]["count"] == 1
+    assert summary["orderExecute"]["wire"]["mean"] > 0
+    assert summary["balanceQuery"]["total"]["count"] == 1
+
+
+class FakeSpan:
+    def __init__(self, name, attributes):
+        self.name, self.attributes = name, dict(attributes)
+        self.exceptions, self.ended = [], False
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def record_exception(self, error):
+        self.exceptions.append(error)
+
+    def set_status(self, status):
+        pass
+
+    def end(self):
+        self.ended = True
+
+
+class FakeTracer:
+    def __init__(self):
+        self.spans = []
+
+    def start_span(self, name, attributes=None):
+        self.spans.append(FakeSpan(name, attributes or {}))
+        return self.spans[-1]
+
+
+def test_opentelemetry_hook_emits_spans(exchange):
+    tracer = FakeTracer()
+    client = AuthenticationClient(
+        PUBLIC_B64, SECRET_B64, base_url=exchange.url, hooks=[OpenTelemetryHook(tracer=tracer)]
+    )
+    client.get_balances()
+    with pytest.raises(BackpackInvalidRequestError):
+        client.execute_order("Market", "Bid", "DOGE_USDC", quantity="1")
+
+    ok, failed = tracer.spans
+    assert ok.name == "backpack balanceQuery" and ok.ended and not ok.exceptions
+    assert ok.attributes["http.response.status_code"] == 200
+    assert ok.attributes["backpack.wire_ms"] > 0
+    assert failed.ended and isinstance(failed.exceptions[0], BackpackInvalidRequestError)
@@ -0,0 +1,104 @@
+import asyncio
+import base64
+import time
+from decimal import Decimal
+
+import pytest
+
+from backpack_exchange_sdk.models import Depth, Fill, OpenOrder, Ticker, Trade
+
+TRADE = {
+    "id": 42,
+    "price": "141.52",
+    "quantity": "0.5",
+    "quoteQuantity": "70.76",
+    "timestamp": 1700000000123,
+    "isBuyerMaker": True,
+}
+
+
+def test_fields_parse_lazily_and_cache():
+    trade = Trade.from_dict(TRADE)
+    assert not hasattr(trade, "__dict__")
+    assert trade._price == "141.52" and trade._parsed == 0
+    assert trade.price == Decimal("141.52")
+    assert trade._price == Decimal("141.52") and trade._parsed
+    assert trade.price is trade.price
+    assert trade.is_buyer_maker is True and trade.timestamp == 1700000000123
+
+
+def test_decode_many_and_conversions():
+    raw = [
+        {
+            "tradeId": 7,
+            "orderId": "11",
+            "symbol": "SOL_USDC",
+            "side": "Bid",
+            "price": "10",
+            "quantity": "2",
+            "fee": "0.01",
+            "feeSymbol": "USDC",
+            "isMaker": False,
+            "timestamp": "2024-01-01T00:00:01.500",
+        },
+        {
+            "tradeId": "8",
+            "orderId": "12",
+            "price": "11",
+            "quantity": "1",
+            "fee": "0",
+            "timestamp": "2024-01-01T00:00:02",
+        },
+    ]
+    fills = Fill.decode_many(raw)
+    assert [f.trade_id for f in fills] == [7, 8]
+    assert fills[0].timestamp == 1704067201500 and fills[1].timestamp == 1704067202000
+    assert fills[1].symbol is None and fills[1].client_id is None
+    assert fills[0].to_dict()["quantity"] == Decimal("2")
+    assert fills[0] == Fill.from_dict(raw[0]) and fills[0] != fills[1]
+
+    depth = Depth.from_dict(
+        {"bids": [["9.9", "3"]], "asks": [["10.1", "4"]], "lastUpdateId": "1055", "timestamp": 1717000000123456}
+    )
+    assert depth.bids == [(Decimal("9.9"), Decimal("3"))] and depth.last_update_id == 1055
+    assert depth.timestamp == 1717000000123
+    assert Ticker.from_dict({"symbol": "SOL_USDC", "lastPrice": "1", "trades": "12"}).trades == 12
+    assert OpenOrder.from_dict({"id": "1", "price": None, "createdAt": 5}).price is None
+
+
+def test_typed_responses_from_mock_exchange():
+    pytest.importorskip("aiohttp")
+    from cryptography.hazmat.primitives.asymmetric import ed25519
+
+    from backpack_exchange_sdk import AsyncPublicClient, AuthenticationClient, PublicClient
+    from backpack_exchange_sdk.testing import MockExchange
+
+    secret = ed25519.Ed25519PrivateKey.generate()
+    secret_b64 = base64.b64encode(secret.private_bytes_raw()).decode()
+    public_b64 = base64.b64encode(secret.public_key().public_bytes_raw()).decode()
+
+    with MockExchange(api_keys=[public_b64], rate=50, seed=11) as exchange:
+        public = PublicClient(base_url=exchange.url)
+        depth = public.get_depth("SOL_USDC", typed=True)
+        assert depth.bids[-1][0] < depth.asks[0][0]
+        assert abs(depth.timestamp - time.time() * 1000) < 5000
+        assert {t.symbol for t in public.get_tickers(typed=True)} == {"SOL_USDC", "BTC_USDC"}
+        deadline = time.time() + 5
+        while not public.get_recent_trades("SOL_USDC"):
+            assert time.time() < deadline
+            time.sleep(0.05)
+        assert isinstance(public.get_recent_trades("SOL_USDC", typed=True)[0].price, Decimal)
+
+        client = AuthenticationClient(public_b64, secret_b64, base_url=exchange.url)
+        order = client.execute_order("Market", "Bid", "SOL_USDC", quantity="2")
+        client.execute_order("Limit", "Bid", "SOL_USDC", quantity="1", price="100")
+        fill = client.get_fill_history(symbol="SOL_USDC", typed=True)[0]
+        assert fill.order_id == order["id"] and fill.quantity == Decimal("2")
+        assert abs(fill.timestamp - order["createdAt"]) < 1000
+        assert [o.price for o in client.get_open_orders(typed=True)] == [Decimal("100")]
+
+        async def fetch():
+            async with AsyncPublicClient(base_url=exchange.url) as client:
+                return await client.get_depth("BTC_USDC", typed=True)
+
+        assert isinstance(asyncio.run(fetch()), Depth)
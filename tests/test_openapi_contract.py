@@ -5,7 +5,7 @@ from typing import Dict, Set, Tuple
 
 
 ROOT = Path(__file__).resolve().parents[1]
-OPENAPI_PATH = ROOT / "openapi.json"
+OPENAPI_PATH = ROOT / "backpack_exchange_sdk" / "testing" / "openapi.json"
 SDK_ROOT = ROOT / "backpack_exchange_sdk"
 
 
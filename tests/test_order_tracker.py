@@ -0,0 +1,96 @@
+from backpack_exchange_sdk import OrderTracker
+
+
+def event(order_id, status, engine_time, client_id=None, symbol="SOL_USDC", filled="0"):
+    data = {
+        "e": "orderAccepted",
+        "i": order_id,
+        "s": symbol,
+        "S": "Bid",
+        "o": "Limit",
+        "p": "100",
+        "q": "2",
+        "z": filled,
+        "X": status,
+        "T": engine_time,
+    }
+    if client_id is not None:
+        data["c"] = client_id
+    return data
+
+
+class OpenOrdersClient:
+    def __init__(self, orders, tracker=None, during=()):
+        self.orders = orders
+        self.tracker = tracker
+        self.during = during
+        self.calls = 0
+
+    def get_open_orders(self, symbol=None):
+        self.calls += 1
+        for e in self.during:
+            self.tracker.apply_update(e)
+        return [o for o in self.orders if symbol is None or o["symbol"] == symbol]
+
+
+class FakeWs:
+    def __init__(self):
+        self.subscriptions = []
+        self.gap_callbacks = []
+
+    def subscribe(self, streams, callback, is_private=False):
+        self.subscriptions.append((streams, is_private))
+
+    def on_gap(self, callback, streams=None):
+        self.gap_callbacks.append((streams, callback))
+
+
+def test_state_transitions_and_indexes():
+    tracker = OrderTracker()
+    tracker.apply_update(event("1", "New", 10, client_id=7))
+    tracker.apply_update(event("2", "New", 11, symbol="BTC_USDC"))
+    assert tracker.by_client_id(7)["id"] == "1"
+    assert [o["id"] for o in tracker.open_orders("SOL_USDC")] == ["1"]
+
+    tracker.apply_update(event("1", "PartiallyFilled", 12, filled="1"))
+    assert tracker.get("1")["executedQuantity"] == "1"
+    assert tracker.get("1")["clientId"] == 7
+
+    tracker.apply_update(event("1", "Filled", 13, filled="2"))
+    assert "1" not in tracker and tracker.by_client_id(7) is None
+    assert tracker.closed_status("1") == "Filled"
+    assert tracker.open_orders("SOL_USDC") == []
+
+    # Late and out-of-order events are dropped.
+    assert tracker.apply_update(event("1", "New", 10)) is None
+    tracker.apply_update(event("2", "PartiallyFilled", 20, symbol="BTC_USDC", filled="1"))
+    assert tracker.apply_update(event("2", "New", 15, symbol="BTC_USDC")) is None
+    assert tracker.get("2")["status"] == "PartiallyFilled"
+
+
+def test_reconcile_replaces_index_and_replays_buffered_events():
+    tracker = OrderTracker()
+    tracker.apply_update(event("stale", "New", 1))
+    snapshot = [
+        {"id": "a", "clientId": 1, "symbol": "SOL_USDC", "status": "New", "executedQuantity": "0"},
+        {"id": "b", "symbol": "SOL_USDC", "status": "New", "executedQuantity": "0"},
+    ]
+    tracker.client = OpenOrdersClient(snapshot, tracker, during=[event("b", "Cancelled", 5), event("c", "New", 6)])
+    ws = FakeWs()
+    tracker.attach(ws)
+    assert ws.subscriptions == [(["account.orderUpdate"], True)]
+    assert sorted(o["id"] for o in tracker.open_orders()) == ["a", "c"]
+    assert tracker.by_client_id(1)["id"] == "a"
+    assert tracker.reconciles == 1
+
+    streams, on_gap = ws.gap_callbacks[0]
+    assert streams == ["account.orderUpdate"]
+    tracker.client.during = ()
+    on_gap("account.orderUpdate")
+    assert tracker.reconciles == 2
+    assert sorted(o["id"] for o in tracker.open_orders()) == ["a", "b"]
+
+
+def test_symbol_tracker_uses_symbol_stream():
+    tracker = OrderTracker(client=OpenOrdersClient([]), symbol="SOL_USDC")
+    assert tracker.stream == "account.orderUpdate.SOL_USDC"
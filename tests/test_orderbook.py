@@ -0,0 +1,143 @@
+import asyncio
+import time
+
+import pytest
+
+from backpack_exchange_sdk import OrderBook
+
+
+class DepthSource:
+    """Returns queued depth snapshots in order."""
+
+    def __init__(self, *snapshots):
+        self.snapshots = list(snapshots)
+        self.calls = 0
+
+    def get_depth(self, symbol):
+        self.calls += 1
+        return self.snapshots.pop(0)
+
+
+def snapshot(last_id, bids, asks):
+    return {"lastUpdateId": str(last_id), "timestamp": 1, "bids": bids, "asks": asks}
+
+
+def event(first_id, last_id, bids=(), asks=()):
+    return {"e": "depth", "s": "SOL_USDC", "U": first_id, "u": last_id, "b": list(bids), "a": list(asks)}
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline
+        time.sleep(0.01)
+
+
+def test_snapshot_and_deltas_keep_best_levels():
+    book = OrderBook("SOL_USDC")
+    book.apply_snapshot(snapshot(10, [["99", "1"], ["100", "2"]], [["102", "3"], ["101", "4"]]))
+    assert book.best_bid() == (100.0, 2.0)
+    assert book.best_ask() == (101.0, 4.0)
+
+    assert book.apply_update(event(11, 12, bids=[["100.5", "5"], ["100", "0"]], asks=[["101", "0"]])) == book.APPLIED
+    assert book.best_bid() == (100.5, 5.0)
+    assert book.best_ask() == (102.0, 3.0)
+    assert book.bids.size_at(100) == 0.0
+    assert book.bids.levels() == [(100.5, 5.0), (99.0, 1.0)]
+    assert book.spread() == 1.5
+    assert book.apply_update(event(5, 12)) == book.STALE
+
+
+def test_updates_before_snapshot_are_buffered_and_replayed():
+    book = OrderBook("SOL_USDC")
+    assert book.apply_update(event(9, 10, bids=[["1", "1"]])) == book.BUFFERED
+    assert book.apply_update(event(11, 11, bids=[["2", "1"]])) == book.BUFFERED
+    assert book.apply_snapshot(snapshot(10, [], [["3", "1"]]))
+    assert book.bids.levels() == [(2.0, 1.0)]
+    assert book.last_update_id == 11
+
+
+def test_gap_triggers_resync_from_client():
+    source = DepthSource(snapshot(20, [["5", "1"]], [["6", "1"]]))
+    book = OrderBook("SOL_USDC", client=source)
+    book.apply_snapshot(snapshot(10, [["4", "1"]], [["7", "1"]]))
+    assert book.apply_update(event(15, 21, bids=[["5", "2"]])) == book.GAP
+    wait_for(lambda: book.synced)
+    assert source.calls == 1
+    assert book.synced and book.last_update_id == 21
+    assert book.best_bid() == (5.0, 2.0)
+    assert book.best_ask() == (6.0, 1.0)
+
+
+def test_failed_resync_is_retried_on_later_updates(monkeypatch):
+    monkeypatch.setattr(OrderBook, "RETRY_DELAY", 0.01)
+    stale = snapshot(12, [["4", "1"]], [["7", "1"]])
+    source = DepthSource(stale, stale, stale, snapshot(30, [["5", "1"]], [["6", "1"]]))
+    book = OrderBook("SOL_USDC", client=source, max_buffer=5)
+    book.apply_snapshot(snapshot(10, [["4", "1"]], [["7", "1"]]))
+    assert book.apply_update(event(20, 21)) == book.GAP
+    wait_for(lambda: source.calls == 3 and not book._resync_running)
+    assert not book.synced
+
+    update_id = 22
+    while not book.synced:
+        assert book.apply_update(event(update_id, update_id)) == book.BUFFERED
+        assert len(book._buffer) <= 5
+        update_id += 1
+        time.sleep(0.005)
+        assert update_id < 500
+    assert source.calls == 4 and book.best_bid() == (5.0, 1.0)
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.callbacks, self.gap_callbacks = {}, []
+
+    def subscribe(self, streams, callback):
+        for stream in streams:
+            self.callbacks[stream] = callback
+
+    def on_gap(self, callback, streams):
+        self.gap_callbacks.append(callback)
+
+
+def test_attach_seeds_and_resyncs_on_gap():
+    with pytest.raises(ValueError):
+        OrderBook("SOL_USDC").attach(FakeWebSocket())
+
+    source = DepthSource(snapshot(10, [["4", "1"]], [["7", "1"]]), snapshot(40, [["5", "1"]], [["6", "1"]]))
+    ws = FakeWebSocket()
+    book = OrderBook("SOL_USDC", client=source).attach(ws)
+    assert book.synced and ws.callbacks["depth.SOL_USDC"] == book.apply_update
+    ws.gap_callbacks[0]("depth.SOL_USDC")
+    wait_for(lambda: book.last_update_id == 40)
+    assert book.snapshots == 2 and book.best_ask() == (6.0, 1.0)
+
+
+def test_follow_retries_stale_snapshots(monkeypatch):
+    monkeypatch.setattr(OrderBook, "RETRY_DELAY", 0)
+
+    class AsyncDepthSource(DepthSource):
+        async def get_depth(self, symbol):
+            return DepthSource.get_depth(self, symbol)
+
+    class AsyncFakeWebSocket:
+        async def subscribe(self, streams):
+            pass
+
+        def on_gap(self, callback, streams):
+            pass
+
+        async def _events(self):
+            for update_id in range(11, 16):
+                yield event(update_id, update_id, bids=[[str(update_id), "1"]])
+
+        def stream(self, name):
+            return self._events()
+
+    # Initial snapshot, then a gap at 11 answered by a stale snapshot and retried on the next update.
+    source = AsyncDepthSource(snapshot(5, [], []), snapshot(8, [], []), snapshot(12, [], [["20", "1"]]))
+    book = OrderBook("SOL_USDC", client=source)
+    asyncio.run(book.follow(AsyncFakeWebSocket()))
+    assert source.calls == 3 and book.last_update_id == 15
+    assert book.best_bid() == (15.0, 1.0)
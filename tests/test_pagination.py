@@ -0,0 +1,99 @@
+import asyncio
+import threading
+
+import pytest
+
+from backpack_exchange_sdk._base.pagination import aiter_pages, iter_pages
+from backpack_exchange_sdk._mixins.history import HistoryMixin
+
+
+def make_fetch(total, calls):
+    def fetch(limit, offset, **filters):
+        calls.append((limit, offset, filters))
+        return [{"i": i, **filters} for i in range(offset, min(offset + limit, total))]
+
+    return fetch
+
+
+def test_iter_pages_streams_until_short_page():
+    calls = []
+    records = list(iter_pages(make_fetch(25, calls), {"symbol": "SOL_USDC"}, page_size=10))
+    assert [r["i"] for r in records] == list(range(25))
+    assert [c[1] for c in calls] == [0, 10, 20]
+    assert all(c[2] == {"symbol": "SOL_USDC"} for c in calls)
+
+
+def test_iter_pages_prefetches_next_page():
+    second_page_requested = threading.Event()
+
+    def fetch(limit, offset):
+        if offset == limit:
+            second_page_requested.set()
+        return list(range(offset, offset + limit)) if offset < 2 * limit else []
+
+    pages = iter_pages(fetch, {}, page_size=5, offset=0)
+    assert next(pages) == 0
+    assert second_page_requested.wait(2)
+    assert list(pages) == list(range(1, 10))
+
+
+def test_iter_pages_without_prefetch_and_exact_multiple():
+    calls = []
+    records = list(iter_pages(make_fetch(20, calls), {}, page_size=10, prefetch=False))
+    assert len(records) == 20
+    assert [c[1] for c in calls] == [0, 10, 20]
+
+
+def test_aiter_pages():
+    calls = []
+
+    async def fetch(limit, offset):
+        calls.append(offset)
+        await asyncio.sleep(0)
+        return list(range(offset, min(offset + limit, 12)))
+
+    async def collect():
+        return [r async for r in aiter_pages(fetch, {}, page_size=5)]
+
+    assert asyncio.run(collect()) == list(range(12))
+    assert calls == [0, 5, 10]
+
+
+def test_history_iterators_forward_filters():
+    class Client(HistoryMixin):
+        def __init__(self):
+            self.calls = []
+
+        def _send_request(self, method, endpoint, action, params=None, extra_headers=None):
+            self.calls.append((action, dict(params)))
+            return [{"n": n} for n in range(params["offset"], min(params["offset"] + params["limit"], 3))]
+
+        def _paginate(self, fetch, filters, page_size, offset=0, prefetch=True):
+            return iter_pages(fetch, filters, page_size, offset, prefetch)
+
+    client = Client()
+    fills = list(client.iter_fill_history(page_size=2, symbol="SOL_USDC"))
+    assert fills == [{"n": 0}, {"n": 1}, {"n": 2}]
+    assert client.calls[0] == ("fillHistoryQueryAll", {"limit": 2, "offset": 0, "symbol": "SOL_USDC"})
+
+
+def test_non_list_pages_raise():
+    def fetch(limit, offset):
+        return {"code": "x"}
+
+    async def afetch(limit, offset):
+        return {"code": "x"}
+
+    async def collect():
+        return [r async for r in aiter_pages(afetch, {}, page_size=5)]
+
+    for prefetch in (True, False):
+        with pytest.raises(TypeError):
+            list(iter_pages(fetch, {}, page_size=5, prefetch=prefetch))
+    with pytest.raises(TypeError):
+        asyncio.run(collect())
+
+
+def test_iter_fill_history_rejects_as_arrays():
+    with pytest.raises(TypeError):
+        HistoryMixin().iter_fill_history(as_arrays=True)
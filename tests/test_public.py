@@ -0,0 +1,72 @@
+import os
+import time
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from backpack_exchange_sdk import OrderBook, PublicClient, WebSocketClient  # noqa: E402
+from backpack_exchange_sdk._base.errors import BackpackInvalidRequestError, BackpackRateLimitError  # noqa: E402
+from backpack_exchange_sdk.testing import MockExchange  # noqa: E402
+from backpack_exchange_sdk.testing.mock_exchange import DEFAULT_SPEC  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def exchange():
+    with MockExchange(rate=50, seed=7) as exchange:
+        yield exchange
+
+
+@pytest.fixture
+def client(exchange):
+    exchange.error_rate = 0.0
+    return PublicClient(base_url=exchange.url)
+
+
+def test_market_data(client):
+    assert client.get_status()["status"] == "Ok"
+    assert abs(int(client.get_system_time()) - time.time() * 1e3) < 5000
+    assert {m["symbol"] for m in client.get_markets()} == {"SOL_USDC", "BTC_USDC"}
+    depth = client.get_depth("SOL_USDC")
+    assert float(depth["bids"][-1][0]) < float(depth["asks"][0][0])
+    assert client.get_ticker("BTC_USDC")["symbol"] == "BTC_USDC"
+    assert len(client.get_recent_trades("SOL_USDC", limit=5)) <= 5
+
+
+def test_spec_is_shipped_with_the_package(tmp_path):
+    assert os.path.exists(DEFAULT_SPEC) and ("GET", "/api/v1/borrowLend/positions") in MockExchange().routes
+    with pytest.raises(FileNotFoundError):
+        MockExchange(spec=str(tmp_path / "openapi.json"))
+
+
+def test_klines_are_stable_across_requests(client):
+    start = (int(time.time()) - 3600) // 300 * 300
+    first = client.get_klines("SOL_USDC", "5m", start, start + 1800)
+    assert len(first) == 6 and first == client.get_klines("SOL_USDC", "5m", start, start + 1800)
+
+
+def test_errors_and_injected_faults(exchange, client):
+    with pytest.raises(BackpackInvalidRequestError):
+        client.get_depth("DOGE_USDC")
+    exchange.fail_next(429)
+    with pytest.raises(BackpackRateLimitError):
+        client.get_markets()
+    exchange.fail_next(503, count=2)
+    retrying = PublicClient(base_url=exchange.url, max_retries=3, backoff_factor=0)
+    assert retrying.get_markets()
+    assert exchange.stats["injected"] >= 3
+
+
+def test_order_book_follows_stream(exchange):
+    ws = WebSocketClient(base_url=exchange.ws_url)
+    try:
+        book = OrderBook("SOL_USDC", client=PublicClient(base_url=exchange.url)).attach(ws)
+        seeded = book.last_update_id
+        deadline = time.time() + 5
+        while (book.last_update_id or 0) < seeded + 5:
+            assert time.time() < deadline
+            time.sleep(0.05)
+        assert book.best_bid()[0] < book.best_ask()[0]
+        assert book.snapshots == 1
+    finally:
+        ws.close()
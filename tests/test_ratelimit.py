@@ -0,0 +1,44 @@
+import asyncio
+import time
+
+from backpack_exchange_sdk import RateLimiter, TokenBucket
+
+
+def test_token_bucket_reserves_on_credit():
+    bucket = TokenBucket(rate=10, capacity=2)
+    now = bucket.updated
+    assert bucket.reserve(1, now) == 0.0
+    assert bucket.reserve(1, now) == 0.0
+    assert abs(bucket.reserve(1, now) - 0.1) < 1e-9
+    assert abs(bucket.reserve(1, now) - 0.2) < 1e-9
+    # Refill is capped at capacity.
+    assert bucket.reserve(2, now + 10) == 0.0
+
+
+def test_limiter_applies_weights_key_and_global_buckets():
+    limiter = RateLimiter(
+        limits={"orderCancel": (100, 2)},
+        weights={"orderCancelAll": 4},
+        global_limit=(1000, 5),
+    )
+    assert limiter.reserve("orderCancel") == 0.0
+    assert limiter.reserve("orderCancel") == 0.0
+    assert limiter.reserve("orderCancel") > 0.0
+    # Unconfigured keys only draw from the global bucket; weights scale the cost.
+    assert limiter.reserve("orderCancelAll") > 0.0
+    assert limiter.global_bucket.tokens < 0
+
+
+def test_acquire_smooths_bursts():
+    limiter = RateLimiter(limits={"api/v1/depth": (200, 1)})
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire("api/v1/depth")
+    assert time.monotonic() - start >= 0.015
+
+    async def burst():
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire_async("api/v1/depth") for _ in range(5)))
+        return time.monotonic() - start
+
+    assert asyncio.run(burst()) >= 0.015
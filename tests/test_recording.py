@@ -0,0 +1,77 @@
+import time
+
+import pytest
+import requests
+
+from backpack_exchange_sdk import PublicClient, Recorder, Replayer
+from backpack_exchange_sdk.recording import REST_RESPONSE, WS_FRAME, read_records
+
+
+def frame(stream, value):
+    return '{"stream": "%s", "data": {"v": %d}}' % (stream, value)
+
+
+@pytest.mark.parametrize("name", ["session.cap", "session.cap.gz"])
+def test_round_trip_and_append(tmp_path, name):
+    path = str(tmp_path / name)
+    with Recorder(path) as recorder:
+        recorder.record_frame(frame("depth.SOL_USDC", 1))
+        recorder.record_response("GET", "https://api/depth", 200, b'{"bids": []}')
+    with Recorder(path) as recorder:
+        recorder.record(WS_FRAME, b"pong", timestamp=5.0)
+
+    records = list(read_records(path))
+    assert [r.kind for r in records] == [WS_FRAME, REST_RESPONSE, WS_FRAME]
+    assert records[1].key == "GET https://api/depth 200" and records[1].payload == b'{"bids": []}'
+    assert records[2].timestamp == 5.0 and records[2].payload == b"pong"
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a capture")
+    with pytest.raises(ValueError):
+        list(read_records(str(path)))
+
+
+def test_replayer_routes_frames_by_stream(tmp_path):
+    path = str(tmp_path / "session.cap")
+    with Recorder(path) as recorder:
+        for i in range(3):
+            recorder.record(WS_FRAME, frame("depth.SOL_USDC", i), timestamp=100 + i)
+            recorder.record(WS_FRAME, frame("trade.SOL_USDC", i), timestamp=100 + i)
+        recorder.record(WS_FRAME, "pong", timestamp=103)
+        recorder.record_response("GET", "https://api/depth", 200, b"{}")
+
+    depth = []
+    replayer = Replayer(path, speed=None)
+    replayer.subscribe(["depth.SOL_USDC"], depth.append)
+    assert replayer.run() == 3
+    assert depth == [{"v": 0}, {"v": 1}, {"v": 2}]
+    assert len(list(replayer.responses())) == 1
+
+
+def test_replayer_keeps_recorded_pace(tmp_path):
+    path = str(tmp_path / "session.cap")
+    with Recorder(path) as recorder:
+        recorder.record(WS_FRAME, frame("depth.SOL_USDC", 0), timestamp=100.0)
+        recorder.record(WS_FRAME, frame("depth.SOL_USDC", 1), timestamp=101.0)
+
+    replayer = Replayer(path, speed=10)
+    replayer.subscribe(["depth.SOL_USDC"], lambda data: None)
+    started = time.monotonic()
+    replayer.run()
+    assert 0.09 <= time.monotonic() - started < 0.5
+
+
+def test_client_records_responses(tmp_path):
+    path = str(tmp_path / "rest.cap")
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b'{"serverTime": 1}'
+    response.url = "https://api.backpack.exchange/api/v1/time"
+    response.request = requests.Request("GET", response.url).prepare()
+    with Recorder(path) as recorder:
+        assert PublicClient(recorder=recorder)._handle_response(response) == {"serverTime": 1}
+    (record,) = read_records(path)
+    assert record.key == "GET https://api.backpack.exchange/api/v1/time 200"
+    assert record.payload == b'{"serverTime": 1}'
@@ -0,0 +1,67 @@
+import base64
+import threading
+
+from cryptography.hazmat.primitives.asymmetric import ed25519
+
+from backpack_exchange_sdk._base.utils import (
+    Signer,
+    build_batch_signing_string,
+    build_signing_string,
+    generate_auth_headers,
+    generate_batch_auth_headers,
+)
+
+KEY = ed25519.Ed25519PrivateKey.generate()
+PARAMS = [
+    None,
+    {},
+    {"symbol": "SOL_USDC"},
+    {"symbol": "SOL_USDC", "side": "Bid", "postOnly": True, "reduceOnly": False, "clientId": 7, "price": "1.5"},
+    {"limit": 100, "offset": 0, "from": 1700000000000, "marketType": "PERP"},
+]
+
+
+def test_signing_bytes_match_build_signing_string():
+    signer = Signer(KEY)
+    for params in PARAMS:
+        for window in (5000, 60000):
+            expected = build_signing_string("orderExecute", params, 1700000000000, window)
+            assert signer.signing_bytes("orderExecute", params, 1700000000000, window).decode() == expected
+
+
+def test_batch_signing_bytes_match_build_batch_signing_string():
+    signer = Signer(KEY)
+    orders = [p for p in PARAMS if p]
+    expected = build_batch_signing_string(orders, 1, 5000)
+    assert signer.batch_signing_bytes(orders, 1, 5000).decode() == expected
+
+
+def test_headers_match_functions():
+    signer = Signer(KEY)
+    params = PARAMS[3]
+    assert signer.headers("pk", "orderExecute", params, 1, 5000) == generate_auth_headers(
+        "pk", KEY, "orderExecute", 1, 5000, params
+    )
+    assert signer.batch_headers("pk", [params], 1, 5000) == generate_batch_auth_headers("pk", KEY, [params], 1, 5000)
+
+
+def test_signatures_verify_across_threads():
+    signer = Signer(KEY)
+    failures = []
+
+    def worker(n):
+        for i in range(200):
+            params = {"symbol": "SOL_USDC", "clientId": n * 1000 + i}
+            signature = base64.b64decode(signer.sign("orderExecute", params, i, 5000))
+            message = build_signing_string("orderExecute", params, i, 5000).encode()
+            try:
+                KEY.public_key().verify(signature, message)
+            except Exception as e:  # pragma: no cover - only reached on failure
+                failures.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not failures
@@ -0,0 +1,99 @@
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from backpack_exchange_sdk import PublicClient
+from backpack_exchange_sdk._base.singleflight import AsyncSingleFlight, SingleFlight, request_key
+
+
+class TickerHandler(BaseHTTPRequestHandler):
+    hits = 0
+
+    def do_GET(self):
+        type(self).hits += 1
+        time.sleep(0.2)
+        payload = b'{"symbol": "SOL_USDC", "lastPrice": "141.5"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_request_key_ignores_param_order():
+    assert request_key("api/v1/ticker", {"symbol": "A", "interval": "1d"}) == request_key(
+        "api/v1/ticker", {"interval": "1d", "symbol": "A"}
+    )
+    assert request_key("api/v1/ticker", {"symbol": "A"}) != request_key("api/v1/ticker", {"symbol": "B"})
+
+
+def test_concurrent_identical_gets_share_one_request():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), TickerHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        client = PublicClient(base_url=f"http://127.0.0.1:{server.server_port}/", coalesce_requests=True)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(client.get_ticker("SOL_USDC"))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        server.shutdown()
+    assert TickerHandler.hits == 1
+    assert len(results) == 8 and all(r is results[0] for r in results)
+    assert client.single_flight.shared == 7
+
+
+def test_single_flight_propagates_errors_to_waiters():
+    group = SingleFlight()
+    started = threading.Event()
+    errors = []
+
+    def fail():
+        started.set()
+        time.sleep(0.1)
+        raise RuntimeError("boom")
+
+    def call():
+        try:
+            group.do("k", fail)
+        except RuntimeError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait()
+    follower = threading.Thread(target=call)
+    follower.start()
+    leader.join()
+    follower.join()
+    assert len(errors) == 2 and errors[0] is errors[1]
+
+
+def test_async_single_flight_survives_caller_cancellation():
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"ok": True}
+
+    async def main():
+        group = AsyncSingleFlight()
+        first = asyncio.ensure_future(group.do("k", fetch))
+        second = asyncio.ensure_future(group.do("k", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second, group.shared
+
+    result, shared = asyncio.run(main())
+    assert result == {"ok": True} and shared == 1 and len(calls) == 1
@@ -0,0 +1,241 @@
+import asyncio
+import base64
+import json
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("websocket")
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+from cryptography.hazmat.primitives.asymmetric import ed25519  # noqa: E402
+
+from backpack_exchange_sdk import AsyncWebSocketClient, ClockSync  # noqa: E402
+from backpack_exchange_sdk._base import codec  # noqa: E402
+from backpack_exchange_sdk.websocket import ShardedWebSocketClient, WebSocketClient  # noqa: E402
+
+
+class StreamServer:
+    """
+    WebSocket server on a background loop that echoes one message per subscribed stream.
+
+    With ``drop_first`` the first connection is closed after its first SUBSCRIBE.
+    """
+
+    def __init__(self, drop_first=False, burst=1):
+        self.drop_first = drop_first
+        self.burst = burst
+        self.connections = 0
+        self.subscriptions = []
+        self.messages = []
+        self.loop = asyncio.new_event_loop()
+        started = threading.Event()
+        threading.Thread(target=self._run, args=(started,), daemon=True).start()
+        started.wait()
+
+    def _run(self, started):
+        asyncio.set_event_loop(self.loop)
+        app = web.Application()
+        app.add_routes([web.get("/", self.handler)])
+        self.runner = web.AppRunner(app)
+        self.loop.run_until_complete(self.runner.setup())
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        self.loop.run_until_complete(site.start())
+        self.url = f"ws://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/"
+        started.set()
+        self.loop.run_forever()
+
+    async def handler(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.connections += 1
+        connection = self.connections
+        async for msg in ws:
+            message = json.loads(msg.data)
+            self.messages.append((connection, message))
+            if message["method"] == "SUBSCRIBE":
+                self.subscriptions.append((id(ws), message["params"]))
+                for i in range(self.burst):
+                    for stream in message["params"]:
+                        data = {"s": stream, "n": i} if self.burst > 1 else {"s": stream}
+                        await ws.send_str(json.dumps({"stream": stream, "data": data}))
+                if self.drop_first and connection == 1:
+                    await ws.close(code=1011)
+        return ws
+
+    def close(self):
+        asyncio.run_coroutine_threadsafe(self.runner.cleanup(), self.loop).result(5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+
+def test_streams_are_spread_and_merged():
+    server = StreamServer()
+    client = ShardedWebSocketClient(shards=3, queue_size=100, base_url=server.url)
+    try:
+        streams = [f"depth.S{i}_USDC" for i in range(12)]
+        seen = []
+        client.subscribe(streams, lambda data: seen.append(data["s"]))
+        merged = sorted(client.get(timeout=5)[0] for _ in streams)
+    finally:
+        client.close()
+        server.close()
+    assert merged == sorted(streams)
+    assert sorted(seen) == sorted(streams)
+    # One SUBSCRIBE per shard, each carrying exactly that shard's streams.
+    assert len(server.subscriptions) == len({client.shard_for(s) for s in streams})
+    for _, params in server.subscriptions:
+        assert len({client.shard_for(s) for s in params}) == 1
+
+
+def test_weighted_assignment_balances_load():
+    server = StreamServer()
+    client = ShardedWebSocketClient(shards=2, weights={"depth": 3, "trade.SOL_USDC": 2}, base_url=server.url)
+    try:
+        for stream in ["depth.A", "depth.B", "trade.SOL_USDC", "trade.X", "bookTicker.Y"]:
+            client.shard_for(stream)
+        assert client.loads == [5.0, 5.0]
+        assert client.shard_for("depth.A") != client.shard_for("depth.B")
+        client.unsubscribe(["depth.A"])
+        assert sorted(client.loads) == [2.0, 5.0]
+    finally:
+        client.close()
+        server.close()
+
+
+def test_merged_queue_counts_every_drop_across_shard_threads():
+    server = StreamServer()
+    client = ShardedWebSocketClient(shards=4, queue_size=1, base_url=server.url)
+    try:
+        threads = [
+            threading.Thread(target=lambda: [client._dispatch("trade.X", n) for n in range(5000)]) for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        client.close()
+        server.close()
+    assert client.dropped + client.queue.qsize() == 20000
+
+
+def test_reconnect_restores_subscriptions_and_reports_gaps():
+    key = ed25519.Ed25519PrivateKey.generate()
+    server = StreamServer(drop_first=True)
+    client = WebSocketClient(
+        base64.b64encode(key.public_key().public_bytes_raw()).decode(),
+        base64.b64encode(key.private_bytes_raw()).decode(),
+        base_url=server.url,
+        reconnect_delay=0.05,
+    )
+    gaps = []
+    try:
+        client.on_gap(gaps.append, ["depth.SOL_USDC", "account.orderUpdate"])
+        received = []
+        client.subscribe(["depth.SOL_USDC"], lambda data: received.append(data["s"]))
+        deadline = time.time() + 5
+        while (len(gaps) < 1 or len(received) < 2) and time.time() < deadline:
+            time.sleep(0.01)
+        client.subscribe(["account.orderUpdate"], lambda data: None, is_private=True)
+        while len(server.messages) < 3 and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        client.close()
+        server.close()
+    assert gaps == ["depth.SOL_USDC"]
+    assert client.gaps == {"depth.SOL_USDC": 1}
+    assert received == ["depth.SOL_USDC", "depth.SOL_USDC"]
+    assert [(c, m["params"]) for c, m in server.messages] == [
+        (1, ["depth.SOL_USDC"]),
+        (2, ["depth.SOL_USDC"]),
+        (2, ["account.orderUpdate"]),
+    ]
+    assert len(server.messages[-1][1]["signature"]) == 4
+
+
+def test_private_subscriptions_are_stamped_with_the_clock():
+    key = ed25519.Ed25519PrivateKey.generate()
+    credentials = (
+        base64.b64encode(key.public_key().public_bytes_raw()).decode(),
+        base64.b64encode(key.private_bytes_raw()).decode(),
+    )
+    clock = ClockSync(client=object())
+    clock.offset = 30.0
+    server = StreamServer()
+    client = WebSocketClient(*credentials, base_url=server.url, clock=clock)
+    try:
+        message = json.loads(client._subscribe_message(["account.orderUpdate"], is_private=True))
+    finally:
+        client.close()
+        server.close()
+    assert abs(int(message["signature"][2]) - (time.time() + 30.0) * 1e3) < 1000
+    stamp = AsyncWebSocketClient(*credentials, clock=clock)._signature()[2]
+    assert abs(int(stamp) - (time.time() + 30.0) * 1e3) < 1000
+
+
+def test_close_interrupts_the_reconnect_wait():
+    server = StreamServer(drop_first=True)
+    client = WebSocketClient(base_url=server.url, reconnect_delay=30.0, max_reconnect_delay=30.0)
+    try:
+        client.subscribe(["depth.SOL_USDC"], lambda data: None)
+        deadline = time.time() + 5
+        while client.connected.is_set() and time.time() < deadline:
+            time.sleep(0.01)
+        assert not client.connected.is_set()
+        client.close()
+        client._thread.join(2)
+        assert not client._thread.is_alive()
+    finally:
+        client.close()
+        server.close()
+
+
+def test_async_gap_callback_errors_are_reported(capsys):
+    def failing(stream):
+        raise RuntimeError("sync boom")
+
+    async def failing_async(stream):
+        raise RuntimeError("async boom")
+
+    async def main():
+        client = AsyncWebSocketClient()
+        client.on_gap(failing)
+        client.on_gap(failing_async)
+        client._emit_gaps(["depth.SOL_USDC"])
+        await asyncio.sleep(0.01)
+
+    asyncio.run(main())
+    out = capsys.readouterr().out
+    assert "Error handling gap on depth.SOL_USDC: sync boom" in out
+    assert "Error handling gap on depth.SOL_USDC: async boom" in out
+
+
+def test_conflated_stream_keeps_latest_and_decodes_on_read(monkeypatch):
+    server = StreamServer(burst=200)
+    client = WebSocketClient(base_url=server.url)
+    decoded = []
+    loads = codec.loads
+    monkeypatch.setattr(codec, "loads", lambda raw: decoded.append(raw) or loads(raw))
+    try:
+        client.subscribe(["bookTicker.SOL_USDC"], conflate=True)
+        assert wait_latest(client, "bookTicker.SOL_USDC", 199)
+        with pytest.raises(ValueError):
+            client.subscribe(["bookTicker.BTC_USDC"], lambda data: None, conflate=True)
+    finally:
+        client.close()
+        server.close()
+    assert client.conflated > 0
+    assert len(decoded) < 200
+    assert client.latest("bookTicker.SOL_USDC") == {"s": "bookTicker.SOL_USDC", "n": 199}
+    assert client.latest("bookTicker.ETH_USDC", "none") == "none"
+
+
+def wait_latest(client, stream, n, timeout=5):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        value = client.latest(stream)
+        if value is not None and value["n"] == n:
+            return True
+        time.sleep(0.01)
+    return False